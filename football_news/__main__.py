@@ -1,8 +1,11 @@
 # football_news/__main__.py
 import asyncio
+import signal
 import typer
-from football_news.fetchers.rss_fetcher import run_once
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from football_news.orchestrator import run_once, shutdown
+from football_news.scheduler import AdaptiveScheduler, build_jobs
+from football_news.storage.archive import ARCHIVE_AFTER_DAYS, archive, cutoff
+from football_news.storage.db import checkpoint_forever
 from football_news.utils.logger import logger
 
 app = typer.Typer()
@@ -12,28 +15,64 @@ app = typer.Typer()
 def fetch():
     """Run single fetch cycle."""
     logger.info("Manual fetch command initiated")
-    asyncio.run(run_once())
+
+    async def _run():
+        try:
+            reports = await run_once()
+        finally:
+            await shutdown()
+        for r in reports:
+            status = r.error or "ok"
+            typer.echo(
+                f"{r.source:<24} {r.kind:<5} {r.latency * 1000:7.0f} ms "
+                f"{r.bytes:>9} B {r.parsed:>4} parsed {r.skipped:>4} known "
+                f"{r.inserted:>4} new  {status}"
+            )
+        typer.echo(f"Stories processed: {sum(r.inserted for r in reports)}")
+
+    asyncio.run(_run())
 
 
 @app.command()
 def daemon():
-    """Run scheduler that triggers fetcher on interval."""
-    logger.info("Starting daemon mode with 5-minute intervals")
-
-    scheduler = AsyncIOScheduler()
-    scheduler.add_job(lambda: asyncio.create_task(run_once()), "interval", minutes=5)
-    scheduler.start()
+    """Run adaptive scheduler – each source on its own TTL-based interval."""
+    logger.info("Starting daemon mode with per-source adaptive intervals")
 
-    typer.echo("Scheduler started (Ctrl-C to exit)")
-    logger.info("Scheduler started successfully")
+    async def _run():
+        scheduler = AdaptiveScheduler(build_jobs())
+        # docker stop: exit through the finally below so leases are returned
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, lambda: asyncio.ensure_future(scheduler.stop())
+        )
+        checkpoints = asyncio.create_task(checkpoint_forever())
+        typer.echo("Scheduler started (Ctrl-C to exit)")
+        logger.info("Scheduler started successfully")
+        try:
+            await scheduler.run_forever()
+        finally:
+            checkpoints.cancel()
+            await scheduler.stop()
+            await shutdown()
 
     try:
-        asyncio.get_event_loop().run_forever()
+        asyncio.run(_run())
     except (KeyboardInterrupt, SystemExit):
         logger.info("Daemon shutdown requested")
     except Exception as e:
         logger.error(f"Unexpected error in daemon mode: {e}")
 
 
+@app.command("archive")
+def archive_old(
+    days: int = typer.Option(ARCHIVE_AFTER_DAYS, help="Hot window in days"),
+    vacuum: bool = typer.Option(True, help="VACUUM the database afterwards"),
+):
+    """Move stories older than the hot window into the Parquet archive."""
+    moved = archive(cutoff(days), vacuum=vacuum)
+    for month, count in sorted(moved.items()):
+        typer.echo(f"{month}  {count:>7} stories archived")
+    typer.echo(f"Stories archived: {sum(moved.values())}")
+
+
 if __name__ == "__main__":
     app()
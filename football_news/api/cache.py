@@ -0,0 +1,269 @@
+"""
+Response cache for the read endpoints, invalidated by the data version.
+
+An ASGI middleware in front of ``CACHED_PATHS``. The key is the data
+version (``storage/versions.py``) plus the path and the sorted query
+parameters, so a commit by any writer makes every older entry unreachable
+and nothing has to be purged. The version is re-read at most every
+``API_CACHE_VERSION_TTL`` seconds, which is also how stale a response can be.
+
+Entries keep the JSON body with precompressed gzip and (if the ``brotli``
+package is installed) brotli variants, and a strong ETag, so a repeat hit
+costs no query, no serialization and no compression. ``If-None-Match``
+answers 304. The in-process LRU is bounded by bytes; with
+``API_CACHE_SHARED=1`` identity bodies are also shared between API
+replicas through Redis.
+
+API_CACHE_BYTES        in-process budget, 0 disables   (default: 64 MiB)
+API_CACHE_VERSION_TTL  seconds between version reads   (default: 1)
+API_CACHE_SHARED       1 = also use Redis at REDIS_URL   (default: 0)
+API_CACHE_TTL          expiry of shared entries, seconds   (default: 300)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from football_news.storage.db import ReadSessionLocal
+from football_news.storage.versions import current
+from football_news.utils.logger import logger
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+MAX_BYTES = int(os.getenv("API_CACHE_BYTES", str(64 * 1024 * 1024)))
+VERSION_TTL = float(os.getenv("API_CACHE_VERSION_TTL", "1"))
+SHARED = os.getenv("API_CACHE_SHARED", "0") == "1"
+SHARED_TTL = int(os.getenv("API_CACHE_TTL", "300"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost")
+
+CACHED_PATHS = ("/v1/news", "/v1/top", "/v1/archive")
+MIN_COMPRESS = 512  # bytes; smaller bodies are sent as they are
+# response headers that belong to the representation and are replayed
+KEPT_HEADERS = {b"content-type", b"x-next-cursor"}
+
+
+@dataclass
+class Entry:
+    body: bytes
+    headers: list[tuple[bytes, bytes]]
+    etag: str = ""
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:20] + '"'
+        if len(self.body) >= MIN_COMPRESS:
+            self.encoded["gzip"] = gzip.compress(self.body, 6, mtime=0)
+            if brotli is not None:
+                self.encoded["br"] = brotli.compress(self.body, quality=5)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(b) for b in self.encoded.values())
+
+    def dumps(self) -> bytes:
+        headers = [[k.decode(), v.decode()] for k, v in self.headers]
+        return json.dumps(headers).encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> Entry:
+        headers, body = data.split(b"\n", 1)
+        return cls(body, [(k.encode(), v.encode()) for k, v in json.loads(headers)])
+
+
+def cache_key(version: int, path: str, query: bytes) -> str:
+    """Repeated and reordered parameters normalize to the same key."""
+    params = sorted(parse_qsl(query.decode("latin-1"), keep_blank_values=True))
+    return f"{version}:{path}?{urlencode(params)}"
+
+
+def pick_encoding(accept: str, available) -> str | None:
+    """Best of ``available`` for an Accept-Encoding header (br over gzip)."""
+    offered = {}
+    for part in accept.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    for name in ("br", "gzip"):
+        if name in available and offered.get(name, offered.get("*", 0)) > 0:
+            return name
+    return None
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    base = etag.strip('"')
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag.split("-", 1)[0] == base:  # any encoding of the same body
+            return True
+    return False
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int = MAX_BYTES, shared: bool = SHARED):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+        self._bytes = 0
+        self._redis: aioredis.Redis | None = None
+        self._version = 0
+        self._version_at = float("-inf")
+        self.hits = self.misses = 0
+
+    async def version(self) -> int:
+        if time.monotonic() - self._version_at >= VERSION_TTL:
+            async with ReadSessionLocal() as s:
+                self._version = await current(s)
+            self._version_at = time.monotonic()
+        return self._version
+
+    async def get(self, key: str) -> Entry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.shared:
+            try:
+                data = await self._client().get(f"apicache:{key}")
+            except RedisError as e:
+                logger.warning(f"Shared API cache unavailable: {e}")
+                data = None
+            if data is not None:
+                self.hits += 1
+                entry = Entry.loads(data)
+                self._store(key, entry)
+                return entry
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, body: bytes, headers) -> Entry:
+        kept = [(k, v) for k, v in headers if k.lower() in KEPT_HEADERS]
+        entry = Entry(body, kept)
+        self._store(key, entry)
+        if self.shared:
+            try:
+                await self._client().set(
+                    f"apicache:{key}", entry.dumps(), ex=SHARED_TTL
+                )
+            except RedisError as e:
+                logger.warning(f"Shared API cache unavailable: {e}")
+        return entry
+
+    def _store(self, key: str, entry: Entry):
+        if entry.size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def _client(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.Redis.from_url(REDIS_URL, socket_timeout=1)
+        return self._redis
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+        self._version_at = float("-inf")
+        self.hits = self.misses = 0
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+response_cache = ResponseCache()
+
+
+class CacheMiddleware:
+    """Serve ``CACHED_PATHS`` GETs from ``response_cache``."""
+
+    def __init__(self, app, cache: ResponseCache | None = None):
+        self.app = app
+        self.cache = cache or response_cache
+
+    @staticmethod
+    def _cacheable(scope) -> bool:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            return False
+        path = scope["path"]
+        return any(path == p or path.startswith(p + "/") for p in CACHED_PATHS)
+
+    async def __call__(self, scope, receive, send):
+        if self.cache.max_bytes <= 0 or not self._cacheable(scope):
+            return await self.app(scope, receive, send)
+
+        key = cache_key(
+            await self.cache.version(), scope["path"], scope["query_string"]
+        )
+        entry = await self.cache.get(key)
+        if entry is None:
+            start, chunks = {}, []
+
+            async def capture(message):
+                if message["type"] == "http.response.start":
+                    start.update(message)
+                else:
+                    chunks.append(message.get("body", b""))
+
+            await self.app(dict(scope, method="GET"), receive, capture)
+            if start.get("status") != 200:
+                # errors are neither cached nor rewritten
+                await send(start)
+                await send({"type": "http.response.body", "body": b"".join(chunks)})
+                return
+            entry = await self.cache.put(key, b"".join(chunks), start["headers"])
+        await self._respond(scope, send, entry)
+
+    async def _respond(self, scope, send, entry: Entry):
+        request = {k.lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        body, etag, headers = entry.body, entry.etag, list(entry.headers)
+        encoding = pick_encoding(request.get(b"accept-encoding", ""), entry.encoded)
+        if encoding is not None:
+            body = entry.encoded[encoding]
+            etag = f'{etag[:-1]}-{encoding}"'  # strong: one tag per byte sequence
+            headers.append((b"content-encoding", encoding.encode()))
+        headers += [
+            (b"etag", etag.encode()),
+            (b"vary", b"Accept-Encoding"),
+            (b"cache-control", b"no-cache"),  # always revalidate, cheaply
+        ]
+
+        if etag_matches(request.get(b"if-none-match", ""), entry.etag):
+            status, body = 304, b""
+            headers = [h for h in headers if h[0] != b"content-encoding"]
+        else:
+            status = 200
+            headers.append((b"content-length", str(len(body)).encode()))
+        if scope["method"] == "HEAD":
+            body = b""
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
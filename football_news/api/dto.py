@@ -0,0 +1,37 @@
+"""
+What the API returns of a story, shared by every endpoint.
+
+Database rows and archived rows both go through ``story_dto()``, so
+``published`` is always emitted as aware UTC (``…+00:00``) whichever tier a
+story came from.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from football_news.storage.models import Story
+from football_news.storage.timestamps import utc
+
+# selected as plain columns, never ``raw``
+FIELDS = (
+    Story.id,
+    Story.title,
+    Story.link,
+    Story.source,
+    Story.published,
+    Story.summary,
+    Story.tags,
+)
+NAMES = tuple(c.key for c in FIELDS)
+
+
+def story_dto(row, names: tuple[str, ...] = NAMES) -> dict:
+    """A result row (or an archived row's mapping) as an API dict."""
+    if isinstance(row, Mapping):
+        dto = dict(row)
+    else:
+        dto = dict(zip(names, row))  # extra trailing columns are dropped
+    if "published" in dto:
+        dto["published"] = utc(dto["published"])
+    return dto
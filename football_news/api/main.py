@@ -1,80 +1,226 @@
 from __future__ import annotations
-from typing import Annotated
 
-from fastapi import FastAPI, Query, HTTPException, Depends
-from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+import asyncio
+import datetime as dt
+from typing import Annotated, Literal
 
-from football_news.storage.db import SessionLocal
+from fastapi import FastAPI, Query, HTTPException, Depends, Request, WebSocket
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_news.api import export, stream
+from football_news.api.cache import CacheMiddleware, pick_encoding
+from football_news.api.dto import FIELDS, NAMES, story_dto
+from football_news.broadcast import StreamFilter
+from football_news.storage import archive
+from football_news.storage.db import ReadSessionLocal
 from football_news.storage.models import Story
+from football_news.storage.paging import Cursor, after, decode_cursor, encode_cursor
+from football_news.storage.search import search
+from football_news.storage.tags import tag_ids, tagged_stories
+from football_news.storage.timestamps import utc
+
+app = FastAPI(
+    title="Football News API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
-app = FastAPI(title="Football News API", version="1.0.0")
-
+app.add_middleware(CacheMiddleware)  # inside CORS, so hits get its headers too
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_methods=["GET"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 
 # -- DB dependency ------------------------------------------------------------
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with ReadSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # -----------------------------------------------------------------------------
 
 
-def _dto(obj: Story) -> dict:
-    return {
-        "id": obj.id,
-        "title": obj.title,
-        "link": obj.link,
-        "source": obj.source,
-        "published": obj.published.isoformat(),
-        "summary": obj.summary,
-        "tags": obj.tags,
-    }
+def _cursor(token: str | None) -> Cursor | None:
+    if token is None:
+        return None
+    try:
+        return decode_cursor(token)
+    except ValueError:
+        raise HTTPException(400, detail="invalid cursor")
+
+
+def _dto(row, snippet: str | None = None) -> dict:
+    dto = story_dto(row)
+    if snippet is not None:
+        dto["snippet"] = snippet
+    return dto
+
+
+def _filters(tag, match, source, since, until) -> list:
+    filters = []
+    if tag:
+        filters.append(Story.id.in_(tag_ids(tag, match)))
+    if source:
+        filters.append(Story.source.in_(source))
+    if since is not None:
+        filters.append(Story.published >= since)
+    if until is not None:
+        filters.append(Story.published < until)
+    return filters
+
+
+def _page(dtos: list[dict], limit: int) -> ORJSONResponse:
+    """Serialize with orjson directly, skipping FastAPI's jsonable_encoder."""
+    headers = {}
+    # a full page may have more behind it; the client passes this back as ?cursor=
+    if dtos and len(dtos) == limit:
+        last = dtos[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last["published"], last["id"])
+    return ORJSONResponse(dtos, headers=headers)
 
 
 @app.get("/v1/news")
-def list_news(
+async def list_news(
     limit: Annotated[int, Query(le=200)] = 50,
-    tag: str | None = None,
+    tag: Annotated[list[str] | None, Query()] = None,
+    match: Literal["any", "all"] = "any",
+    source: Annotated[list[str] | None, Query()] = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
     q: str | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
 ):
-    qry = db.query(Story).order_by(Story.published.desc()).limit(limit)
-    if tag:
-        qry = qry.filter(Story.tags.contains([tag]))
+    since, until = utc(since), utc(until)
+    position = _cursor(cursor)
+    if q and position is not None:
+        raise HTTPException(400, detail="search results are ranked, not paged")
+    if tag and not q:
+        qry = tagged_stories(tag, match, source, since, until, limit, position, FIELDS)
+        return _page([_dto(r) for r in await db.execute(qry)], limit)
+
+    filters = _filters(tag, match, source, since, until)
     if q:
-        qry = qry.filter(Story.title.ilike(f"%{q}%"))
-    return [_dto(r) for r in qry.all()]
+        hits = await search(db, q, limit, filters, columns=FIELDS)
+        return ORJSONResponse([_dto(r, snip) for r, snip in hits])
+
+    if position is not None:
+        filters.append(after(Story.published, Story.id, position))
+    qry = (
+        select(*FIELDS)
+        .where(*filters)
+        .order_by(Story.published.desc(), Story.id)
+        .limit(limit)
+    )
+    return _page([_dto(r) for r in await db.execute(qry)], limit)
 
 
 @app.get("/v1/news/{story_id}")
-def single_story(story_id: str, db: Session = Depends(get_db)):
-    row = db.get(Story, story_id)
+async def single_story(story_id: str, db: AsyncSession = Depends(get_db)):
+    row = (await db.execute(select(*FIELDS).where(Story.id == story_id))).first()
     if not row:
         raise HTTPException(404, detail="not found")
-    return _dto(row)
+    return ORJSONResponse(_dto(row))
 
 
 @app.get("/v1/top")
-def top_for_club(
+async def top_for_club(
     club: Annotated[str, Query(examples={"club": "arsenal"})],
     limit: Annotated[int, Query(le=100)] = 25,
-    db: Session = Depends(get_db),
+    source: Annotated[list[str] | None, Query()] = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
 ):
+    qry = tagged_stories(
+        [club], "any", source, utc(since), utc(until), limit, _cursor(cursor), FIELDS
+    )
+    return _page([_dto(r) for r in await db.execute(qry)], limit)
+
+
+@app.get("/v1/archive")
+async def archived_news(
+    limit: Annotated[int, Query(le=200)] = 50,
+    tag: Annotated[list[str] | None, Query()] = None,
+    match: Literal["any", "all"] = "any",
+    source: Annotated[list[str] | None, Query()] = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+    cursor: str | None = None,
+):
+    """Stories moved out of the database by the archive job (same filters)."""
+    position = _cursor(cursor)
+    try:
+        rows = await asyncio.to_thread(
+            archive.read, utc(since), utc(until), source, tag, match, limit, position
+        )
+    except RuntimeError as e:  # pyarrow not installed
+        raise HTTPException(503, detail=str(e))
+    return _page([story_dto(r) for r in rows], limit)
+
+
+@app.get("/v1/export")
+async def export_news(
+    request: Request,
+    fmt: Annotated[Literal["ndjson", "csv"], Query(alias="format")] = "ndjson",
+    tag: Annotated[list[str] | None, Query()] = None,
+    match: Literal["any", "all"] = "any",
+    source: Annotated[list[str] | None, Query()] = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+    archived: bool = False,
+):
+    """Every matching story in one stream, newest first (no limit)."""
+    since, until = utc(since), utc(until)
     qry = (
-        db.query(Story)
-        .filter(Story.tags.contains([club]))
-        .order_by(Story.published.desc())
-        .limit(limit)
+        select(*FIELDS)
+        .where(*_filters(tag, match, source, since, until))
+        .order_by(Story.published.desc(), Story.id)
     )
-    return [_dto(r) for r in qry.all()]
+    chunks = export.db_chunks(qry, NAMES)
+    if archived:
+        if archive.pa is None:
+            raise HTTPException(503, detail="the story archive needs pyarrow")
+        rows = archive.scan(since, until, source, tag, match, columns=list(NAMES))
+        chunks = export.chain(chunks, export.iter_chunks(rows))
+    body = export.encode(chunks, fmt, NAMES)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="stories.{fmt}"',
+        "Vary": "Accept-Encoding",
+    }
+    if pick_encoding(request.headers.get("accept-encoding", ""), {"gzip"}):
+        body = export.gzipped(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=export.MEDIA_TYPES[fmt], headers=headers)
+
+
+@app.get("/v1/stream")
+async def stream_news(
+    tag: Annotated[list[str] | None, Query()] = None,
+    source: Annotated[list[str] | None, Query()] = None,
+):
+    """New and enriched stories as Server-Sent Events, as they are committed."""
+    return StreamingResponse(
+        stream.sse(StreamFilter.of(tag, source)),
+        media_type="text/event-stream",
+        headers=stream.SSE_HEADERS,
+    )
+
+
+@app.websocket("/v1/stream/ws")
+async def stream_news_ws(
+    websocket: WebSocket,
+    tag: Annotated[list[str] | None, Query()] = None,
+    source: Annotated[list[str] | None, Query()] = None,
+):
+    """``/v1/stream`` over a WebSocket – one JSON message per event."""
+    await stream.websocket(websocket, StreamFilter.of(tag, source))
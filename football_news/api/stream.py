@@ -0,0 +1,79 @@
+"""
+Live story push for ``/v1/stream`` (Server-Sent Events) and
+``/v1/stream/ws`` (WebSocket).
+
+Each connection subscribes to the broadcast hub (``broadcast.py``) with its
+tag / source filter and gets ``new`` and ``enriched`` events as they are
+committed, so clients no longer poll ``/v1/news``. Tags are only known once
+a story is enriched, so a tag filter sees ``enriched`` events only. A
+connection that cannot keep up is evicted: SSE sends an ``evicted`` event
+and ends, the WebSocket closes with code 1013 (try again later). Idle
+connections get a heartbeat every ``STREAM_HEARTBEAT`` seconds so proxies
+keep them open and dead clients are noticed.
+
+STREAM_HEARTBEAT  seconds between keep-alives   (default: 15)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import AsyncIterator
+
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+
+from football_news.broadcast import Hub, StreamFilter, hub as default_hub
+
+HEARTBEAT = float(os.getenv("STREAM_HEARTBEAT", "15"))
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(event: dict) -> bytes:
+    story = event["story"]
+    data = orjson.dumps(story)
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (
+        story["id"].encode(),
+        event["event"].encode(),
+        data,
+    )
+
+
+async def sse(flt: StreamFilter, hub: Hub | None = None) -> AsyncIterator[bytes]:
+    # subscribed in here so a disconnect before the first byte still cleans up
+    sub = (hub or default_hub).subscribe(flt)
+    try:
+        yield b"retry: 5000\n: connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(sub.get(), HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+            if event is None:
+                yield b"event: evicted\ndata: {}\n\n"
+                return
+            yield sse_event(event)
+    finally:
+        sub.close()
+
+
+async def websocket(ws: WebSocket, flt: StreamFilter, hub: Hub | None = None):
+    await ws.accept()
+    sub = (hub or default_hub).subscribe(flt)
+    try:
+        await ws.send_json({"event": "ready"})
+        while True:
+            try:
+                event = await asyncio.wait_for(sub.get(), HEARTBEAT)
+            except asyncio.TimeoutError:
+                await ws.send_json({"event": "ping"})
+                continue
+            if event is None:
+                await ws.close(code=1013, reason="slow consumer")
+                return
+            await ws.send_text(orjson.dumps(event).decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sub.close()
@@ -0,0 +1,241 @@
+"""
+Fan-out of story events to live API clients (``/v1/stream``).
+
+The ingest writer publishes ``new`` for the rows it inserted and the
+enrichment worker ``enriched`` once summary and tags are set. Every
+subscriber has its own bounded queue (``STREAM_BUFFER``) and a filter on
+tags / sources; a client that falls that far behind is evicted instead of
+holding up the others or growing memory – it reconnects and catches up
+through ``/v1/news``.
+
+Fetchers, worker and API normally run as separate processes, so events are
+also relayed over Redis pub/sub (``STREAM_BRIDGE=redis``): an API process
+listens on the channel while it has subscribers. ``none`` keeps events
+in-process. If Redis is unreachable publishing pauses and the listener
+reconnects; local delivery is unaffected. A malformed message is logged and
+skipped, and a listener that dies anyway is restarted while it has
+subscribers.
+
+STREAM_BUFFER  events queued per client before it is evicted   (default: 256)
+STREAM_BRIDGE  redis | none   (default: redis)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Iterable
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from football_news.storage.timestamps import utc
+from football_news.utils.logger import logger
+
+BUFFER = int(os.getenv("STREAM_BUFFER", "256"))
+BRIDGE = os.getenv("STREAM_BRIDGE", "redis")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost")
+CHANNEL = "football-news:stories"
+RETRY_AFTER = 30  # seconds without relaying after a Redis error
+RECONNECT_AFTER = 1  # seconds before the listener resubscribes after an error
+POLL = 1.0  # seconds per pub/sub read, below the client's socket timeout
+
+FIELDS = ("id", "title", "link", "source", "published", "summary", "tags")
+
+
+def _dto(story: dict) -> dict:
+    dto = {f: story.get(f) for f in FIELDS}
+    if isinstance(dto["published"], dt.datetime):
+        dto["published"] = utc(dto["published"]).isoformat()
+    return dto
+
+
+@dataclass(frozen=True)
+class StreamFilter:
+    tags: frozenset[str] = frozenset()
+    sources: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(cls, tags: Iterable[str] | None, sources: Iterable[str] | None):
+        return cls(frozenset(tags or ()), frozenset(sources or ()))
+
+    def matches(self, story: dict) -> bool:
+        if self.sources and story.get("source") not in self.sources:
+            return False
+        return not self.tags or bool(self.tags.intersection(story.get("tags") or ()))
+
+
+class Subscription:
+    def __init__(self, hub: Hub, flt: StreamFilter, size: int):
+        self.hub = hub
+        self.filter = flt
+        self.queue: asyncio.Queue[dict | None] = asyncio.Queue(size)
+        self.loop = asyncio.get_running_loop()
+        self.evicted = False
+
+    def offer(self, event: dict):
+        """Queue ``event``; runs on the subscriber's loop."""
+        if self.evicted:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.evicted = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)  # tells the consumer it is gone
+            self.hub.evictions += 1
+            self.close()
+            logger.info("Evicted a slow stream consumer")
+
+    async def get(self) -> dict | None:
+        """The next event, or ``None`` once evicted."""
+        return await self.queue.get()
+
+    def close(self):
+        self.hub.unsubscribe(self)
+
+
+class Hub:
+    def __init__(
+        self,
+        buffer: int = BUFFER,
+        bridge: bool = BRIDGE == "redis",
+        client: aioredis.Redis | None = None,
+    ):
+        self.buffer = buffer
+        self.bridge = bridge
+        self.origin = uuid.uuid4().hex  # to skip our own relayed events
+        self.evictions = 0
+        self._subs: set[Subscription] = set()
+        self._redis: aioredis.Redis | None = client
+        self._injected = client is not None
+        self._redis_loop: asyncio.AbstractEventLoop | None = None
+        self._listener: asyncio.Task | None = None
+        self._restart: asyncio.TimerHandle | None = None
+        self._down_until = 0.0
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subs)
+
+    def subscribe(self, flt: StreamFilter = StreamFilter()) -> Subscription:
+        sub = Subscription(self, flt, self.buffer)
+        self._subs.add(sub)
+        self._ensure_listener()
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        self._subs.discard(sub)
+        if not self._subs and self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    def _ensure_listener(self):
+        if not self.bridge or not self._subs:
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(), name="stream-bridge")
+            self._listener.add_done_callback(self._listener_done)
+
+    def _listener_done(self, task: asyncio.Task):
+        if task.cancelled() or task is not self._listener:
+            return
+        logger.error(f"Story stream listener died ({task.exception()!r}), restarting")
+        self._restart = asyncio.get_running_loop().call_later(
+            RECONNECT_AFTER, self._ensure_listener
+        )
+
+    def dispatch(self, kind: str, stories: list[dict]):
+        """Hand events to matching local subscribers; safe from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for story in stories:
+            event = {"event": kind, "story": story}
+            for sub in list(self._subs):
+                if not sub.filter.matches(story):
+                    continue
+                if sub.loop is running:
+                    sub.offer(event)
+                else:
+                    sub.loop.call_soon_threadsafe(sub.offer, event)
+
+    async def publish(self, kind: str, stories: Iterable[dict]):
+        """Send ``new`` / ``enriched`` events for ``stories`` (row dicts)."""
+        stories = [_dto(s) for s in stories]
+        if not stories:
+            return
+        self.dispatch(kind, stories)
+        if not self.bridge or time.monotonic() < self._down_until:
+            return
+        message = dict(origin=self.origin, event=kind, stories=stories)
+        try:
+            await self._client().publish(CHANNEL, orjson.dumps(message))
+        except (RedisError, OSError) as e:
+            self._down_until = time.monotonic() + RETRY_AFTER
+            logger.warning(f"Story stream relay unavailable: {e}")
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self._client().pubsub(
+                    ignore_subscribe_messages=True
+                ) as pubsub:
+                    await pubsub.subscribe(CHANNEL)
+                    while True:
+                        # polled so an idle channel is never a read timeout
+                        message = await pubsub.get_message(timeout=POLL)
+                        if message is None:
+                            continue
+                        try:
+                            self._relayed(message["data"])
+                        except (ValueError, KeyError, TypeError) as e:
+                            logger.warning(f"Skipped a malformed stream message: {e!r}")
+            except RedisTimeoutError:
+                continue  # resubscribe straight away, pub/sub does not buffer
+            except (RedisError, OSError) as e:
+                logger.warning(f"Story stream relay lost ({e}), reconnecting")
+                await asyncio.sleep(RECONNECT_AFTER)
+
+    def _relayed(self, data: bytes):
+        message = orjson.loads(data)
+        if message["origin"] != self.origin:
+            self.dispatch(message["event"], message["stories"])
+
+    def _client(self) -> aioredis.Redis:
+        if self._injected:
+            return self._redis
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            self._redis = aioredis.Redis.from_url(REDIS_URL, socket_timeout=5)
+            self._redis_loop = loop  # connections belong to one loop
+        return self._redis
+
+    async def close(self):
+        if self._restart is not None:
+            self._restart.cancel()
+            self._restart = None
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.wait([self._listener])  # a crash was already logged
+            self._listener = None
+        if self._injected:
+            return
+        if self._redis is not None and self._redis_loop is asyncio.get_running_loop():
+            await self._redis.aclose()
+        self._redis = self._redis_loop = None
+
+
+hub = Hub()
+
+
+async def shutdown():
+    await hub.close()
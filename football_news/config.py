@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from pathlib import Path
 import yaml
-from typing import List, Union
+from typing import List, Optional, Union
 from football_news.utils.logger import logger
 
 
@@ -9,6 +9,8 @@ class Feed(BaseModel):
     name: str
     url: str
     ttl_minutes: int = 15
+    mirrors: List[str] = []  # alternate URLs raced when the primary is slow
+    hedge_after: Optional[float] = None
 
 
 def load_feeds(path: Union[str, Path] = "config/rss.yml") -> List[Feed]:
@@ -1,40 +1,42 @@
 import asyncio
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from football_news.config_loader import load_json_cfg, load_html_cfg
-from football_news.fetchers.guardian_fetcher import GuardianFetcher
-from football_news.fetchers.newsapi_fetcher import NewsAPIFetcher
-from football_news.fetchers.html_fetcher import HtmlListFetcher
+from football_news import orchestrator
+from football_news.scheduler import AdaptiveScheduler, build_jobs
+from football_news.storage.db import checkpoint_forever
 from dotenv import load_dotenv
 
 load_dotenv()  # Load environment variables from .env file
 
 
-def build_tasks():
-    tasks = []
-    for cfg in load_json_cfg():
-        if cfg["name"] == "guardian":
-            tasks.append(GuardianFetcher(cfg).fetch())
-        elif cfg["name"] == "newsapi":
-            tasks.append(NewsAPIFetcher(cfg).fetch())
-
-    for cfg in load_html_cfg():
-        tasks.append(HtmlListFetcher(cfg).fetch())
-    return tasks
-
-
 async def run_once():
-    counts = await asyncio.gather(*build_tasks())
-    print("total new rows:", sum(counts))
+    reports = await orchestrator.run_once()
+    print("total new rows:", sum(r.inserted for r in reports))
 
 
 def main():
-    sched = AsyncIOScheduler()
-    sched.add_job(lambda: asyncio.create_task(run_once()), "interval", minutes=5)
-    sched.start()
-    print("scheduler started (Ctrl-C to quit)")
-    asyncio.get_event_loop().run_forever()
+    async def _run():
+        sched = AdaptiveScheduler(build_jobs())
+        checkpoints = asyncio.create_task(checkpoint_forever())
+        print("scheduler started (Ctrl-C to quit)")
+        try:
+            await sched.run_forever()
+        finally:
+            checkpoints.cancel()
+            await sched.stop()
+            await orchestrator.shutdown()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+async def _run_and_close():
+    try:
+        await run_once()
+    finally:
+        await orchestrator.shutdown()
 
 
 if __name__ == "__main__":
-    asyncio.run(run_once())  # change to main() if you want the daemon
+    asyncio.run(_run_and_close())  # change to main() if you want the daemon
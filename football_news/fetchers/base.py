@@ -1,29 +1,101 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import httpx
 import logging
+import os
+from dataclasses import dataclass
+
+from football_news.fetchers.health import Throttled, backoff, hedge, retry_after
+from football_news.fetchers.http_client import client_manager
+from football_news.storage.ingest import ingest
 
 log = logging.getLogger(__name__)
 
+RETRY_STATUSES = {429, 503}
+MAX_RETRY_WAIT = float(os.getenv("FETCH_MAX_RETRY_WAIT", "30"))  # seconds
+HEDGE_AFTER = float(os.getenv("FETCH_HEDGE_AFTER", "2"))  # seconds
+
+
+@dataclass
+class FetchStats:
+    """Counters for the most recent ``fetch()`` call."""
+
+    bytes: int = 0
+    parsed: int = 0
+    skipped: int = 0  # dropped by the seen-ID index
+    inserted: int = 0
+    error: str | None = None
+    retry_after: float | None = None  # set when the server throttled us
+
 
 class BaseFetcher:
+    kind = "base"
     timeout = 10
     max_retries = 2
 
     def __init__(self, cfg: dict):
         self.cfg = cfg
+        self.url: str | None = cfg.get("url")
+        self.stats = FetchStats()
+
+    @property
+    def name(self) -> str:
+        return self.cfg["name"]
+
+    @property
+    def host(self) -> str:
+        return httpx.URL(self.url or "").host
+
+    async def _request(self, url: str, headers: dict | None):
+        """One GET; the source's own URL is hedged across ``mirrors``."""
+        mirrors = self.cfg.get("mirrors") or []
+        if url != self.url or not mirrors:
+            return await client_manager.get(url, headers=headers, timeout=self.timeout)
+        calls = [
+            functools.partial(
+                client_manager.get, u, headers=headers, timeout=self.timeout
+            )
+            for u in (url, *mirrors)
+        ]
+        return await hedge(calls, self.cfg.get("hedge_after") or HEDGE_AFTER)
 
     async def _get(self, url: str, headers: dict | None = None):
         for attempt in range(self.max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    return await client.get(url, headers=headers or {})
+                response = await self._request(url, headers)
             except httpx.RequestError as exc:  # network error, retry
                 if attempt == self.max_retries:
                     log.error("GET %s failed: %s", url, exc)
                     raise
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(backoff(attempt))
+                continue
+
+            self.stats.bytes += len(response.content)
+            if response.status_code not in RETRY_STATUSES:
+                if response.status_code != 304:
+                    response.raise_for_status()  # an error page is not a feed
+                return response
+
+            wait = retry_after(response)
+            if attempt == self.max_retries or (wait or 0) > MAX_RETRY_WAIT:
+                self.stats.retry_after = wait
+                raise Throttled(url, response.status_code, wait)
+            await asyncio.sleep(backoff(attempt) if wait is None else wait)
+
+    async def _store(
+        self, rows: list[dict], watermark: bool = False, validator: dict | None = None
+    ) -> int:
+        """Hand rows to the ingest writer; returns (and records) how many were new.
+
+        ``watermark=True`` advances this source's watermark and ``validator``
+        (``validators.record()``) is saved in the same transaction.
+        """
+        self.stats.inserted = await ingest.submit(
+            rows, self.name if watermark else None, validator
+        )
+        return self.stats.inserted
 
     async def fetch(self) -> int:  # must return rows inserted
         raise NotImplementedError
@@ -0,0 +1,158 @@
+"""
+Record/replay HTTP cassettes for offline fetch runs.
+
+HTTP_CASSETTE_MODE  off | record | replay   (default: off)
+HTTP_CASSETTE_DIR   cassette store          (default: cassettes)
+HTTP_CASSETTE_REALTIME=1   replay with the recorded response times
+
+``record`` passes every request through to the network and writes the
+response (status, headers, decoded body) to a gzip-compressed file per URL;
+``replay`` serves those files back without touching the network, so a fetch
+cycle can be rerun for benchmarks or to reproduce a slowdown with no quota
+spend. API keys are stripped from the URL before it is stored or used as a
+cassette key, so a cassette recorded with one key replays with any other.
+Conditional-GET validators are dropped from recorded requests: a cassette
+always holds a full response, never a bodiless ``304``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import httpx
+
+from football_news.utils.logger import logger
+
+CASSETTE_MODE = os.getenv("HTTP_CASSETTE_MODE", "off")
+CASSETTE_DIR = os.getenv("HTTP_CASSETTE_DIR", "cassettes")
+CASSETTE_REALTIME = os.getenv("HTTP_CASSETTE_REALTIME", "") == "1"
+
+SECRET_PARAMS = {"api-key", "apikey", "api_key", "key", "token"}
+# the stored body is already decoded and complete
+DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+def redact(url: httpx.URL) -> httpx.URL:
+    params = [
+        (k, v) for k, v in url.params.multi_items() if k.lower() not in SECRET_PARAMS
+    ]
+    return url.copy_with(params=params)
+
+
+class CassetteStore:
+    """One ``<host>/<sha1>.json.gz`` file per method + redacted URL."""
+
+    def __init__(self, root: str | Path = CASSETTE_DIR):
+        self.root = Path(root)
+
+    def path(self, method: str, url: httpx.URL) -> Path:
+        key = hashlib.sha1(f"{method} {redact(url)}".encode()).hexdigest()
+        return self.root / (url.host or "_") / f"{key}.json.gz"
+
+    def save(self, request: httpx.Request, response: httpx.Response, elapsed: float):
+        path = self.path(request.method, request.url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = dict(
+            method=request.method,
+            url=str(redact(request.url)),
+            status=response.status_code,
+            headers=[
+                (k, v)
+                for k, v in response.headers.multi_items()
+                if k.lower() not in DROP_HEADERS
+            ],
+            body=base64.b64encode(response.content).decode("ascii"),
+            elapsed=elapsed,
+            recorded=time.time(),
+        )
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(gzip.compress(json.dumps(record).encode(), compresslevel=6))
+        tmp.replace(path)
+
+    def load(self, method: str, url: httpx.URL) -> dict | None:
+        path = self.path(method, url)
+        if not path.exists():
+            return None
+        return json.loads(gzip.decompress(path.read_bytes()))
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, store: CassetteStore, inner: httpx.AsyncBaseTransport):
+        self.store = store
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for name in CONDITIONAL_HEADERS:
+            request.headers.pop(name, None)  # a 304 would replace the recorded body
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - started
+        # hand back a plain, fully-read response; the store keeps decoded bytes
+        recorded = httpx.Response(
+            response.status_code,
+            headers=[
+                (k, v)
+                for k, v in response.headers.multi_items()
+                if k.lower() not in DROP_HEADERS
+            ],
+            content=body,
+            request=request,
+        )
+        self.store.save(request, recorded, elapsed)
+        return recorded
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves recorded responses; a URL without a cassette gets a 504."""
+
+    def __init__(self, store: CassetteStore, realtime: bool | None = None):
+        self.store = store
+        self.realtime = CASSETTE_REALTIME if realtime is None else realtime
+        self.hits = 0
+        self.misses = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        record = self.store.load(request.method, request.url)
+        if record is None:
+            self.misses += 1
+            logger.warning(f"No cassette for {request.method} {redact(request.url)}")
+            return httpx.Response(504, headers={"X-Cassette": "miss"}, request=request)
+        self.hits += 1
+        if self.realtime:
+            await asyncio.sleep(record["elapsed"])
+        return httpx.Response(
+            record["status"],
+            headers=record["headers"] + [("X-Cassette", "hit")],
+            content=base64.b64decode(record["body"]),
+            request=request,
+        )
+
+
+def cassette_transport(
+    mode: str | None = None, root: str | Path | None = None, **transport_kwargs
+) -> httpx.AsyncBaseTransport | None:
+    """Transport for the configured mode, or ``None`` for plain network I/O."""
+    mode = mode or CASSETTE_MODE
+    root = root or CASSETTE_DIR
+    if mode == "record":
+        return RecordingTransport(
+            CassetteStore(root), httpx.AsyncHTTPTransport(**transport_kwargs)
+        )
+    if mode == "replay":
+        return ReplayTransport(CassetteStore(root))
+    return None
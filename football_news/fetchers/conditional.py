@@ -0,0 +1,70 @@
+"""
+Conditional GET support for RSS feeds and HTML list pages.
+
+Validators (ETag / Last-Modified) are persisted per URL in ``http_validators``
+and replayed as ``If-None-Match`` / ``If-Modified-Since``. Servers that send
+neither are handled by comparing a hash of the body with the previous one.
+
+``record()`` builds the validator row for a response; it is handed to the
+ingest writer together with the rows parsed from that response, so both
+commit in one transaction – a failed insert can never leave the response
+marked as seen.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+
+import httpx
+
+from football_news.storage.db import AsyncSessionLocal
+from football_news.storage.models import HttpValidator
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha1(content).hexdigest()
+
+
+class ValidatorStore:
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def _get(self, url: str) -> HttpValidator | None:
+        async with self.session_factory() as s:
+            return await s.get(HttpValidator, url)
+
+    async def request_headers(self, url: str) -> dict:
+        """Conditional headers to send for ``url`` (empty on first fetch)."""
+        v = await self._get(url)
+        if v is None:
+            return {}
+        headers = {}
+        if v.etag:
+            headers["If-None-Match"] = v.etag
+        if v.last_modified:
+            headers["If-Modified-Since"] = v.last_modified
+        return headers
+
+    async def is_unchanged(self, url: str, response: httpx.Response) -> bool:
+        """True on 304, or when the body is byte-identical to the last one."""
+        if response.status_code == 304:
+            return True
+        v = await self._get(url)
+        return v is not None and v.body_hash == body_hash(response.content)
+
+    @staticmethod
+    def record(url: str, response: httpx.Response) -> dict | None:
+        """The ``http_validators`` row for ``response`` (``None`` unless 2xx)."""
+        if not response.is_success:
+            return None
+        return dict(
+            url=url,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            body_hash=body_hash(response.content),
+            checked=dt.datetime.now(dt.timezone.utc),
+        )
+
+
+validators = ValidatorStore()
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-import asyncio
 import datetime as dt
-import hashlib
 import os
 
-from sqlalchemy.dialects.sqlite import insert
 import httpx
 
 from football_news.fetchers.base import BaseFetcher
 from football_news.middlewares.ratelimit import with_rate_limit
-from football_news.storage.db import SessionLocal
-from football_news.storage.models import Story
+from football_news.storage.models import SourceWatermark
+from football_news.storage.seen import seen_ids
+from football_news.storage.stories import story_id
+from football_news.storage.watermarks import get_watermark
 from football_news.utils.logger import logger
 
+MAX_PAGES = 3  # per cycle; override with ``max_pages`` in json.yml
+
 
 class GuardianFetcher(BaseFetcher):
+    kind = "json"
+
     def __init__(self, cfg: dict):
         super().__init__(cfg)
 
@@ -35,50 +38,86 @@ class GuardianFetcher(BaseFetcher):
             self.url = os.path.expandvars(endpoint)
 
     @with_rate_limit
-    async def _call(self):
-        response = await self._get(self.url)
+    async def _call(self, url: str):
+        response = await self._get(url)
         response.raise_for_status()  # Raise exception for HTTP errors
         return response
 
+    def _page_url(self, page: int, watermark: SourceWatermark | None) -> str:
+        params = {"page": page, "order-by": "newest"}
+        if watermark is not None and watermark.last_published is not None:
+            # from-date is inclusive and day-granular; known IDs are skipped
+            params["from-date"] = watermark.last_published.date().isoformat()
+        return str(httpx.URL(self.url).copy_merge_params(params))
+
     async def fetch(self) -> int:
         try:
-            response = await self._call()
-            data = response.json()
-            # logger.info(f"Fetched data from Guardian API: {data}")
-
-            # Check Guardian API response structure
-            if "response" not in data:
-                logger.error("Guardian API response missing 'response' field: %s", data)
-                return 0
-
-            response_data = data["response"]
-            if response_data.get("status") != "ok":
-                logger.error(
-                    "Guardian API error status: %s", response_data.get("status")
-                )
-                return 0
+            await seen_ids.ensure_warm()
+            watermark = await get_watermark(self.name)
+            max_pages = self.cfg.get("max_pages", MAX_PAGES)
+            rows = []
+            collected = set()
 
-            results = response_data.get("results", [])
-            logger.info("Fetched %d articles from Guardian", len(results))
+            for page in range(1, max_pages + 1):
+                response = await self._call(self._page_url(page, watermark))
+                data = response.json()
+                # logger.info(f"Fetched data from Guardian API: {data}")
 
-            rows = []
-            for item in results:
-                try:
-                    row = self._to_row(item)
-                    if row:  # Only add if conversion was successful
-                        rows.append(row)
-                except Exception as e:
-                    logger.warning("Failed to process Guardian article: %s", e)
-                    continue
+                # Check Guardian API response structure
+                if "response" not in data:
+                    logger.error(
+                        "Guardian API response missing 'response' field: %s", data
+                    )
+                    break
 
-            await self._bulk_insert(rows)
-            return len(rows)
+                response_data = data["response"]
+                if response_data.get("status") != "ok":
+                    logger.error(
+                        "Guardian API error status: %s", response_data.get("status")
+                    )
+                    break
+
+                results = response_data.get("results", [])
+                logger.info("Fetched %d articles from Guardian", len(results))
+
+                known = await seen_ids.known(
+                    story_id(i["webUrl"]) for i in results if i.get("webUrl")
+                )
+                reached_known = False
+                for item in results:
+                    if item.get("webUrl"):
+                        guid = story_id(item["webUrl"])
+                        if (
+                            guid in collected
+                            or (watermark is not None and guid == watermark.last_id)
+                            or guid in known
+                        ):
+                            # newest-first: everything after this is known too
+                            self.stats.skipped += 1
+                            reached_known = True
+                            continue
+                    try:
+                        row = self._to_row(item)
+                        if row:  # Only add if conversion was successful
+                            rows.append(row)
+                            collected.add(row["id"])
+                    except Exception as e:
+                        logger.warning("Failed to process Guardian article: %s", e)
+                        continue
+
+                if reached_known or page >= response_data.get("pages", 1):
+                    break
+
+            self.stats.parsed = len(rows)
+            return await self._store(rows, watermark=True)
 
         except httpx.HTTPStatusError as e:
             logger.exception("HTTP error fetching from Guardian: %s", e.response)
+            self.stats.error = str(e)
             return 0
         except Exception as e:
             logger.error("Unexpected error fetching from Guardian: %s", e)
+            self.stats.error = str(e)
             return 0
 
     @staticmethod
@@ -113,7 +152,7 @@ class GuardianFetcher(BaseFetcher):
                 body = item["fields"]["standfirst"]
 
             return dict(
-                id=hashlib.sha1(link.encode()).hexdigest(),
+                id=story_id(link),
                 title=item["webTitle"],
                 link=link,
                 source="guardian",
@@ -123,22 +162,3 @@ class GuardianFetcher(BaseFetcher):
         except Exception as e:
             logger.warning("Error converting Guardian item to row: %s", e)
             return None
-
-    async def _bulk_insert(self, rows: list[dict]):
-        if not rows:
-            return
-        stmt = insert(Story).values(rows).prefix_with("OR IGNORE")
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._commit, stmt)
-
-    @staticmethod
-    def _commit(stmt):
-        s = SessionLocal()
-        try:
-            s.execute(stmt)
-            s.commit()
-        except Exception as e:
-            logger.error("Database error during bulk insert: %s", e)
-            s.rollback()
-        finally:
-            s.close()
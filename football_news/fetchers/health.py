@@ -0,0 +1,165 @@
+"""
+Per-source health: circuit breakers, Retry-After parsing and hedging.
+
+A source that keeps failing is skipped instead of being retried every cycle:
+
+• closed     – requests flow; ``BREAKER_FAILURES`` consecutive failed fetches
+               open the circuit
+• open       – the source is skipped for ``BREAKER_RESET`` seconds (or the
+               server's Retry-After, whichever is longer)
+• half-open  – once that time is up, a single probe fetch is let through; it
+               closes the circuit on success and re-opens it with a doubled
+               timeout (capped at ``BREAKER_MAX_RESET``) on failure
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import email.utils
+import os
+import random
+import time
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+import httpx
+
+BREAKER_FAILURES = int(os.getenv("BREAKER_FAILURES", "3"))
+BREAKER_RESET = float(os.getenv("BREAKER_RESET", "60"))
+BREAKER_MAX_RESET = float(os.getenv("BREAKER_MAX_RESET", "3600"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+T = TypeVar("T")
+
+
+class Throttled(Exception):
+    """Server answered 429/503 and wants us back later than we will wait."""
+
+    def __init__(self, url: str, status: int, retry_after: float | None):
+        wait = f", retry after {retry_after:.0f}s" if retry_after else ""
+        super().__init__(f"{url} answered {status}{wait}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failures: int = BREAKER_FAILURES,
+        reset: float = BREAKER_RESET,
+        max_reset: float = BREAKER_MAX_RESET,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = failures
+        self.base_reset = reset
+        self.max_reset = max_reset
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.reset_timeout = reset
+        self.opened_until = 0.0
+        self._probing = False
+
+    @property
+    def retry_in(self) -> float:
+        return max(0.0, self.opened_until - self.clock())
+
+    def allow(self) -> bool:
+        """May a fetch run now? Lets exactly one probe through when half-open."""
+        if self.state == OPEN and self.clock() >= self.opened_until:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        return self.state != OPEN
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.reset_timeout = self.base_reset
+        self._probing = False
+
+    def record_failure(self, retry_after: float | None = None):
+        self.failures += 1
+        if self.state == HALF_OPEN:
+            self.reset_timeout = min(self.max_reset, self.reset_timeout * 2)
+        elif self.failures < self.threshold and retry_after is None:
+            return
+        self.state = OPEN
+        self._probing = False
+        self.opened_until = self.clock() + max(self.reset_timeout, retry_after or 0)
+
+
+class SourceHealth:
+    """One breaker per source name, shared by every cycle in the process."""
+
+    def __init__(self, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, source: str) -> CircuitBreaker:
+        if source not in self._breakers:
+            self._breakers[source] = CircuitBreaker(**self.breaker_kwargs)
+        return self._breakers[source]
+
+    def snapshot(self) -> dict[str, str]:
+        return {name: b.state for name, b in self._breakers.items()}
+
+    def reset(self):
+        self._breakers.clear()
+
+
+health = SourceHealth()
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (when - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+def backoff(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+async def hedge(calls: Iterable[Callable[[], Awaitable[T]]], delay: float) -> T:
+    """
+    Start ``calls[0]``; start the next call whenever ``delay`` passes without
+    an answer or a running call fails. The first successful result wins and
+    the stragglers are cancelled.
+    """
+    pending = list(calls)
+    running: set[asyncio.Task] = set()
+    error: BaseException | None = None
+    try:
+        while pending or running:
+            if pending:
+                running.add(asyncio.ensure_future(pending.pop(0)()))
+            done, running = await asyncio.wait(
+                running,
+                timeout=delay if pending else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in running:
+            task.cancel()
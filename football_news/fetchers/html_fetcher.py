@@ -1,75 +1,38 @@
 from __future__ import annotations
 
-import asyncio
-import hashlib
-import datetime as dt
-from urllib.parse import urljoin
-
-from bs4 import BeautifulSoup
-from sqlalchemy.dialects.sqlite import insert
-
 from football_news.fetchers.base import BaseFetcher
+from football_news.fetchers.conditional import validators
+from football_news.fetchers.parsing import parse_html_list, run_parse
 from football_news.middlewares.ratelimit import with_rate_limit
-from football_news.storage.db import SessionLocal
-from football_news.storage.models import Story
+from football_news.storage.seen import seen_ids
 
 
 class HtmlListFetcher(BaseFetcher):
     """Scrapes a *list page* (no JS) using selectors from html.yml."""
 
+    kind = "html"
+
     @with_rate_limit
     async def _call(self):
         hdrs = {"User-Agent": "football-news-bot/0.2 (+https://example.com)"}
+        hdrs.update(await validators.request_headers(self.cfg["url"]))
         return await self._get(self.cfg["url"], headers=hdrs)
 
     async def fetch(self) -> int:
-        html = (await self._call()).text
-        soup = BeautifulSoup(html, "lxml")
+        await seen_ids.ensure_warm()
+        response = await self._call()
+        if await validators.is_unchanged(self.cfg["url"], response):
+            return 0
+        parsed = await run_parse(parse_html_list, response.content, self.cfg)
 
+        self.stats.parsed = len(parsed)
         rows = []
-        for item in soup.select(self.cfg["list_selector"]):
-            href = item.select_one(self.cfg["link_selector"]).get("href")
-            link = urljoin(self.cfg["url"], href)
-            rows.append(
-                dict(
-                    id=hashlib.sha1(link.encode()).hexdigest(),
-                    title=item.select_one(self.cfg["title_selector"]).get_text(
-                        strip=True
-                    ),
-                    link=link,
-                    source=self.cfg["name"],
-                    published=self._parse_date(item),
-                    raw=None,
-                )
-            )
-
-        await self._bulk_insert(rows)
-        return len(rows)
-
-    def _parse_date(self, item):
-        sel = self.cfg.get("date_selector")
-        if not sel:
-            return dt.datetime.utcnow()
-        node = item.select_one(sel)
-        if not node:
-            return dt.datetime.utcnow()
-        txt = node.get("datetime") or node.get_text(strip=True)
-        try:
-            return dt.datetime.fromisoformat(txt.replace("Z", "+00:00"))
-        except ValueError:
-            # fallback – many sites use "03 Jul 2025"
-            return dt.datetime.strptime(txt, "%d %b %Y")
-
-    async def _bulk_insert(self, rows):
-        if not rows:
-            return
-        stmt = insert(Story).values(rows).prefix_with("OR IGNORE")
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._commit, stmt)
-
-    @staticmethod
-    def _commit(stmt):
-        s = SessionLocal()
-        s.execute(stmt)
-        s.commit()
-        s.close()
+        known = await seen_ids.known(row["id"] for row in parsed)
+        for row in parsed:
+            if row["id"] in known:
+                self.stats.skipped += 1
+                continue
+            rows.append(row)
+
+        validator = validators.record(self.cfg["url"], response)
+        return await self._store(rows, validator=validator)
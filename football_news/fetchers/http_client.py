@@ -0,0 +1,137 @@
+"""
+Process-wide pooled HTTP client shared by every fetcher.
+
+• one ``httpx.AsyncClient`` per event loop – DNS/TCP/TLS state is reused
+  across fetch cycles instead of being rebuilt for every request
+• HTTP/2 when the optional ``h2`` package is installed
+• redirects are followed, so a feed that moved keeps working
+• bodies are streamed and aborted once they exceed ``HTTP_MAX_BYTES``
+• HTTP_CASSETTE_MODE=record|replay swaps in the cassette transport
+  (see ``cassette.py``)
+
+Call ``shutdown()`` once before the event loop exits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import httpx
+
+from football_news.fetchers.cassette import DROP_HEADERS, cassette_transport
+from football_news.utils.logger import logger
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2 = True
+except ImportError:  # plain HTTP/1.1 keep-alive still applies
+    HTTP2 = False
+
+TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "600"))  # > poll interval
+MAX_BYTES = int(os.getenv("HTTP_MAX_BYTES", str(10 * 1024 * 1024)))
+
+USER_AGENT = "football-news-bot/0.2 (+https://example.com)"
+
+
+class ResponseTooLarge(Exception):
+    """Body exceeded the configured size cap; the connection was dropped."""
+
+    def __init__(self, url: str, limit: int):
+        super().__init__(f"response from {url} exceeds {limit} bytes")
+        self.url = url
+        self.limit = limit
+
+
+class HttpClientManager:
+    def __init__(
+        self,
+        timeout: float = TIMEOUT,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive: int = MAX_KEEPALIVE,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        max_bytes: int = MAX_BYTES,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_bytes = max_bytes
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared client, (re)creating it for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # a client bound to a previous (closed) loop cannot be reused
+            self._client = httpx.AsyncClient(
+                http2=HTTP2,
+                timeout=self.timeout,
+                limits=self.limits,
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                transport=cassette_transport(http2=HTTP2, limits=self.limits),
+            )
+            self._loop = loop
+            logger.debug(f"Created shared HTTP client (http2={HTTP2})")
+        return self._client
+
+    async def get(
+        self,
+        url: str,
+        headers: dict | None = None,
+        timeout: float | None = None,
+        max_bytes: int | None = None,
+    ) -> httpx.Response:
+        """GET ``url`` and return a fully-read response no larger than the cap."""
+        client = self.client()
+        limit = max_bytes or self.max_bytes
+        # per-host concurrency is the orchestrator's (FETCH_PER_HOST)
+        async with client.stream(
+            "GET", url, headers=headers, timeout=timeout or self.timeout
+        ) as response:
+            declared = response.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > limit:
+                raise ResponseTooLarge(url, limit)
+
+            chunks, size = [], 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > limit:
+                    raise ResponseTooLarge(url, limit)
+                chunks.append(chunk)
+
+        # a plain, fully-read response; the body is already decoded
+        return httpx.Response(
+            response.status_code,
+            headers=[
+                (k, v)
+                for k, v in response.headers.multi_items()
+                if k.lower() not in DROP_HEADERS
+            ],
+            content=b"".join(chunks),
+            request=response.request,
+            history=response.history,
+        )
+
+    async def aclose(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug("Closed shared HTTP client")
+        self._client = None
+        self._loop = None
+
+
+client_manager = HttpClientManager()
+
+
+async def shutdown():
+    """Shutdown hook – release pooled connections."""
+    await client_manager.aclose()
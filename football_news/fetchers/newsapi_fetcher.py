@@ -1,18 +1,21 @@
-import asyncio
 import datetime as dt
-import hashlib
 import os
 
-from sqlalchemy.dialects.sqlite import insert
 from football_news.fetchers.base import BaseFetcher
 from football_news.middlewares.ratelimit import with_rate_limit
-from football_news.storage.db import SessionLocal
-from football_news.storage.models import Story
+from football_news.storage.models import SourceWatermark
+from football_news.storage.seen import seen_ids
+from football_news.storage.stories import story_id
+from football_news.storage.watermarks import get_watermark
 import httpx
 from football_news.utils.logger import logger
 
+MAX_PAGES = 2  # per cycle; override with ``max_pages`` in json.yml
+
 
 class NewsAPIFetcher(BaseFetcher):
+    kind = "json"
+
     def __init__(self, cfg: dict):
         super().__init__(cfg)
         # Fix URL construction - use the api_key placeholder from config
@@ -20,82 +23,106 @@ class NewsAPIFetcher(BaseFetcher):
         self.url = cfg["endpoint"].format(api_key=api_key)
 
     @with_rate_limit
-    async def _call(self):
-        response = await self._get(self.url)
+    async def _call(self, url: str):
+        response = await self._get(url)
         response.raise_for_status()  # Raise exception for HTTP errors
         return response
 
+    def _page_url(self, page: int, watermark: SourceWatermark | None) -> str:
+        url = httpx.URL(self.url)
+        params = {"page": page}
+        if "page_size" in self.cfg:
+            params["pageSize"] = self.cfg["page_size"]
+        # only /v2/everything understands from/sortBy; top-headlines just pages
+        if url.path.endswith("/everything"):
+            params["sortBy"] = "publishedAt"
+            if watermark is not None and watermark.last_published is not None:
+                params["from"] = watermark.last_published.isoformat()
+        return str(url.copy_merge_params(params))
+
     async def fetch(self) -> int:
         try:
-            response = await self._call()
-            data = response.json()
+            await seen_ids.ensure_warm()
+            watermark = await get_watermark(self.name)
+            max_pages = self.cfg.get("max_pages", MAX_PAGES)
+            rows = []
+            collected = set()
+            fetched = 0
 
-            # Check API response status
-            if data.get("status") != "ok":
-                error_msg = data.get("message", "Unknown API error")
-                logger.error("NewsAPI error: %s", error_msg)
-                return 0
+            for page in range(1, max_pages + 1):
+                response = await self._call(self._page_url(page, watermark))
+                data = response.json()
 
-            articles = data.get("articles", [])
-            rows = []
-            logger.info("Fetched %d articles from NewsAPI", len(articles))
+                # Check API response status
+                if data.get("status") != "ok":
+                    error_msg = data.get("message", "Unknown API error")
+                    logger.error("NewsAPI error: %s", error_msg)
+                    break
+
+                articles = data.get("articles", [])
+                fetched += len(articles)
+                logger.info("Fetched %d articles from NewsAPI", len(articles))
 
-            for art in articles:
-                # Skip articles without required fields
-                if not art.get("url") or not art.get("title"):
-                    continue
+                known = await seen_ids.known(
+                    story_id(a["url"]) for a in articles if a.get("url")
+                )
+                reached_known = False
+                for art in articles:
+                    # Skip articles without required fields
+                    if not art.get("url") or not art.get("title"):
+                        continue
 
-                link = art["url"]
+                    link = art["url"]
+                    guid = story_id(link)
+                    if (
+                        guid in collected
+                        or (watermark is not None and guid == watermark.last_id)
+                        or guid in known
+                    ):
+                        self.stats.skipped += 1
+                        reached_known = True
+                        continue
 
-                # Handle publishedAt field - some articles might not have it
-                published_at = art.get("publishedAt")
-                if published_at:
-                    try:
-                        published = dt.datetime.fromisoformat(
-                            published_at.replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        logger.warning("Invalid date format for article: %s", link)
+                    # Handle publishedAt field - some articles might not have it
+                    published_at = art.get("publishedAt")
+                    if published_at:
+                        try:
+                            published = dt.datetime.fromisoformat(
+                                published_at.replace("Z", "+00:00")
+                            )
+                        except ValueError:
+                            logger.warning("Invalid date format for article: %s", link)
+                            published = dt.datetime.now(dt.timezone.utc)
+                    else:
                         published = dt.datetime.now(dt.timezone.utc)
-                else:
-                    published = dt.datetime.now(dt.timezone.utc)
-
-                rows.append(
-                    dict(
-                        id=hashlib.sha1(link.encode()).hexdigest(),
-                        title=art["title"],
-                        link=link,
-                        source="newsapi",
-                        published=published,
-                        raw=art.get("content") or art.get("description", ""),
+
+                    rows.append(
+                        dict(
+                            id=guid,
+                            title=art["title"],
+                            link=link,
+                            source="newsapi",
+                            published=published,
+                            raw=art.get("content") or art.get("description", ""),
+                        )
                     )
-                )
+                    collected.add(guid)
+
+                if (
+                    reached_known
+                    or not articles
+                    or fetched >= data.get("totalResults", 0)
+                ):
+                    break
 
-            await self._bulk_insert(rows)
-            return len(rows)
+            self.stats.parsed = len(rows)
+            return await self._store(rows, watermark=True)
 
         except httpx.HTTPStatusError as e:
             logger.error("HTTP error fetching from NewsAPI: %s", e)
+            self.stats.error = str(e)
             return 0
         except Exception as e:
             logger.error("Unexpected error fetching from NewsAPI: %s", e)
+            self.stats.error = str(e)
             return 0
-
-    async def _bulk_insert(self, rows):
-        if not rows:
-            return
-        stmt = insert(Story).values(rows).prefix_with("OR IGNORE")
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._commit, stmt)
-
-    @staticmethod
-    def _commit(stmt):
-        s = SessionLocal()
-        try:
-            s.execute(stmt)
-            s.commit()
-        except Exception as e:
-            logger.error("Database error during bulk insert: %s", e)
-            s.rollback()
-        finally:
-            s.close()
@@ -0,0 +1,121 @@
+"""
+Document parsing off the event loop.
+
+``feedparser`` and lxml tree building are CPU-bound and would otherwise
+stall every in-flight fetch and rate-limit check. The parse functions here
+take raw bytes and return compact, normalized row dicts, so they can run in a
+process pool (parsing scales across cores) or a thread pool.
+
+PARSE_EXECUTOR  process | thread | inline   (default: process)
+PARSE_WORKERS   pool size                   (default: CPU count)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+from urllib.parse import urljoin
+
+import feedparser
+
+from football_news.fetchers.selectors import engine_for
+from football_news.storage.stories import story_id
+
+PARSE_EXECUTOR = os.getenv("PARSE_EXECUTOR", "process")
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0")) or os.cpu_count() or 1
+
+_executor: Executor | None = None
+
+
+def get_executor() -> Executor | None:
+    """Shared parse pool; ``None`` means parse inline on the loop."""
+    global _executor
+    if _executor is None and PARSE_EXECUTOR != "inline":
+        if PARSE_EXECUTOR == "thread":
+            _executor = ThreadPoolExecutor(PARSE_WORKERS, thread_name_prefix="parse")
+        else:
+            _executor = ProcessPoolExecutor(PARSE_WORKERS)
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+async def run_parse(fn: Callable[..., list[dict]], *args) -> list[dict]:
+    executor = get_executor()
+    if executor is None:
+        return fn(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, fn, *args)
+
+
+# -- RSS / Atom ---------------------------------------------------------------
+
+
+def _entry_body(entry) -> str:
+    """The entry's own content, falling back to its summary."""
+    for content in entry.get("content") or []:
+        if content.get("value"):
+            return content["value"]
+    return entry.get("summary", "")
+
+
+def parse_feed(content: bytes, source: str) -> list[dict]:
+    parsed = feedparser.parse(content)
+    now = dt.datetime.utcnow().timetuple()
+    rows = []
+    for e in parsed.entries:
+        if not e.get("link"):
+            continue
+        rows.append(
+            dict(
+                id=story_id(e.link),
+                title=e.get("title", ""),
+                link=e.link,
+                source=source,
+                published=dt.datetime(
+                    *(e.get("published_parsed") or now)[:6], tzinfo=dt.timezone.utc
+                ),
+                raw=_entry_body(e),
+            )
+        )
+    return rows
+
+
+# -- HTML list pages ----------------------------------------------------------
+
+
+def _parse_date(txt: str | None) -> dt.datetime:
+    if not txt:
+        return dt.datetime.utcnow()
+    try:
+        return dt.datetime.fromisoformat(txt.replace("Z", "+00:00"))
+    except ValueError:
+        # fallback – many sites use "03 Jul 2025"
+        return dt.datetime.strptime(txt, "%d %b %Y")
+
+
+def parse_html_list(content: bytes, cfg: dict) -> list[dict]:
+    rows = []
+    for entry in engine_for(cfg).extract(content):
+        if not entry.link or not entry.title:
+            continue
+        link = urljoin(cfg["url"], entry.link)
+        rows.append(
+            dict(
+                id=story_id(link),
+                title=entry.title,
+                link=link,
+                source=cfg["name"],
+                published=_parse_date(entry.date),
+                raw=None,
+            )
+        )
+    return rows
@@ -0,0 +1,120 @@
+"""
+Precompiled lxml selector engine for HTML list pages.
+
+Each source's list/link/title/date CSS selectors from html.yml are compiled
+once into ``lxml.etree.XPath`` objects and applied straight to an lxml tree –
+no BeautifulSoup objects, no per-fetch selector parsing.
+
+Scrapy-style pseudo-elements are supported on the field selectors:
+
+• ``a::attr(href)``  → the attribute value
+• ``h3::text``       → the element's text
+
+Without a pseudo-element, links default to ``href``, dates to the
+``datetime`` attribute (falling back to text) and titles to text.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple
+
+from cssselect import GenericTranslator
+from lxml import etree, html
+
+_PSEUDO = re.compile(r"::(?:attr\(\s*([\w:-]+)\s*\)|(text))\s*$")
+_translator = GenericTranslator()
+
+
+def _text(node) -> str | None:
+    # same as BeautifulSoup's get_text(strip=True)
+    return "".join(s.strip() for s in node.itertext()) or None
+
+
+@dataclass(frozen=True)
+class FieldSelector:
+    xpath: etree.XPath
+    attr: str | None = None
+    text: bool = False
+
+    def extract(
+        self, item, default_attr: str | None = None, text_fallback: bool = True
+    ) -> str | None:
+        nodes = self.xpath(item)
+        if not nodes:
+            return None
+        node = nodes[0]
+        if self.text:
+            return _text(node)
+        if self.attr:
+            return node.get(self.attr)
+        if default_attr:
+            value = node.get(default_attr)
+            if value is not None or not text_fallback:
+                return value
+        return _text(node)
+
+
+def compile_field(css: str) -> FieldSelector:
+    """Compile one field selector, relative to a list item."""
+    attr, text = None, False
+    m = _PSEUDO.search(css)
+    if m:
+        attr, text = m.group(1), bool(m.group(2))
+        css = css[: m.start()]
+    expr = _translator.css_to_xpath(css, prefix="descendant::")
+    return FieldSelector(etree.XPath(expr, smart_strings=False), attr, text)
+
+
+class Entry(NamedTuple):
+    link: str | None
+    title: str | None
+    date: str | None
+
+
+@dataclass(frozen=True)
+class SelectorEngine:
+    items: etree.XPath
+    link: FieldSelector
+    title: FieldSelector
+    date: FieldSelector | None
+
+    def extract(self, content: bytes) -> Iterator[Entry]:
+        root = html.fromstring(content)
+        for item in self.items(root):
+            yield Entry(
+                self.link.extract(item, default_attr="href", text_fallback=False),
+                self.title.extract(item),
+                self.date.extract(item, default_attr="datetime") if self.date else None,
+            )
+
+
+@functools.lru_cache(maxsize=256)
+def compile_source(
+    list_selector: str,
+    link_selector: str,
+    title_selector: str,
+    date_selector: str | None = None,
+) -> SelectorEngine:
+    """Compiled engine for one html.yml source (cached per process)."""
+    items = etree.XPath(
+        _translator.css_to_xpath(list_selector, prefix="descendant-or-self::"),
+        smart_strings=False,
+    )
+    return SelectorEngine(
+        items,
+        compile_field(link_selector),
+        compile_field(title_selector),
+        compile_field(date_selector) if date_selector else None,
+    )
+
+
+def engine_for(cfg: dict) -> SelectorEngine:
+    return compile_source(
+        cfg["list_selector"],
+        cfg["link_selector"],
+        cfg["title_selector"],
+        cfg.get("date_selector"),
+    )
@@ -1,57 +1,325 @@
 """
-Very small Redis-backed token bucket.
+Redis-backed GCRA rate limiter.
 
-• quota_sec – allowed requests *per second*
+• quota_sec – allowed requests *per second*; also the burst size, but at
+  least 1, so quotas below 1/s still grant a request every 1/quota_sec
 • quota_day – allowed requests *per UTC day*
 
+Both quotas are checked and consumed by one Lua script, i.e. one round trip
+per attempt. A rejected attempt consumes nothing and gets back the exact
+time until it would be allowed, so callers sleep precisely that long instead
+of polling. If Redis is unreachable the same algorithm runs in-process
+(per-process limits only) until Redis answers again.
+
+High-frequency sources can set ``lease_size`` (json.yml / html.yml, or
+RATE_LIMIT_LEASE globally): the script then hands out up to that many tokens
+in one round trip and the process spends them locally. Leased tokens are
+already counted against the shared quota, so several replicas stay within it;
+a lease is only spent within LEASE_TTL seconds of being taken. Whatever is
+left is given back to Redis when the source next asks for a token after
+that, or on ``shutdown()``, so unspent tokens never count against the day
+quota. Leases only pay off for sources that make several requests a second.
+
 Call the decorator on any coroutine that performs a single HTTP request.
+Replayed cassettes (HTTP_CASSETTE_MODE=replay) spend no quota and skip it.
 """
 
+from __future__ import annotations
+
 import asyncio
-import time
+import calendar
 import functools
+import math
+import os
+import time
+from dataclasses import dataclass
 
 import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
+from football_news.fetchers import cassette
 from football_news.utils.logger import logger
 
-redis = aioredis.from_url("redis://localhost", decode_responses=True)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "8"))
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "1.0"))
+LEASE_SIZE = int(os.getenv("RATE_LIMIT_LEASE", "1"))
+LEASE_TTL = float(os.getenv("RATE_LIMIT_LEASE_TTL", "1.0"))
 
+MAX_WAIT = 60.0  # seconds; longer waits (e.g. day quota spent) raise instead
+REDIS_RETRY = 30.0  # seconds on the local fallback before trying Redis again
 
-def _count_keys(source_name: str):
-    today = time.strftime("%Y-%m-%d")
-    return f"rl:{source_name}:sec", f"rl:{source_name}:day:{today}"
+# KEYS: tat key, day counter key
+# ARGV: ms per token, burst, day quota, ms until UTC midnight, tokens wanted
+# Grants as many of the wanted tokens as both quotas allow right now.
+# returns {granted, wait_ms}
+GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local burst = math.max(1, tonumber(ARGV[2]))
+local day_quota = tonumber(ARGV[3])
+local day_left = tonumber(ARGV[4])
+local wanted = tonumber(ARGV[5])
 
+local used = tonumber(redis.call('GET', KEYS[2]) or '0')
+local day_room = day_quota - used
+if day_room < 1 then
+  return {0, day_left}
+end
 
-def with_rate_limit(fn):
-    @functools.wraps(fn)
-    async def wrapper(self, *args, **kwargs):
-        k_sec, k_day = _count_keys(self.cfg["name"])
-        while True:
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then tat = now end
+local room = math.floor((now + interval * burst - tat) / interval + 1e-9)
+if room < 1 then
+  return {0, math.ceil(tat + interval - interval * burst - now)}
+end
+
+local granted = math.min(wanted, room, day_room)
+local new_tat = tat + interval * granted
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now) + 1000)
+redis.call('INCRBY', KEYS[2], granted)
+redis.call('PEXPIRE', KEYS[2], day_left + 60000)
+return {granted, 0}
+"""
+
+# KEYS: tat key, day counter key
+# ARGV: ms per token, unused tokens
+RELEASE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local n = tonumber(ARGV[2])
+
+local used = tonumber(redis.call('GET', KEYS[2]) or '0')
+if used > 0 then
+  redis.call('DECRBY', KEYS[2], math.min(n, used))
+end
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat > now then
+  local new_tat = math.max(now, tat - interval * n)
+  redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now) + 1000)
+end
+return n
+"""
+
+
+def get_redis() -> aioredis.Redis:
+    """A client on a bounded, blocking connection pool."""
+    pool = aioredis.BlockingConnectionPool.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_TIMEOUT,
+        socket_timeout=REDIS_TIMEOUT,
+        socket_connect_timeout=REDIS_TIMEOUT,
+        health_check_interval=30,
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+class QuotaExceeded(Exception):
+    """The next allowed request is further away than the caller will wait."""
+
+    def __init__(self, source: str, wait: float):
+        super().__init__(f"rate limit for {source}: next slot in {wait:.0f}s")
+        self.source = source
+        self.wait = wait
+
+
+def _keys(source_name: str):
+    today = time.strftime("%Y-%m-%d", time.gmtime())
+    return f"rl:{source_name}:tat", f"rl:{source_name}:day:{today}"
+
+
+def _ms_until_utc_midnight(now: float) -> int:
+    day_start = calendar.timegm(time.gmtime(now)[:3] + (0, 0, 0))
+    return max(1, math.ceil((day_start + 86400 - now) * 1000))
+
+
+@dataclass
+class Lease:
+    """Tokens taken from the shared quota but not spent yet."""
+
+    keys: tuple[str, str]
+    quota_sec: float
+    tokens: int
+    expires: float  # monotonic
+    remote: bool = True
+
+    @property
+    def live(self) -> bool:
+        return self.tokens > 0 and time.monotonic() < self.expires
+
+
+class LocalGCRA:
+    """In-process twin of ``GCRA_LUA`` used while Redis is unavailable."""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._tat: dict[str, float] = {}
+        self._day: dict[str, tuple[str, int]] = {}  # source -> (day key, used)
+
+    def take(
+        self, source: str, quota_sec: float, quota_day: int, wanted: int = 1
+    ) -> tuple[int, float]:
+        now = self.clock()
+        _, k_day = _keys(source)
+        day, used = self._day.get(source, (k_day, 0))
+        if day != k_day:
+            used = 0
+        if used >= quota_day:
+            return 0, _ms_until_utc_midnight(now) / 1000
+
+        interval = 1 / quota_sec
+        burst = max(1, quota_sec)
+        tat = max(self._tat.get(source, now), now)
+        room = math.floor((now + interval * burst - tat) / interval + 1e-9)
+        if room < 1:
+            return 0, tat + interval - interval * burst - now
+
+        granted = min(wanted, room, quota_day - used)
+        self._tat[source] = tat + interval * granted
+        self._day[source] = (k_day, used + granted)
+        return granted, 0.0
+
+
+class RateLimiter:
+    def __init__(self, client=None, max_wait: float = MAX_WAIT):
+        self._client = client
+        self._script = None
+        self._release = None
+        self.max_wait = max_wait
+        self.local = LocalGCRA()
+        self.leases: dict[str, Lease] = {}
+        self._redis_down_until = 0.0
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis()
+        return self._client
+
+    def _scripts(self):
+        if self._script is None:
+            self._script = self.client.register_script(GCRA_LUA)
+            self._release = self.client.register_script(RELEASE_LUA)
+        return self._script, self._release
+
+    async def _take(
+        self, source: str, quota_sec: float, quota_day: int, wanted: int = 1
+    ) -> tuple[int, float]:
+        """One attempt: ``(granted, seconds_to_wait)``."""
+        granted, wait, _ = await self._take_from(source, quota_sec, quota_day, wanted)
+        return granted, wait
+
+    async def _take_from(
+        self, source: str, quota_sec: float, quota_day: int, wanted: int
+    ) -> tuple[int, float, bool]:
+        if time.monotonic() >= self._redis_down_until:
+            script, _ = self._scripts()
             try:
-                # bump counters atomically
-                results = (
-                    await redis.pipeline()
-                    .incr(k_sec)
-                    .expire(k_sec, 1)
-                    .incr(k_day)
-                    .expire(k_day, 60 * 60 * 24 + 60)
-                    .execute()
+                granted, wait_ms = await script(
+                    keys=list(_keys(source)),
+                    args=[
+                        1000 / quota_sec,
+                        quota_sec,
+                        quota_day,
+                        _ms_until_utc_midnight(time.time()),
+                        wanted,
+                    ],
                 )
+                return int(granted), int(wait_ms) / 1000, True
             except RedisError as exc:
-                logger.warning("Redis unavailable, skipping rate limit: %s", exc)
-                break
+                logger.warning(f"Redis unavailable, limiting in-process: {exc}")
+                self._redis_down_until = time.monotonic() + REDIS_RETRY
+        granted, wait = self.local.take(source, quota_sec, quota_day, wanted)
+        return granted, wait, False
 
-            remaining_sec, _, remaining_day, _ = results
+    async def acquire(
+        self, source: str, quota_sec: float, quota_day: int, lease_size: int = 1
+    ):
+        """Wait until one request for ``source`` is allowed."""
+        lease = self.leases.get(source)
+        if lease is not None:
+            if lease.live:
+                lease.tokens -= 1
+                return
+            await self._return(source, self.leases.pop(source))
 
-            if (
-                remaining_sec <= self.cfg["quota_sec"]
-                and remaining_day <= self.cfg["quota_day"]
-            ):
-                break
-            await asyncio.sleep(1)  # back-off
+        # never ask for more than one burst can hold
+        wanted = max(1, min(lease_size, math.floor(quota_sec)))
+        while True:
+            granted, wait, remote = await self._take_from(
+                source, quota_sec, quota_day, wanted
+            )
+            if granted:
+                if granted > 1:
+                    await self._keep(source, quota_sec, granted - 1, remote)
+                return
+            if wait > self.max_wait:
+                raise QuotaExceeded(source, wait)
+            await asyncio.sleep(wait)
+
+    async def _keep(self, source: str, quota_sec: float, tokens: int, remote: bool):
+        lease = self.leases.get(source)
+        if lease is not None:
+            if lease.live and lease.remote == remote:
+                lease.tokens += tokens
+                return
+            await self._return(source, lease)
+        self.leases[source] = Lease(
+            _keys(source), quota_sec, tokens, time.monotonic() + LEASE_TTL, remote
+        )
+
+    async def release(self) -> int:
+        """Give unspent leased tokens back to the shared quota."""
+        returned = 0
+        leases, self.leases = self.leases, {}
+        for source, lease in leases.items():
+            returned += await self._return(source, lease)
+        return returned
+
+    async def _return(self, source: str, lease: Lease) -> int:
+        """Give one lease's tokens back, live or expired; returns how many."""
+        tokens, lease.tokens = lease.tokens, 0  # nothing spends them meanwhile
+        if not (tokens and lease.remote):
+            return 0  # local tokens were never counted in Redis
+        _, release = self._scripts()
+        try:
+            await release(keys=list(lease.keys), args=[1000 / lease.quota_sec, tokens])
+        except RedisError as exc:
+            logger.warning(f"Could not return {tokens} tokens of {source}: {exc}")
+            return 0
+        return tokens
+
+    async def close(self):
+        """Return leases and close the Redis pool (re-created on next use)."""
+        await self.release()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._script = self._release = None
+
+
+limiter = RateLimiter()
 
+
+def with_rate_limit(fn):
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        if cassette.CASSETTE_MODE == "replay":
+            return await fn(self, *args, **kwargs)
+        await limiter.acquire(
+            self.cfg["name"],
+            self.cfg["quota_sec"],
+            self.cfg["quota_day"],
+            self.cfg.get("lease_size", LEASE_SIZE),
+        )
         return await fn(self, *args, **kwargs)
 
     return wrapper
+
+
+async def shutdown():
+    await limiter.close()
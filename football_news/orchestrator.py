@@ -0,0 +1,187 @@
+"""
+Single fetch orchestrator for RSS, JSON (Guardian/NewsAPI) and HTML sources.
+
+Every source runs under one global concurrency limit plus a per-host limit,
+so adding feeds does not translate into a burst of sockets, parsers and
+SQLite writers. Each run yields a ``SourceReport``.
+
+Sources whose circuit breaker is open are skipped without touching the
+network, and every fetch runs against a deadline (``FETCH_DEADLINE``
+seconds, counted from the start of the cycle), after which it is cancelled
+and counted as a failure, so one slow source cannot hold the cycle up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Iterable
+
+from football_news.broadcast import shutdown as close_broadcast
+from football_news.config import load_feeds
+from football_news.config_loader import load_html_cfg, load_json_cfg
+from football_news.fetchers.base import BaseFetcher, FetchStats
+from football_news.fetchers.guardian_fetcher import GuardianFetcher
+from football_news.fetchers.health import OPEN, health
+from football_news.fetchers.html_fetcher import HtmlListFetcher
+from football_news.fetchers.http_client import shutdown as close_http
+from football_news.fetchers.newsapi_fetcher import NewsAPIFetcher
+from football_news.fetchers.parsing import shutdown_executor
+from football_news.fetchers.rss_fetcher import RssFetcher
+from football_news.middlewares.ratelimit import shutdown as close_limiter
+from football_news.storage.db import shutdown as close_db
+from football_news.storage.ingest import shutdown as close_ingest
+from football_news.storage.seen import seen_ids
+from football_news.utils.logger import logger
+
+MAX_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "16"))
+MAX_PER_HOST = int(os.getenv("FETCH_PER_HOST", "2"))
+DEADLINE = float(os.getenv("FETCH_DEADLINE", "120"))  # seconds per cycle
+
+JSON_FETCHERS = {"guardian": GuardianFetcher, "newsapi": NewsAPIFetcher}
+
+
+@dataclass
+class SourceReport:
+    source: str
+    kind: str
+    host: str
+    latency: float = 0.0  # seconds
+    bytes: int = 0
+    parsed: int = 0
+    skipped: int = 0
+    inserted: int = 0
+    error: str | None = None
+    circuit: str = "closed"
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def build_fetchers(kinds: Iterable[str] | None = None) -> list[BaseFetcher]:
+    """Instantiate one fetcher per configured source (optionally by kind)."""
+    kinds = set(kinds or ("rss", "json", "html"))
+    fetchers: list[BaseFetcher] = []
+
+    if "rss" in kinds:
+        fetchers += [RssFetcher.from_feed(f) for f in load_feeds()]
+
+    if "json" in kinds:
+        for cfg in load_json_cfg():
+            cls = JSON_FETCHERS.get(cfg["name"])
+            if cls is None:
+                logger.warning(f"No fetcher registered for JSON source {cfg['name']}")
+                continue
+            try:
+                fetchers.append(cls(cfg))
+            except KeyError as e:  # missing API key
+                logger.warning(f"Skipping source {cfg['name']}: missing {e}")
+
+    if "html" in kinds:
+        fetchers += [HtmlListFetcher(cfg) for cfg in load_html_cfg()]
+    return fetchers
+
+
+class Orchestrator:
+    def __init__(
+        self,
+        fetchers: Iterable[BaseFetcher],
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_per_host: int = MAX_PER_HOST,
+        deadline: float = DEADLINE,
+    ):
+        self.fetchers = list(fetchers)
+        self.max_per_host = max_per_host
+        self.deadline = deadline
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        return self._hosts[host]
+
+    async def run_source(
+        self, fetcher: BaseFetcher, deadline: float | None = None
+    ) -> SourceReport:
+        """Fetch one source; ``deadline`` is a loop time (default: now + budget)."""
+        report = SourceReport(fetcher.name, fetcher.kind, fetcher.host)
+        breaker = health.breaker(fetcher.name)
+        if not breaker.allow():
+            report.circuit = breaker.state
+            report.error = f"circuit open, retry in {breaker.retry_in:.0f}s"
+            return report
+
+        loop = asyncio.get_running_loop()
+        if deadline is None:
+            deadline = loop.time() + self.deadline
+        fetcher.stats = FetchStats()
+        started = time.perf_counter()
+
+        async def fetch():
+            nonlocal started
+            async with self._host_slot(fetcher.host), self._global:
+                started = time.perf_counter()
+                await fetcher.fetch()
+
+        try:
+            # wait_for rather than asyncio.timeout_at, which needs Python 3.11
+            await asyncio.wait_for(fetch(), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            logger.warning(f"Fetch for {fetcher.name} cancelled at the cycle deadline")
+            fetcher.stats.error = "deadline exceeded"
+        except Exception as e:
+            logger.error(f"Fetch failed for {fetcher.name}: {e}")
+            fetcher.stats.error = str(e)
+        report.latency = time.perf_counter() - started
+
+        stats = fetcher.stats
+        if stats.error:
+            breaker.record_failure(stats.retry_after)
+        else:
+            breaker.record_success()
+        report.circuit = breaker.state
+        report.bytes = stats.bytes
+        report.parsed = stats.parsed
+        report.skipped = stats.skipped
+        report.inserted = stats.inserted
+        report.error = stats.error
+        return report
+
+    async def run_once(self) -> list[SourceReport]:
+        deadline = asyncio.get_running_loop().time() + self.deadline
+        reports = await asyncio.gather(
+            *(self.run_source(f, deadline) for f in self.fetchers)
+        )
+        inserted = sum(r.inserted for r in reports)
+        failed = sum(1 for r in reports if r.error)
+        tripped = sum(1 for r in reports if r.circuit == OPEN)
+        logger.info(
+            f"Fetch cycle completed: {len(reports)} sources, "
+            f"{inserted} stories, {failed} errors, {tripped} circuits open, "
+            f"seen-ID hit rate {seen_ids.hit_rate:.1%}"
+        )
+        return list(reports)
+
+
+async def run_once(kinds: Iterable[str] | None = None) -> list[SourceReport]:
+    """Fetch every configured source once and return per-source reports."""
+    try:
+        fetchers = build_fetchers(kinds)
+    except Exception as e:
+        logger.error(f"Failed to load source configuration: {e}")
+        return []
+    return await Orchestrator(fetchers).run_once()
+
+
+async def shutdown():
+    """Release pooled connections, leased rate-limit tokens and parse workers
+    before the loop exits."""
+    await close_ingest()
+    await close_broadcast()
+    await close_limiter()
+    await close_http()
+    await close_db()
+    shutdown_executor()
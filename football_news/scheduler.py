@@ -0,0 +1,129 @@
+"""
+Per-source adaptive scheduler.
+
+Every source gets its own next-due time derived from its TTL:
+
+• the interval narrows (down to ``ttl * MIN_FACTOR``) while a source keeps
+  producing new stories and widens (up to ``ttl * MAX_FACTOR``) while it is quiet
+• each due time is jittered by ±``JITTER`` so sources drift apart instead of
+  hitting Redis/SQLite in the same second; first runs are spread over
+  ``START_SPREAD`` seconds
+• a source is never fetched again while its previous fetch is still running
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable
+
+from football_news.orchestrator import Orchestrator, build_fetchers
+from football_news.utils.logger import logger
+
+MIN_FACTOR = 0.5
+MAX_FACTOR = 4.0
+SPEEDUP = 0.75  # interval multiplier after a fetch with new stories
+SLOWDOWN = 1.5  # … and after an empty one
+JITTER = 0.1
+START_SPREAD = 30.0  # seconds
+
+
+@dataclass
+class Job:
+    name: str
+    ttl: float  # base interval, seconds
+    run: Callable[[], Awaitable[int]]  # returns number of new stories
+    interval: float = field(init=False)
+    next_due: float = field(init=False, default=0.0)
+    running: bool = field(init=False, default=False)
+
+    def __post_init__(self):
+        self.interval = self.ttl
+
+
+class AdaptiveScheduler:
+    def __init__(
+        self,
+        jobs: Iterable[Job],
+        jitter: float = JITTER,
+        start_spread: float = START_SPREAD,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.jobs = list(jobs)
+        self.jitter = jitter
+        self.clock = clock
+        self._tasks: set[asyncio.Task] = set()
+        self._wake = asyncio.Event()
+        self._stopped = False
+
+        now = clock()
+        for job in self.jobs:
+            job.next_due = now + random.uniform(0, min(start_spread, job.ttl))
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def reschedule(self, job: Job, new_stories: int):
+        if new_stories > 0:
+            job.interval = max(job.ttl * MIN_FACTOR, job.interval * SPEEDUP)
+        else:
+            job.interval = min(job.ttl * MAX_FACTOR, job.interval * SLOWDOWN)
+        job.next_due = self.clock() + self._jittered(job.interval)
+
+    async def _run(self, job: Job):
+        new = 0
+        try:
+            new = await job.run()
+        except Exception as e:
+            logger.error(f"Scheduled fetch failed for {job.name}: {e}")
+        finally:
+            job.running = False
+            self.reschedule(job, new or 0)
+            logger.debug(
+                f"{job.name}: {new} new, next run in {job.interval:.0f}s (base {job.ttl:.0f}s)"
+            )
+            self._wake.set()
+
+    def due(self) -> list[Job]:
+        now = self.clock()
+        return [j for j in self.jobs if not j.running and j.next_due <= now]
+
+    async def run_forever(self):
+        logger.info(f"Adaptive scheduler started with {len(self.jobs)} sources")
+        while not self._stopped:
+            for job in self.due():
+                job.running = True
+                task = asyncio.create_task(self._run(job), name=f"fetch:{job.name}")
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            idle = [j.next_due for j in self.jobs if not j.running]
+            delay = max(0.0, min(idle) - self.clock()) if idle else None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self):
+        self._stopped = True
+        self._wake.set()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+def build_jobs(orchestrator: Orchestrator | None = None) -> list[Job]:
+    """One job per configured source, all sharing the orchestrator's limits."""
+    orch = orchestrator or Orchestrator(build_fetchers())
+
+    async def run(fetcher) -> int:
+        return (await orch.run_source(fetcher)).inserted
+
+    return [
+        Job(f.name, f.cfg.get("ttl_minutes", 15) * 60, functools.partial(run, f))
+        for f in orch.fetchers
+    ]
@@ -0,0 +1,266 @@
+"""
+Cold tier: monthly Parquet archive of old stories.
+
+``archive()`` moves stories published before the hot window
+(``ARCHIVE_AFTER_DAYS``) out of the database, one calendar month at a time:
+
+    <ARCHIVE_DIR>/month=2025-04/stories.parquet
+
+Each file holds the story columns plus the decompressed ``raw`` body,
+zstd-compressed column by column. A month that already has a file is
+merged with it and rewritten (by story ID), so re-running after a crash
+between writing and pruning never duplicates stories. The pruned rows
+take their ``story_tags`` and unreferenced blobs with them, and the
+database is vacuumed afterwards so the hot set stays small enough to
+live in the page cache.
+
+``read()`` answers ``/v1/news``-style queries over archived ranges and
+only opens the month directories the range touches; ``scan()`` is the same
+as a generator, for exports.
+
+Needs ``pyarrow``.
+
+ARCHIVE_DIR         root of the Parquet archive   (default: ./archive)
+ARCHIVE_AFTER_DAYS  hot window, in days           (default: 90)
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import itertools
+import os
+from pathlib import Path
+from typing import Iterator, Literal
+
+from sqlalchemy import delete, exists, func, select, text
+from sqlalchemy.orm import selectinload, undefer
+
+from football_news.storage.db import SessionLocal, engine
+from football_news.storage.models import Story, StoryBlob, StoryTag
+from football_news.storage.paging import Cursor
+from football_news.storage.timestamps import utc
+from football_news.storage.versions import bump_sync
+from football_news.utils.logger import logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # the archive tier is optional
+    pa = pc = pq = None  # type: ignore
+
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "./archive")
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+FILE_NAME = "stories.parquet"
+COLUMNS = ["id", "title", "link", "source", "published", "summary", "tags", "raw"]
+
+
+def _schema():
+    return pa.schema(
+        [
+            ("id", pa.string()),
+            ("title", pa.string()),
+            ("link", pa.string()),
+            ("source", pa.string()),
+            ("published", pa.timestamp("us", tz="UTC")),
+            ("summary", pa.string()),
+            ("tags", pa.list_(pa.string())),
+            ("raw", pa.string()),
+        ]
+    )
+
+
+def _require():
+    if pa is None:
+        raise RuntimeError("the story archive needs pyarrow: pip install pyarrow")
+
+
+def _month_start(value: dt.datetime) -> dt.datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(start: dt.datetime) -> dt.datetime:
+    return (start + dt.timedelta(days=32)).replace(day=1)
+
+
+def cutoff(days: int = ARCHIVE_AFTER_DAYS) -> dt.datetime:
+    """Start of the hot window – older stories belong in the archive."""
+    return dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=days)
+
+
+def month_path(root: str | Path, month: str) -> Path:
+    return Path(root) / f"month={month}" / FILE_NAME
+
+
+def _write_month(root: str | Path, month: str, records: list[dict]) -> int:
+    """Merge ``records`` into the month's file; returns the stories in it."""
+    path = month_path(root, month)
+    table = pa.Table.from_pylist(records, schema=_schema())
+    if path.exists():
+        old = pq.read_table(path, schema=_schema())
+        keep = pc.invert(pc.is_in(old["id"], value_set=table["id"]))
+        table = pa.concat_tables([old.filter(keep), table])
+    table = table.sort_by([("published", "descending"), ("id", "ascending")])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    pq.write_table(
+        table,
+        tmp,
+        compression="zstd",
+        compression_level={"raw": 9},  # the bulk of the bytes
+        use_dictionary=["source", "tags"],
+    )
+    os.replace(tmp, path)  # readers never see a half-written month
+    return table.num_rows
+
+
+def _record(story: Story) -> dict:
+    return dict(
+        id=story.id,
+        title=story.title,
+        link=story.link,
+        source=story.source,
+        published=utc(story.published),
+        summary=story.summary,
+        tags=story.tags,
+        raw=story.raw_text,
+    )
+
+
+def archive(
+    before: dt.datetime | None = None,
+    root: str | Path | None = None,
+    vacuum: bool = True,
+) -> dict[str, int]:
+    """Move stories published before ``before`` into the archive.
+
+    Returns the number of stories archived per month (``YYYY-MM``).
+    """
+    _require()
+    root = root or ARCHIVE_DIR
+    before = utc(before or cutoff())
+    moved: dict[str, int] = {}
+    with SessionLocal() as s:
+        while True:
+            oldest = s.scalar(
+                select(func.min(Story.published)).where(Story.published < before)
+            )
+            if oldest is None:
+                break
+            start = _month_start(utc(oldest))
+            end = min(_next_month(start), before)
+            stories = s.scalars(
+                select(Story)
+                .options(selectinload(Story.blob), undefer(Story.raw))
+                .where(Story.published >= start, Story.published < end)
+            ).all()
+            month = start.strftime("%Y-%m")
+            total = _write_month(root, month, [_record(r) for r in stories])
+
+            ids = [r.id for r in stories]
+            hashes = {r.raw_hash for r in stories if r.raw_hash}
+            for chunk in range(0, len(ids), 500):
+                part = ids[chunk : chunk + 500]
+                s.execute(delete(StoryTag).where(StoryTag.story_id.in_(part)))
+                s.execute(delete(Story).where(Story.id.in_(part)))
+            if hashes:
+                s.execute(
+                    delete(StoryBlob)
+                    .where(StoryBlob.hash.in_(hashes))
+                    .where(~exists().where(Story.raw_hash == StoryBlob.hash))
+                )
+            bump_sync(s)
+            s.commit()
+            s.expunge_all()
+            moved[month] = moved.get(month, 0) + len(ids)
+            logger.info(f"Archived {len(ids)} stories of {month} ({total} in file)")
+
+    if moved and vacuum:
+        compact()
+    return moved
+
+
+def compact():
+    """Give the space of pruned rows back (``VACUUM``; needs no transaction)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("VACUUM (ANALYZE)"))
+        else:
+            conn.execute(text("VACUUM"))
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
+
+def months(root: str | Path | None = None) -> list[str]:
+    """Archived months, oldest first."""
+    files = Path(root or ARCHIVE_DIR).glob(f"month=*/{FILE_NAME}")
+    return sorted(p.parent.name.split("=", 1)[1] for p in files)
+
+
+def read(
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+    sources: list[str] | None = None,
+    tags: list[str] | None = None,
+    match: Literal["any", "all"] = "any",
+    limit: int | None = 50,
+    cursor: Cursor | None = None,
+    root: str | Path | None = None,
+    columns: list[str] | None = None,
+) -> list[dict]:
+    """Archived stories, newest first, filtered like ``/v1/news``.
+
+    ``columns`` defaults to everything but ``raw``.
+    """
+    rows = scan(since, until, sources, tags, match, cursor, root, columns)
+    return list(itertools.islice(rows, limit))
+
+
+def scan(
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+    sources: list[str] | None = None,
+    tags: list[str] | None = None,
+    match: Literal["any", "all"] = "any",
+    cursor: Cursor | None = None,
+    root: str | Path | None = None,
+    columns: list[str] | None = None,
+) -> Iterator[dict]:
+    """``read()`` as a generator – holds one month in memory at a time."""
+    _require()
+    root = root or ARCHIVE_DIR
+    since, until = utc(since), utc(until)
+    if cursor is not None and (until is None or cursor.published < until):
+        until = cursor.published + dt.timedelta(microseconds=1)  # keep ties
+    wanted = columns or [c for c in COLUMNS if c != "raw"]
+    load = list(dict.fromkeys(wanted + ["id", "published", "source", "tags"]))
+
+    for month in reversed(months(root)):
+        start = dt.datetime.strptime(month, "%Y-%m").replace(tzinfo=dt.timezone.utc)
+        if until is not None and start >= until:
+            continue
+        if since is not None and _next_month(start) <= since:
+            break
+        table = pq.read_table(month_path(root, month), columns=load)
+        conds = []
+        if since is not None:
+            conds.append(pc.greater_equal(table["published"], since))
+        if until is not None:
+            conds.append(pc.less(table["published"], until))
+        if sources:
+            conds.append(pc.is_in(table["source"], value_set=pa.array(sources)))
+        if conds:
+            table = table.filter(functools.reduce(pc.and_, conds))
+        for batch in table.to_batches(max_chunksize=1000):
+            for row in batch.to_pylist():  # already newest first
+                if cursor is not None and row["published"] == cursor.published:
+                    if row["id"] <= cursor.id:
+                        continue
+                if tags and not _has_tags(row["tags"], tags, match):
+                    continue
+                yield {c: row[c] for c in wanted}
+
+
+def _has_tags(have: list[str] | None, tags: list[str], match: str) -> bool:
+    have = set(have or ())
+    return set(tags) <= have if match == "all" else bool(have & set(tags))
@@ -0,0 +1,47 @@
+"""
+Content-addressed, compressed storage for per-entry raw bodies.
+
+A story's ``raw`` text is zlib-compressed into ``story_blobs`` keyed by the
+SHA-1 of the uncompressed text, so identical payloads are stored once.
+Stories only carry the ``raw_hash`` reference.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+
+LEVEL = 6
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def compress(text: str) -> bytes:
+    return zlib.compress(text.encode(), LEVEL)
+
+
+def decompress(data: bytes) -> str:
+    return zlib.decompress(data).decode()
+
+
+def split_raw(rows: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Move each row's ``raw`` text into a blob row.
+
+    Returns ``(story_rows, blob_rows)``; story rows get ``raw_hash`` instead
+    of ``raw`` and blob rows are de-duplicated by hash.
+    """
+    stories, blobs = [], {}
+    for row in rows:
+        row = dict(row)
+        text = row.pop("raw", None)
+        if text:
+            h = content_hash(text)
+            if h not in blobs:
+                blobs[h] = dict(hash=h, data=compress(text))
+            row["raw_hash"] = h
+        else:
+            row["raw_hash"] = None
+        stories.append(row)
+    return stories, list(blobs.values())
@@ -0,0 +1,149 @@
+"""
+Dialect-agnostic bulk writes for SQLite and Postgres.
+
+``insert_ignore()`` is ``INSERT … ON CONFLICT DO NOTHING`` and ``upsert()``
+is ``INSERT … ON CONFLICT (pk) DO UPDATE``. Both take a list of row dicts
+and are sent as one executemany. Nothing else in the code base should
+import a dialect's ``insert``.
+
+On Postgres, ``insert_ignore()`` batches of ``BULK_COPY_ROWS`` or more are
+``COPY``-ed into a temporary staging table and moved over with a single
+``INSERT … SELECT … ON CONFLICT DO NOTHING`` instead of being sent as
+parameter sets.
+
+BULK_COPY_ROWS  batch size from which Postgres uses COPY staging
+                (default: 5000, 0 disables)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
+
+from football_news.storage.timestamps import utc
+
+COPY_ROWS = int(os.getenv("BULK_COPY_ROWS", "5000"))
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _table(target) -> Table:
+    return getattr(target, "__table__", target)
+
+
+def _insert(dialect: str, table: Table):
+    try:
+        return _INSERTS[dialect](table)
+    except KeyError:
+        raise NotImplementedError(f"bulk writes are not supported on {dialect}")
+
+
+def insert_ignore_stmt(dialect: str, target, returning=None) -> Insert:
+    """``INSERT … ON CONFLICT DO NOTHING [RETURNING …]`` for ``dialect``."""
+    stmt = _insert(dialect, _table(target)).on_conflict_do_nothing()
+    if returning is not None:
+        stmt = stmt.returning(returning)
+    return stmt
+
+
+def upsert_stmt(dialect: str, target, columns: list[str]) -> Insert:
+    """Insert, or overwrite ``columns`` of the row with the same primary key."""
+    table = _table(target)
+    stmt = _insert(dialect, table)
+    keys = [c.name for c in table.primary_key]
+    update = {c: stmt.excluded[c] for c in columns if c not in keys}
+    if not update:
+        return stmt.on_conflict_do_nothing(index_elements=keys)
+    return stmt.on_conflict_do_update(index_elements=keys, set_=update)
+
+
+def _dialect(session: AsyncSession) -> str:
+    return session.bind.dialect.name
+
+
+async def insert_ignore(
+    session: AsyncSession, target, rows: list[dict], returning=None
+) -> list[Any]:
+    """Insert ``rows``, skipping any whose key already exists – caller commits.
+
+    Returns the ``returning`` column of the rows that were inserted, or an
+    empty list when ``returning`` is not given.
+    """
+    if not rows:
+        return []
+    dialect = _dialect(session)
+    if dialect == "postgresql" and 0 < COPY_ROWS <= len(rows):
+        return await _copy_ignore(session, _table(target), rows, returning)
+    stmt = insert_ignore_stmt(dialect, target, returning)
+    result = await session.execute(stmt, rows)
+    return list(result.scalars()) if returning is not None else []
+
+
+async def upsert(session: AsyncSession, target, rows: list[dict]):
+    """Insert or update ``rows`` by primary key – caller commits.
+
+    Every row must carry the same keys; those are the columns updated.
+    """
+    if not rows:
+        return
+    await session.execute(upsert_stmt(_dialect(session), target, list(rows[0])), rows)
+
+
+def _copy_value(column, value):
+    # COPY goes through asyncpg's binary codecs, not SQLAlchemy's types
+    if value is None:
+        return None
+    if isinstance(column.type, JSON):
+        return json.dumps(value)
+    if isinstance(column.type, DateTime):
+        return utc(value)
+    return value
+
+
+def _record(table: Table, columns, defaults, row: dict) -> tuple:
+    values = [_copy_value(table.c[c], row.get(c)) for c in columns]
+    for name, default in defaults.items():
+        value = default.arg(None) if default.is_callable else default.arg
+        values.append(_copy_value(table.c[name], value))
+    return tuple(values)
+
+
+async def _copy_ignore(session: AsyncSession, table: Table, rows, returning):
+    conn = await session.connection()
+    raw = (await conn.get_raw_connection()).driver_connection  # asyncpg
+    columns = list(dict.fromkeys(k for r in rows for k in r))
+    # Python-side column defaults are applied by SQLAlchemy, not by COPY
+    defaults = {
+        c.name: c.default
+        for c in table.c
+        if c.name not in columns
+        and c.default is not None
+        and (c.default.is_scalar or c.default.is_callable)
+    }
+    stage = f"_stage_{table.name}"
+    await conn.exec_driver_sql(
+        f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+        f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    await conn.exec_driver_sql(f"TRUNCATE {stage}")
+    await raw.copy_records_to_table(
+        stage,
+        records=[_record(table, columns, defaults, r) for r in rows],
+        columns=columns + list(defaults),
+    )
+    names = ", ".join(columns + list(defaults))
+    sql = (
+        f"INSERT INTO {table.name} ({names}) SELECT {names} FROM {stage} "
+        f"ON CONFLICT DO NOTHING"
+    )
+    if returning is None:
+        await conn.exec_driver_sql(sql)
+        return []
+    result = await conn.exec_driver_sql(f"{sql} RETURNING {returning.name}")
+    return list(result.scalars())
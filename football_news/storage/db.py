@@ -1,9 +1,190 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+"""
+Database engines.
+
+``async_engine`` / ``AsyncSessionLocal`` are what the fetchers, the worker and
+the ingest writer use – aiosqlite for SQLite, asyncpg for Postgres – so DB
+I/O never blocks the event loop or competes for the default thread pool.
+The API reads through its own pooled, read-only ``read_engine`` /
+``ReadSessionLocal`` so queries never queue behind ingest writes. The sync
+``engine`` / ``SessionLocal`` remain for migrations, scripts and tests.
+
+DATABASE_URL       sync-style URL   (default: sqlite:///./news.db)
+DATABASE_READ_URL  optional replica for the read engine (Postgres)
+DB_PROFILE         SQLite storage profile, see PROFILES   (default: wal)
+SQLITE_<PRAGMA>    override one pragma of the profile, e.g. SQLITE_MMAP_SIZE=0
+DB_POOL_SIZE       pooled connections per engine   (default: 5)
+DB_READ_POOL_SIZE  pooled connections for API reads   (default: 10)
+DB_MAX_OVERFLOW    extra connections under burst   (default: 5)
+DB_POOL_TIMEOUT    seconds to wait for a free one  (default: 30)
+WAL_CHECKPOINT_SECONDS  interval of the background checkpoint (default: 300)
+"""
+
+import asyncio
+import os
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from football_news.utils.logger import logger
+
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./news.db")
+READ_DATABASE_URL = os.getenv("DATABASE_READ_URL", SQLALCHEMY_DATABASE_URL)
+PROFILE = os.getenv("DB_PROFILE", "wal")
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+CHECKPOINT_SECONDS = float(os.getenv("WAL_CHECKPOINT_SECONDS", "300"))
+
+# SQLite pragmas per profile, applied to every new connection
+PROFILES: dict[str, dict[str, str | int]] = {
+    # the pre-WAL behaviour: rollback journal, fsync on every commit
+    "legacy": dict(journal_mode="DELETE", synchronous="FULL", busy_timeout=5000),
+    # readers and the writer never block each other; fsync at checkpoints only
+    "wal": dict(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,  # KiB
+        busy_timeout=5000,
+        temp_store="MEMORY",
+        wal_autocheckpoint=1000,  # pages
+    ),
+    # WAL concurrency, but every commit is fsynced
+    "durable": dict(
+        journal_mode="WAL",
+        synchronous="FULL",
+        cache_size=-16 * 1024,
+        busy_timeout=10000,
+        wal_autocheckpoint=1000,
+    ),
+}
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_url(url: str) -> str:
+    """``sqlite:///x.db`` → ``sqlite+aiosqlite:///x.db`` (same for Postgres)."""
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}://{rest}"
+
+
+def pragmas(profile: str = PROFILE) -> dict[str, str | int]:
+    """The profile's pragmas with ``SQLITE_<NAME>`` environment overrides."""
+    if profile not in PROFILES:
+        raise ValueError(
+            f"unknown DB_PROFILE {profile!r}, pick one of {list(PROFILES)}"
+        )
+    values = dict(PROFILES[profile])
+    for name in list(values) + ["mmap_size", "cache_size", "temp_store"]:
+        override = os.getenv(f"SQLITE_{name.upper()}")
+        if override is not None:
+            values[name] = override
+    return values
+
+
+def _pool_args(url: str, pool_size: int = POOL_SIZE) -> dict:
+    if url.startswith("sqlite") and ":memory:" in url:
+        return {}  # single-connection pool, sizing does not apply
+    return dict(
+        pool_size=pool_size,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_pre_ping=not url.startswith("sqlite"),
+    )
+
+
+def apply_profile(sync_engine: Engine, profile: str, read_only: bool = False):
+    """Run the profile's pragmas on every connection the engine opens."""
+    values = pragmas(profile)
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        for name, value in values.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+def make_async_engine(
+    url: str,
+    profile: str = PROFILE,
+    read_only: bool = False,
+    pool_size: int = POOL_SIZE,
+) -> AsyncEngine:
+    kwargs = _pool_args(url, pool_size)
+    if read_only and url.startswith("postgresql"):
+        kwargs["execution_options"] = {"postgresql_readonly": True}
+    eng = create_async_engine(async_url(url), **kwargs)
+    if url.startswith("sqlite"):
+        apply_profile(eng.sync_engine, profile, read_only)
+    return eng
+
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./news.db"
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args=(
+        {"check_same_thread": False}
+        if SQLALCHEMY_DATABASE_URL.startswith("sqlite")
+        else {}
+    ),
+    **_pool_args(SQLALCHEMY_DATABASE_URL),
 )
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    apply_profile(engine, PROFILE)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = make_async_engine(SQLALCHEMY_DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+read_engine = make_async_engine(
+    READ_DATABASE_URL, read_only=True, pool_size=READ_POOL_SIZE
+)
+ReadSessionLocal = async_sessionmaker(
+    read_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
+
+
+async def checkpoint(mode: str = "PASSIVE", eng: AsyncEngine | None = None):
+    """Fold the WAL back into the database file (SQLite only).
+
+    Returns ``(busy, wal_pages, checkpointed_pages)``, or ``None`` when the
+    database is not SQLite.
+    """
+    eng = eng or async_engine
+    if eng.dialect.name != "sqlite":
+        return None
+    async with eng.connect() as conn:
+        row = (await conn.execute(text(f"PRAGMA wal_checkpoint({mode})"))).one()
+    return tuple(row)
+
+
+async def checkpoint_forever(interval: float = CHECKPOINT_SECONDS):
+    """Background task for writer processes: PASSIVE checkpoints on a timer,
+    TRUNCATE when the WAL could be checkpointed completely."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            result = await checkpoint("PASSIVE")
+            if result is None:
+                return
+            busy, pages, done = result
+            if not busy and pages == done and pages > 0:
+                await checkpoint("TRUNCATE")  # also shrinks the -wal file
+            logger.debug(f"WAL checkpoint: {pages} pages in log, {done} written")
+        except Exception as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+
+
+async def shutdown():
+    """Close pooled async connections before the event loop exits."""
+    await async_engine.dispose()
+    await read_engine.dispose()
@@ -0,0 +1,62 @@
+"""
+Full-text index DDL over ``stories.title`` and ``stories.summary``.
+
+• SQLite: an external-content FTS5 table ``stories_fts`` keyed by the
+  stories rowid, kept in sync by triggers (ignored duplicate inserts fire
+  nothing, so the ingest path needs no hooks)
+• Postgres: a generated, weighted ``search`` tsvector column with a GIN index
+
+Attached to ``stories`` creation in ``models.py`` and reused by the
+migration, so ``create_all`` and ``alembic upgrade`` build the same thing.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import DDL
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS stories_fts USING fts5("
+    "title, summary, content='stories', content_rowid='rowid', "
+    "tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS stories_fts_ai AFTER INSERT ON stories BEGIN "
+    "INSERT INTO stories_fts(rowid, title, summary) "
+    "VALUES (new.rowid, new.title, new.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS stories_fts_ad AFTER DELETE ON stories BEGIN "
+    "INSERT INTO stories_fts(stories_fts, rowid, title, summary) "
+    "VALUES ('delete', old.rowid, old.title, old.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS stories_fts_au "
+    "AFTER UPDATE OF title, summary ON stories BEGIN "
+    "INSERT INTO stories_fts(stories_fts, rowid, title, summary) "
+    "VALUES ('delete', old.rowid, old.title, old.summary); "
+    "INSERT INTO stories_fts(rowid, title, summary) "
+    "VALUES (new.rowid, new.title, new.summary); END",
+]
+SQLITE_REBUILD = "INSERT INTO stories_fts(stories_fts) VALUES ('rebuild')"
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS stories_fts_au",
+    "DROP TRIGGER IF EXISTS stories_fts_ad",
+    "DROP TRIGGER IF EXISTS stories_fts_ai",
+    "DROP TABLE IF EXISTS stories_fts",
+]
+
+POSTGRES_CREATE = [
+    "ALTER TABLE stories ADD COLUMN IF NOT EXISTS search tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_stories_search ON stories USING GIN (search)",
+]
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_stories_search",
+    "ALTER TABLE stories DROP COLUMN IF EXISTS search",
+]
+
+
+def after_create() -> list[DDL]:
+    return [DDL(s).execute_if(dialect="sqlite") for s in SQLITE_CREATE] + [
+        DDL(s).execute_if(dialect="postgresql") for s in POSTGRES_CREATE
+    ]
+
+
+def before_drop() -> list[DDL]:
+    return [DDL(s).execute_if(dialect="sqlite") for s in SQLITE_DROP]
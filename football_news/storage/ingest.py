@@ -0,0 +1,191 @@
+"""
+Single-writer ingest queue.
+
+Fetchers hand their normalized rows to ``ingest.submit()`` instead of opening
+their own sessions. One writer task drains the queue and merges whatever has
+accumulated into a single transaction – flushed once ``INGEST_BATCH`` rows
+are waiting or ``INGEST_FLUSH_MS`` after the first one arrived – so many
+concurrent sources cost a few large SQLite write transactions instead of one
+small one each, and never fight over the write lock.
+
+``submit()`` resolves to the number of the caller's rows that were actually
+new (``INSERT … RETURNING``). Watermarks and conditional-GET validators
+(``http_validators``) are written in the same transaction as the rows they
+describe. The new rows are published to the live stream (``broadcast.py``)
+once committed, in a task of their own so a slow or failing relay never
+holds up the writer or touches the write's outcome.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+
+from football_news.broadcast import hub
+from football_news.storage.bulk import upsert
+from football_news.storage.db import AsyncSessionLocal
+from football_news.storage.models import HttpValidator
+from football_news.storage.seen import seen_ids
+from football_news.storage.stories import insert_stories
+from football_news.storage.versions import bump
+from football_news.storage.watermarks import advance_watermark
+from football_news.utils.logger import logger
+
+INGEST_BATCH = int(os.getenv("INGEST_BATCH", "1000"))  # rows per transaction
+INGEST_FLUSH_MS = float(os.getenv("INGEST_FLUSH_MS", "50"))
+
+
+@dataclass
+class _Batch:
+    rows: list[dict]
+    watermark: str | None  # source whose watermark these rows advance
+    validator: dict | None  # http_validators row of the response they came from
+    done: asyncio.Future = field(repr=False)
+
+
+class IngestQueue:
+    def __init__(
+        self,
+        max_batch: int = INGEST_BATCH,
+        flush_ms: float = INGEST_FLUSH_MS,
+        session_factory=AsyncSessionLocal,
+    ):
+        self.max_batch = max_batch
+        self.flush_after = flush_ms / 1000
+        self.session_factory = session_factory
+        self._queue: asyncio.Queue[_Batch] | None = None
+        self._writer: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._publishing: set[asyncio.Task] = set()
+        self.transactions = 0
+        self.rows_written = 0
+
+    def _ensure_writer(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._queue = asyncio.Queue()  # queues belong to one loop
+            self._writer = None
+            self._loop = loop
+        if self._writer is None or self._writer.done():
+            # the writer exits once the queue is drained, so nothing lingers
+            # between cycles; checking empty() and returning happen in one
+            # step, so a row queued after that always finds it done
+            self._writer = loop.create_task(self._run(), name="ingest-writer")
+        return self._queue
+
+    async def submit(
+        self,
+        rows: list[dict],
+        watermark: str | None = None,
+        validator: dict | None = None,
+    ) -> int:
+        """Queue ``rows`` for the writer; returns how many were new.
+
+        ``validator`` is saved even when no rows are left to store.
+        """
+        if not rows and validator is None:
+            return 0
+        queue = self._ensure_writer()
+        done = asyncio.get_running_loop().create_future()
+        queue.put_nowait(_Batch(list(rows), watermark, validator, done))
+        return await done
+
+    async def _collect(self) -> list[_Batch]:
+        """Take what is queued, then wait for more until full or timed out."""
+        loop = asyncio.get_running_loop()
+        first = self._queue.get_nowait()
+        batches, size = [first], len(first.rows)
+        deadline = loop.time() + self.flush_after
+        while size < self.max_batch:
+            try:
+                batch = await asyncio.wait_for(
+                    self._queue.get(), max(0.0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                break
+            batches.append(batch)
+            size += len(batch.rows)
+        return batches
+
+    async def _run(self):
+        while not self._queue.empty():
+            batches = await self._collect()
+            try:
+                await self._write(batches)
+            except Exception as e:
+                if len(batches) == 1:
+                    self._fail(batches[0], e)
+                    continue
+                # one bad submission must not sink everyone else's rows
+                logger.warning(f"Merged ingest failed ({e}), retrying one by one")
+                for b in batches:
+                    try:
+                        await self._write([b])
+                    except Exception as e:
+                        self._fail(b, e)
+
+    @staticmethod
+    def _fail(batch: _Batch, exc: Exception):
+        logger.error(f"Ingest transaction failed: {exc}")
+        if not batch.done.done():
+            batch.done.set_exception(exc)
+
+    async def _write(self, batches: list[_Batch]):
+        rows = [r for b in batches for r in b.rows]
+        async with self.session_factory() as s:
+            new_ids = await insert_stories(s, rows)
+            by_source: dict[str, list[dict]] = {}
+            for b in batches:
+                if b.watermark:
+                    by_source.setdefault(b.watermark, []).extend(b.rows)
+            for source, source_rows in by_source.items():
+                await advance_watermark(s, source, source_rows)
+            checked = {b.validator["url"]: b.validator for b in batches if b.validator}
+            await upsert(s, HttpValidator, list(checked.values()))
+            if new_ids:
+                await bump(s)
+            await s.commit()
+        seen_ids.add(r["id"] for r in rows)
+        fresh = {r["id"]: r for r in rows if r["id"] in new_ids}
+        self.transactions += 1
+        self.rows_written += len(new_ids)
+
+        for b in batches:
+            # a row queued twice in one transaction counts for its first owner
+            mine = {r["id"] for r in b.rows} & new_ids
+            new_ids -= mine
+            if not b.done.done():
+                b.done.set_result(len(mine))
+        logger.debug(
+            f"Ingest wrote {len(rows)} rows from {len(batches)} submissions "
+            f"in one transaction"
+        )
+        self._publish(list(fresh.values()))
+
+    def _publish(self, rows: list[dict]):
+        """Publish ``rows`` as ``new`` events without waiting on the relay."""
+        if not rows:
+            return
+        task = asyncio.get_running_loop().create_task(hub.publish("new", rows))
+        self._publishing.add(task)  # held until done so it is not collected
+        task.add_done_callback(self._published)
+
+    def _published(self, task: asyncio.Task):
+        self._publishing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Publishing new stories failed: {task.exception()}")
+
+    async def close(self):
+        """Wait until everything queued has been written."""
+        if self._writer is not None and self._loop is asyncio.get_running_loop():
+            await self._writer
+            await asyncio.gather(*self._publishing, return_exceptions=True)
+        self._writer = self._queue = self._loop = None
+
+
+ingest = IngestQueue()
+
+
+async def shutdown():
+    await ingest.close()
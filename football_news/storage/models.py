@@ -1,9 +1,31 @@
 import datetime as dt
-from sqlalchemy import Column, String, Text, DateTime, JSON
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.orm import deferred, relationship
 
+from . import fts
+from .blobs import decompress
 from .db import Base
 
 
+class StoryBlob(Base):
+    """Compressed raw entry body, keyed by SHA-1 of the uncompressed text."""
+
+    __tablename__ = "story_blobs"
+    hash = Column(String, primary_key=True)
+    data = Column(LargeBinary, nullable=False)  # zlib
+
+
 class Story(Base):
     __tablename__ = "stories"
     id = Column(String, primary_key=True, index=True)  # GUID/URL hash
@@ -11,6 +33,84 @@ class Story(Base):
     link = Column(String, nullable=False)
     source = Column(String, index=True)
     published = Column(DateTime(timezone=True), default=dt.datetime.utcnow)
-    raw = Column(Text)  # full RSS/HTML for debug
+    raw = deferred(Column(Text))  # legacy inline copy, see raw_hash
+    raw_hash = Column(String, ForeignKey("story_blobs.hash"), nullable=True)
     summary = Column(Text, nullable=True)
     tags = Column(JSON, nullable=True)
+
+    blob = relationship(StoryBlob, lazy="select")
+
+    # the API timeline order, seeked by keyset cursors (storage/paging.py)
+    __table_args__ = (Index("ix_stories_timeline", published.desc(), "id"),)
+
+    @property
+    def raw_text(self) -> str | None:
+        """Entry body – from the blob store, or the legacy inline column."""
+        if self.blob is not None:
+            return decompress(self.blob.data)
+        return self.raw
+
+
+for _ddl in fts.after_create():
+    event.listen(Story.__table__, "after_create", _ddl)
+for _ddl in fts.before_drop():
+    event.listen(Story.__table__, "before_drop", _ddl)
+
+
+class StoryTag(Base):
+    """One row per (tag, story) – the indexed form of ``Story.tags``.
+
+    ``published`` and ``source`` are copied from the story so tag timelines
+    and their filters are answered from the covering index alone.
+    """
+
+    __tablename__ = "story_tags"
+    tag = Column(String, primary_key=True)
+    story_id = Column(
+        String, ForeignKey("stories.id", ondelete="CASCADE"), primary_key=True
+    )
+    published = Column(DateTime(timezone=True), nullable=False)
+    source = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_story_tags_timeline",
+            "tag",
+            published.desc(),
+            "story_id",
+            "source",
+        ),
+    )
+
+
+class HttpValidator(Base):
+    """Last seen ETag / Last-Modified / body hash per fetched URL."""
+
+    __tablename__ = "http_validators"
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    body_hash = Column(String, nullable=True)
+    checked = Column(DateTime(timezone=True), default=dt.datetime.utcnow)
+
+
+class SourceWatermark(Base):
+    """Newest story seen per API source – drives incremental fetching."""
+
+    __tablename__ = "source_watermarks"
+    source = Column(String, primary_key=True)
+    last_published = Column(DateTime(timezone=True), nullable=True)
+    last_id = Column(String, nullable=True)
+    updated = Column(DateTime(timezone=True), default=dt.datetime.utcnow)
+
+
+class DataVersion(Base):
+    """Change counter per data set, bumped by every writer in its transaction.
+
+    Readers (the API response cache) compare it instead of re-querying.
+    """
+
+    __tablename__ = "data_versions"
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated = Column(DateTime(timezone=True), default=dt.datetime.utcnow)
@@ -0,0 +1,54 @@
+"""
+Keyset pagination over the ``(published DESC, id)`` story order.
+
+A cursor is the position of the last story on a page, handed to clients as
+an opaque URL-safe token. The next page seeks past it on the timeline
+indexes instead of counting an ``OFFSET``, so page 1000 costs what page 1
+does.
+"""
+
+from __future__ import annotations
+
+import base64
+import datetime as dt
+import json
+from typing import NamedTuple
+
+from sqlalchemy import ColumnElement, and_, or_
+
+from football_news.storage.timestamps import utc
+
+
+class Cursor(NamedTuple):
+    published: dt.datetime
+    id: str
+
+
+def encode_cursor(published: dt.datetime, story_id: str) -> str:
+    raw = json.dumps([utc(published).isoformat(), story_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Raises ``ValueError`` for anything ``encode_cursor`` did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        published, story_id = json.loads(raw)
+        published = dt.datetime.fromisoformat(published)
+    except (TypeError, ValueError) as e:  # binascii/json errors included
+        raise ValueError(f"invalid cursor {token!r}") from e
+    if not isinstance(story_id, str):
+        raise ValueError(f"invalid cursor {token!r}")
+    return Cursor(utc(published), story_id)  # naive tokens are UTC, not local
+
+
+def after(published, story_id, cursor: Cursor) -> ColumnElement[bool]:
+    """Rows strictly after ``cursor`` in ``published DESC, id ASC`` order.
+
+    The leading ``published <= …`` is what the index seeks on; the ``OR``
+    only sorts out ties at the boundary timestamp.
+    """
+    return and_(
+        published <= cursor.published,
+        or_(published < cursor.published, story_id > cursor.id),
+    )
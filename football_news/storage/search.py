@@ -0,0 +1,161 @@
+"""
+Full-text story search over the ``fts.py`` index.
+
+Ranking is relevance (BM25 on SQLite, ``ts_rank_cd`` on Postgres) damped by
+age: ``score = relevance / (1 + age_days / SEARCH_HALF_LIFE_DAYS)``, so with the
+default a week-old story needs twice the relevance of today's to outrank it.
+
+Only the newest ``SEARCH_CANDIDATES`` matches are scored – the FTS index
+hands them out newest-rowid first and stops, so a query costs the same on a
+month of stories as on ten years of them. Source, date and tag filters are
+applied while the candidates are collected, so the cap counts only stories
+that can be returned. Snippets are built for the final page only.
+
+SEARCH_CANDIDATES      matches scored per query   (default: 1000)
+SEARCH_HALF_LIFE_DAYS  age at which relevance counts half   (default: 7)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    bindparam,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_news.storage.models import Story
+
+CANDIDATES = int(os.getenv("SEARCH_CANDIDATES", "1000"))
+HALF_LIFE_DAYS = float(os.getenv("SEARCH_HALF_LIFE_DAYS", "7"))
+TITLE_WEIGHT, SUMMARY_WEIGHT = 10.0, 3.0  # bm25 column weights
+SNIPPET_TOKENS = 16
+MARK = ("<mark>", "</mark>")
+
+_TOKEN = re.compile(r"\w+\*?")
+
+
+def fts_query(q: str) -> str:
+    """User input → FTS5 query: every word required, ``word*`` is a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in ``q`` are never
+    interpreted.
+    """
+    terms = []
+    for token in _TOKEN.findall(q):
+        word, prefix = token.rstrip("*"), token.endswith("*")
+        terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+async def search(
+    session: AsyncSession,
+    q: str,
+    limit: int = 50,
+    filters: Iterable[ColumnElement[bool]] = (),
+    candidates: int = CANDIDATES,
+    columns: Sequence | None = None,
+) -> list[tuple[Any, str | None]]:
+    """Best ``limit`` stories for ``q`` as ``(story, snippet)`` pairs.
+
+    ``filters`` are extra ``WHERE`` clauses on ``Story`` (source, dates, tags).
+    With ``columns``, each story is a row of just those columns instead of
+    a ``Story`` object.
+    """
+    search = _search_postgres
+    if session.bind.dialect.name != "postgresql":
+        search = _search_sqlite
+    hits = await search(
+        session, q, limit, list(filters), candidates, columns or (Story,)
+    )
+    return [(r[0] if columns is None else r, snippet) for r, snippet in hits]
+
+
+async def _search_sqlite(session, q, limit, filters, candidates, columns):
+    match = fts_query(q)
+    if not match:
+        return []
+    index = table("stories_fts", column("rowid"))
+    rowid = literal_column("stories.rowid")
+    hits = (
+        select(
+            index.c.rowid,
+            func.bm25(
+                literal_column("stories_fts"), TITLE_WEIGHT, SUMMARY_WEIGHT
+            ).label("bm25"),
+        )
+        .join_from(index, Story, rowid == index.c.rowid)
+        .where(literal_column("stories_fts").op("MATCH")(match), *filters)
+        .order_by(index.c.rowid.desc())
+        .limit(candidates)
+        .subquery()
+    )
+    age = func.julianday("now") - func.julianday(Story.published)
+    # scalar max() on SQLite; bm25() is negative, lower is better
+    score = (-hits.c.bm25 / (1 + func.max(age, 0) / HALF_LIFE_DAYS)).label("score")
+    qry = (
+        select(*columns, rowid.label("fts_rowid"))
+        .join(hits, rowid == hits.c.rowid)
+        .order_by(score.desc(), Story.published.desc())
+        .limit(limit)
+    )
+    rows = (await session.execute(qry)).all()
+    if not rows:
+        return []
+
+    snippets = dict(
+        (
+            await session.execute(
+                text(
+                    "SELECT rowid, snippet(stories_fts, -1, :open, :close, '…', "
+                    ":tokens) FROM stories_fts "
+                    "WHERE stories_fts MATCH :match AND rowid IN :rowids"
+                ).bindparams(bindparam("rowids", expanding=True)),
+                dict(
+                    open=MARK[0],
+                    close=MARK[1],
+                    tokens=SNIPPET_TOKENS,
+                    match=match,
+                    rowids=[r.fts_rowid for r in rows],
+                ),
+            )
+        ).all()
+    )
+    return [(r, snippets.get(r.fts_rowid)) for r in rows]
+
+
+async def _search_postgres(session, q, limit, filters, candidates, columns):
+    query = func.websearch_to_tsquery("english", q)
+    vector = literal_column("stories.search")
+    hits = (
+        select(Story.id, func.ts_rank_cd(vector, query).label("rank"))
+        .where(vector.op("@@")(query), *filters)
+        .order_by(Story.published.desc())
+        .limit(candidates)
+        .subquery()
+    )
+    age = func.extract("epoch", func.now() - Story.published) / 86400
+    score = (hits.c.rank / (1 + func.greatest(age, 0) / HALF_LIFE_DAYS)).label("score")
+    snippet = func.ts_headline(
+        "english",
+        func.coalesce(Story.summary, Story.title),
+        query,
+        f"StartSel={MARK[0]}, StopSel={MARK[1]}, "
+        f"MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}",
+    )
+    qry = (
+        select(*columns, snippet.label("fts_snippet"))
+        .join(hits, Story.id == hits.c.id)
+        .order_by(score.desc(), Story.published.desc())
+        .limit(limit)
+    )
+    return [(r, r.fts_snippet) for r in (await session.execute(qry)).all()]
@@ -0,0 +1,141 @@
+"""
+In-memory index of story IDs that are already stored.
+
+Fetchers ask ``known()`` which of a page's IDs are stored, to drop them
+before building rows. It is a two-generation Bloom filter: when the current
+filter reaches ``SEEN_CAPACITY`` IDs it becomes the previous one and a fresh
+filter starts, so memory stays bounded while recent IDs remain covered.
+
+A filter miss is definite, a hit only "maybe": the filter would repeat a
+false positive for that ID on every cycle, so a story trusted to it would
+never be stored. ``known()`` therefore confirms the hits with one
+``id IN (…)`` read – the filter spares the lookup for new stories, and a
+false positive costs a query, never a story. The index is warm-started from the most recent
+``stories.id`` values by ``ensure_warm()``, which every fetch awaits first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+from typing import Iterable
+
+from sqlalchemy import select
+
+from football_news.storage.db import AsyncSessionLocal
+from football_news.storage.models import Story
+from football_news.utils.logger import logger
+
+SEEN_CAPACITY = int(os.getenv("SEEN_CAPACITY", "200000"))
+SEEN_FP_RATE = float(os.getenv("SEEN_FP_RATE", "0.0001"))
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class SeenIndex:
+    def __init__(
+        self,
+        capacity: int = SEEN_CAPACITY,
+        fp_rate: float = SEEN_FP_RATE,
+        session_factory=AsyncSessionLocal,
+    ):
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.session_factory = session_factory
+        self.reset()
+
+    def reset(self):
+        self._current = BloomFilter(self.capacity, self.fp_rate)
+        self._previous: BloomFilter | None = None
+        self._warm = False
+        self.checks = 0
+        self.hits = 0
+        self.false_positives = 0
+
+    async def warm(self):
+        """Load the most recent story IDs (newest first, up to capacity)."""
+        async with self.session_factory() as s:
+            ids = (
+                await s.scalars(
+                    select(Story.id)
+                    .order_by(Story.published.desc())
+                    .limit(self.capacity)
+                )
+            ).all()
+        self.add(reversed(ids))
+        logger.debug(f"Seen-ID index warmed with {len(ids)} ids")
+
+    async def ensure_warm(self):
+        if self._warm:
+            return
+        self._warm = True  # concurrent fetches don't load it twice
+        try:
+            await self.warm()
+        except Exception:
+            self._warm = False
+            raise
+
+    def seen(self, story_id: str) -> bool:
+        self.checks += 1
+        hit = story_id in self._current or (
+            self._previous is not None and story_id in self._previous
+        )
+        if hit:
+            self.hits += 1
+        return hit
+
+    async def known(self, story_ids: Iterable[str]) -> set[str]:
+        """Which of ``story_ids`` are stored – filter hits checked in the DB."""
+        maybe = list({i for i in story_ids if self.seen(i)})
+        if not maybe:
+            return set()
+        async with self.session_factory() as s:
+            stored = set(await s.scalars(select(Story.id).where(Story.id.in_(maybe))))
+        self.false_positives += len(maybe) - len(stored)
+        return stored
+
+    def add(self, story_ids: Iterable[str]):
+        for story_id in story_ids:
+            if self._current.count >= self.capacity:
+                self._previous = self._current
+                self._current = BloomFilter(self.capacity, self.fp_rate)
+            self._current.add(story_id)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.checks if self.checks else 0.0
+
+    def metrics(self) -> dict:
+        return {
+            "checks": self.checks,
+            "hits": self.hits,
+            "hit_rate": self.hit_rate,
+            "false_positives": self.false_positives,
+        }
+
+
+seen_ids = SeenIndex()
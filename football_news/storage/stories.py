@@ -0,0 +1,28 @@
+"""Write helpers shared by every fetcher."""
+
+from __future__ import annotations
+
+import hashlib
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_news.storage.blobs import split_raw
+from football_news.storage.bulk import insert_ignore
+from football_news.storage.models import Story, StoryBlob
+
+
+def story_id(link: str) -> str:
+    """Stable primary key for a story – SHA-1 of its link."""
+    return hashlib.sha1(link.encode()).hexdigest()
+
+
+async def insert_stories(session: AsyncSession, rows: list[dict]) -> set[str]:
+    """INSERT … ON CONFLICT DO NOTHING stories (and their raw blobs) – caller commits.
+
+    Returns the IDs that were actually inserted, i.e. were not stored yet.
+    """
+    if not rows:
+        return set()
+    stories, blobs = split_raw(rows)
+    await insert_ignore(session, StoryBlob, blobs)
+    return set(await insert_ignore(session, Story, stories, returning=Story.id))
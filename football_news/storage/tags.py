@@ -0,0 +1,92 @@
+"""
+``story_tags`` maintenance and tag-timeline queries.
+
+``Story.tags`` stays the JSON list the API returns; ``story_tags`` is its
+normalized, indexed copy that every tag filter runs against. Whoever writes
+``Story.tags`` calls ``set_tags()`` in the same transaction.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Iterable, Literal, Sequence
+
+from sqlalchemy import Select, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_news.storage.models import Story, StoryTag
+from football_news.storage.paging import Cursor, after
+
+
+async def set_tags(
+    session: AsyncSession,
+    story_id: str,
+    tags: Iterable[str],
+    published: dt.datetime,
+    source: str | None,
+):
+    """Replace the indexed tags of one story – caller commits."""
+    await session.execute(delete(StoryTag).where(StoryTag.story_id == story_id))
+    rows = [
+        dict(tag=t, story_id=story_id, published=published, source=source)
+        for t in sorted(set(tags))
+    ]
+    if rows:
+        await session.execute(insert(StoryTag), rows)
+
+
+def tag_ids(tags: list[str], match: Literal["any", "all"] = "any") -> Select:
+    """IDs of stories carrying any/all of ``tags`` (for use in ``IN (…)``)."""
+    tags = sorted(set(tags))
+    qry = select(StoryTag.story_id).where(StoryTag.tag.in_(tags))
+    if match == "all" and len(tags) > 1:
+        qry = qry.group_by(StoryTag.story_id).having(func.count() == len(tags))
+    return qry
+
+
+def tagged_stories(
+    tags: list[str],
+    match: Literal["any", "all"] = "any",
+    sources: list[str] | None = None,
+    since: dt.datetime | None = None,
+    until: dt.datetime | None = None,
+    limit: int = 50,
+    cursor: Cursor | None = None,
+    columns: Sequence = (Story,),
+) -> Select:
+    """Newest stories carrying any/all of ``tags``, filtered on the index.
+
+    The tag/source/date filtering, ordering and limit all run on
+    ``ix_story_tags_timeline``; only the final page is joined to ``stories``.
+    A single tag (the club-timeline case) is a plain index range scan that
+    stops after ``limit`` entries, starting at ``cursor`` when given.
+    ``columns`` narrows what is selected from ``stories`` (default: the entity).
+    """
+    tags = sorted(set(tags))
+    if len(tags) == 1:
+        published = StoryTag.published
+        qry = select(StoryTag.story_id, published).where(StoryTag.tag == tags[0])
+    else:
+        published = func.max(StoryTag.published)
+        qry = select(StoryTag.story_id, published.label("published")).where(
+            StoryTag.tag.in_(tags)
+        )
+    if sources:
+        qry = qry.where(StoryTag.source.in_(sources))
+    if since is not None:
+        qry = qry.where(StoryTag.published >= since)
+    if until is not None:
+        qry = qry.where(StoryTag.published < until)
+    if cursor is not None:
+        # every tag row of a story carries its published, so this is per story
+        qry = qry.where(after(StoryTag.published, StoryTag.story_id, cursor))
+    if len(tags) > 1:
+        qry = qry.group_by(StoryTag.story_id)
+        if match == "all":
+            qry = qry.having(func.count() == len(tags))
+    page = qry.order_by(published.desc(), StoryTag.story_id).limit(limit).subquery()
+    return (
+        select(*columns)
+        .join(page, Story.id == page.c.story_id)
+        .order_by(page.c.published.desc(), page.c.story_id)
+    )
@@ -0,0 +1,20 @@
+"""
+Timestamps as stored: every ``DateTime`` column holds UTC.
+
+SQLite hands back naive datetimes even for ``timezone=True`` columns, and
+clients may send naive query values, so anything compared with or emitted
+from a stored timestamp goes through ``utc()`` first.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+
+def utc(value: dt.datetime | None) -> dt.datetime | None:
+    """``value`` as an aware UTC datetime; naive values are taken as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
@@ -0,0 +1,52 @@
+"""
+Data version counters (``data_versions``).
+
+Every transaction that changes what the API serves calls ``bump()`` before
+committing: the ingest writer, the enrichment worker and the archive job.
+``current()`` is one primary-key read, cheap enough to poll.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from football_news.storage.bulk import insert_ignore, insert_ignore_stmt
+from football_news.storage.models import DataVersion
+
+STORIES = "stories"
+
+
+def _increment(name: str):
+    return (
+        update(DataVersion)
+        .where(DataVersion.name == name)
+        .values(
+            version=DataVersion.version + 1, updated=dt.datetime.now(dt.timezone.utc)
+        )
+    )
+
+
+async def bump(session: AsyncSession, name: str = STORIES):
+    """Increment ``name``'s version – caller commits."""
+    await insert_ignore(session, DataVersion, [dict(name=name, version=0)])
+    await session.execute(_increment(name))
+
+
+def bump_sync(session: Session, name: str = STORIES):
+    """``bump()`` for the sync session of batch jobs."""
+    dialect = session.get_bind().dialect.name
+    session.execute(
+        insert_ignore_stmt(dialect, DataVersion), [dict(name=name, version=0)]
+    )
+    session.execute(_increment(name))
+
+
+async def current(session: AsyncSession, name: str = STORIES) -> int:
+    version = await session.scalar(
+        select(DataVersion.version).where(DataVersion.name == name)
+    )
+    return version or 0
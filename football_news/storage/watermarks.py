@@ -0,0 +1,44 @@
+"""
+Per-source watermark cursors for the quota-limited JSON APIs.
+
+The watermark records the newest ``published`` timestamp and story ID stored
+for a source. Fetchers turn it into ``from-date``/``from`` parameters and
+stop paging at the first known ID. Advance it in the same transaction as
+the insert so the two can never disagree.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_news.storage.db import AsyncSessionLocal
+from football_news.storage.models import SourceWatermark
+from football_news.storage.timestamps import utc
+
+
+async def get_watermark(source: str) -> SourceWatermark | None:
+    async with AsyncSessionLocal() as s:
+        wm = await s.get(SourceWatermark, source)
+        if wm is not None and wm.last_published is not None:
+            wm.last_published = utc(wm.last_published)
+        return wm
+
+
+async def advance_watermark(session: AsyncSession, source: str, rows: list[dict]):
+    """Move the watermark forward to the newest of ``rows`` – caller commits."""
+    if not rows:
+        return
+    newest = max(rows, key=lambda r: utc(r["published"]))
+    wm = await session.get(SourceWatermark, source)
+    if wm is None:
+        wm = SourceWatermark(source=source)
+        session.add(wm)
+    elif wm.last_published is not None and utc(wm.last_published) >= utc(
+        newest["published"]
+    ):
+        return
+    wm.last_published = utc(newest["published"])
+    wm.last_id = newest["id"]
+    wm.updated = dt.datetime.now(dt.timezone.utc)
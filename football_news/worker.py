@@ -8,10 +8,16 @@ import asyncio
 import logging
 from itertools import islice
 
-from football_news.storage.db import SessionLocal
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload, undefer
+
+from football_news.broadcast import hub
+from football_news.processors.summary import summarise
+from football_news.processors.tagger import tag
+from football_news.storage.db import AsyncSessionLocal
 from football_news.storage.models import Story
-from processors.summary import summarise
-from processors.tagger import tag
+from football_news.storage.tags import set_tags
+from football_news.storage.versions import bump
 
 log = logging.getLogger("worker")
 BATCH = 10  # LLM hits per wave
@@ -21,26 +27,47 @@ SLEEP = 60  # sec between idle polls
 async def _enrich(rows):
     # summarise concurrently
     sums = await asyncio.gather(
-        *[summarise(r.title, r.raw or "") for r in rows], return_exceptions=True
+        *[summarise(r.title, r.raw_text or "") for r in rows], return_exceptions=True
     )
 
-    session = SessionLocal()
-    for row, s in zip(rows, sums):
-        if isinstance(s, Exception):
-            log.error("summary failed %s: %s", row.id, s)
-            continue
-        row.summary = s
-        row.tags = tag(f"{row.title}. {s}")
-        session.add(row)
-    session.commit()
-    session.close()
+    done = []
+    async with AsyncSessionLocal() as session:
+        for row, s in zip(rows, sums):
+            if isinstance(s, Exception):
+                log.error("summary failed %s: %s", row.id, s)
+                continue
+            tags = tag(f"{row.title}. {s}")
+            await session.execute(
+                update(Story).where(Story.id == row.id).values(summary=s, tags=tags)
+            )
+            await set_tags(session, row.id, tags, row.published, row.source)
+            done.append(
+                dict(
+                    id=row.id,
+                    title=row.title,
+                    link=row.link,
+                    source=row.source,
+                    published=row.published,
+                    summary=s,
+                    tags=tags,
+                )
+            )
+        await bump(session)
+        await session.commit()
+    await hub.publish("enriched", done)
 
 
 async def main():
     while True:
-        ses = SessionLocal()
-        rows = ses.query(Story).filter(Story.summary.is_(None)).limit(100).all()
-        ses.close()
+        async with AsyncSessionLocal() as ses:
+            rows = (
+                await ses.scalars(
+                    select(Story)
+                    .options(selectinload(Story.blob), undefer(Story.raw))
+                    .filter(Story.summary.is_(None))
+                    .limit(100)
+                )
+            ).all()
 
         if not rows:
             await asyncio.sleep(SLEEP)
@@ -1,3 +1,4 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -11,6 +12,13 @@ from alembic import context
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
+# DATABASE_URL (e.g. a shared Postgres) wins over the ini default
+config.set_main_option(
+    "sqlalchemy.url",
+    os.getenv("DATABASE_URL", config.get_main_option("sqlalchemy.url")).replace(
+        "%", "%%"
+    ),
+)
 # Find the line that sets target_metadata and change it to:
 target_metadata = Base.metadata
 # Interpret the config file for Python logging.
@@ -18,6 +26,17 @@ target_metadata = Base.metadata
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Leave the search index alone – ``storage/fts.py`` creates it outside the
+    models, so autogenerate would otherwise emit drops for it."""
+    if type_ == "table" and name.startswith("stories_fts"):
+        return False  # the FTS5 table and its shadow tables (stories_fts_*)
+    if type_ in ("column", "index") and obj.table.name == "stories":
+        return name not in ("search", "ix_stories_search")  # Postgres tsvector
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -40,6 +59,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,7 +82,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,37 @@
+"""Add http_validators table
+
+Revision ID: 5d1f0c7a9e21
+Revises: bec7b4a20d73
+Create Date: 2025-07-14 09:12:40.518311
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1f0c7a9e21"
+down_revision: Union[str, Sequence[str], None] = "bec7b4a20d73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "http_validators",
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("last_modified", sa.String(), nullable=True),
+        sa.Column("body_hash", sa.String(), nullable=True),
+        sa.Column("checked", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("url"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("http_validators")
@@ -0,0 +1,107 @@
+"""Move raw bodies into compressed story_blobs
+
+Revision ID: 8a3c6e2f4b17
+Revises: 5d1f0c7a9e21
+Create Date: 2025-07-16 21:04:03.227145
+
+"""
+
+import hashlib
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a3c6e2f4b17"
+down_revision: Union[str, Sequence[str], None] = "5d1f0c7a9e21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH = 500  # rows read per query, so large bodies never all sit in memory
+
+
+# frozen copies of football_news.storage.blobs as of this revision
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def compress(text: str) -> bytes:
+    return zlib.compress(text.encode(), 6)
+
+
+def decompress(data: bytes) -> str:
+    return zlib.decompress(data).decode()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "story_blobs",
+        sa.Column("hash", sa.String(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    with op.batch_alter_table("stories") as batch_op:
+        batch_op.add_column(sa.Column("raw_hash", sa.String(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_stories_raw_hash", "story_blobs", ["raw_hash"], ["hash"]
+        )
+
+    # move existing inline bodies into the blob store
+    conn = op.get_bind()
+    stories = sa.table(
+        "stories", sa.column("id"), sa.column("raw"), sa.column("raw_hash")
+    )
+    blobs = sa.table("story_blobs", sa.column("hash"), sa.column("data"))
+    seen, last = set(), ""
+    while True:
+        rows = conn.execute(
+            sa.select(stories.c.id, stories.c.raw)
+            .where(stories.c.raw.is_not(None), stories.c.id > last)
+            .order_by(stories.c.id)
+            .limit(BATCH)
+        ).fetchall()
+        if not rows:
+            break
+        for story_id, raw in rows:
+            h = content_hash(raw)
+            if h not in seen:
+                conn.execute(blobs.insert().values(hash=h, data=compress(raw)))
+                seen.add(h)
+            conn.execute(
+                stories.update()
+                .where(stories.c.id == story_id)
+                .values(raw_hash=h, raw=None)
+            )
+        last = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    last = ""
+    while True:
+        rows = conn.execute(
+            sa.text(
+                "SELECT s.id, b.data FROM stories s "
+                "JOIN story_blobs b ON b.hash = s.raw_hash "
+                "WHERE s.id > :last ORDER BY s.id LIMIT :batch"
+            ),
+            {"last": last, "batch": BATCH},
+        ).fetchall()
+        if not rows:
+            break
+        for story_id, data in rows:
+            conn.execute(
+                sa.text("UPDATE stories SET raw = :raw WHERE id = :id"),
+                {"raw": decompress(data), "id": story_id},
+            )
+        last = rows[-1][0]
+
+    with op.batch_alter_table("stories") as batch_op:
+        batch_op.drop_constraint("fk_stories_raw_hash", type_="foreignkey")
+        batch_op.drop_column("raw_hash")
+    op.drop_table("story_blobs")
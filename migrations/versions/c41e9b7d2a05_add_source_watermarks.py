@@ -0,0 +1,36 @@
+"""Add source_watermarks table
+
+Revision ID: c41e9b7d2a05
+Revises: 8a3c6e2f4b17
+Create Date: 2025-07-18 11:47:22.904512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41e9b7d2a05"
+down_revision: Union[str, Sequence[str], None] = "8a3c6e2f4b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "source_watermarks",
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("last_published", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_id", sa.String(), nullable=True),
+        sa.Column("updated", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("source"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("source_watermarks")
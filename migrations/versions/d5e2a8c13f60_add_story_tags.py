@@ -0,0 +1,73 @@
+"""Add story_tags table with a covering timeline index
+
+Revision ID: d5e2a8c13f60
+Revises: c41e9b7d2a05
+Create Date: 2025-07-20 09:12:40.118306
+
+"""
+
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e2a8c13f60"
+down_revision: Union[str, Sequence[str], None] = "c41e9b7d2a05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "story_tags",
+        sa.Column("tag", sa.String(), nullable=False),
+        sa.Column("story_id", sa.String(), nullable=False),
+        sa.Column("published", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("source", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["story_id"], ["stories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tag", "story_id"),
+    )
+    op.create_index(
+        "ix_story_tags_timeline",
+        "story_tags",
+        ["tag", sa.text("published DESC"), "story_id", "source"],
+    )
+
+    # backfill from the JSON column
+    conn = op.get_bind()
+    stories = sa.table(
+        "stories",
+        sa.column("id"),
+        sa.column("published"),
+        sa.column("source"),
+        sa.column("tags"),
+    )
+    story_tags = sa.table(
+        "story_tags",
+        sa.column("tag"),
+        sa.column("story_id"),
+        sa.column("published"),
+        sa.column("source"),
+    )
+    rows = []
+    for story_id, published, source, tags in conn.execute(
+        sa.select(stories).where(stories.c.tags.is_not(None))
+    ):
+        if isinstance(tags, str):
+            tags = json.loads(tags)
+        rows += [
+            dict(tag=t, story_id=story_id, published=published, source=source)
+            for t in set(tags or [])
+        ]
+    if rows:
+        conn.execute(story_tags.insert(), rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_story_tags_timeline", table_name="story_tags")
+    op.drop_table("story_tags")
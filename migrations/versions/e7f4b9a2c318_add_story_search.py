@@ -0,0 +1,43 @@
+"""Add full-text search index over story titles and summaries
+
+Revision ID: e7f4b9a2c318
+Revises: d5e2a8c13f60
+Create Date: 2025-07-22 18:41:05.602117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from football_news.storage import fts
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f4b9a2c318"
+down_revision: Union[str, Sequence[str], None] = "d5e2a8c13f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in fts.SQLITE_CREATE:
+            op.execute(statement)
+        op.execute(fts.SQLITE_REBUILD)  # index the existing stories
+    elif dialect == "postgresql":
+        for statement in fts.POSTGRES_CREATE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in fts.SQLITE_DROP:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for statement in fts.POSTGRES_DROP:
+            op.execute(statement)
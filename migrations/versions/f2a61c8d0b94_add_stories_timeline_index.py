@@ -0,0 +1,29 @@
+"""Add (published DESC, id) timeline index on stories for keyset paging
+
+Revision ID: f2a61c8d0b94
+Revises: e7f4b9a2c318
+Create Date: 2025-07-24 10:03:17.284551
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a61c8d0b94"
+down_revision: Union[str, Sequence[str], None] = "e7f4b9a2c318"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_stories_timeline", "stories", [sa.text("published DESC"), "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_stories_timeline", table_name="stories")
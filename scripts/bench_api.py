@@ -0,0 +1,133 @@
+"""
+Per-request cost of the list endpoint: ORM objects + FastAPI's encoder
+(the old handler) vs. column projection + orjson (the current one).
+
+    python -m scripts.bench_api --stories 5000 --limit 200 --requests 200
+
+Both paths run against the same scratch SQLite database, with the
+response cache out of the way. Reports latency percentiles and the peak
+Python memory allocated while building one response.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from football_news.api.main import list_news
+from football_news.storage import db, models  # noqa: F401
+from football_news.storage.models import Story
+
+
+def make_rows(n: int) -> list[dict]:
+    now = dt.datetime.now(dt.timezone.utc)
+    return [
+        dict(
+            id=f"s{i:07d}",
+            title=f"Arsenal story number {i} with a longer headline",
+            link=f"https://example.com/football/2025/story-{i}",
+            source="bench",
+            published=now - dt.timedelta(minutes=i),
+            summary="One sentence summary of what happened in the match. " * 3,
+            tags=["arsenal", "premier-league"],
+            raw="<p>Lorem ipsum dolor sit amet.</p>" * 200,
+        )
+        for i in range(n)
+    ]
+
+
+async def orm_handler(session, limit: int) -> JSONResponse:
+    rows = await session.scalars(
+        select(Story).order_by(Story.published.desc(), Story.id).limit(limit)
+    )
+    dtos = [
+        {
+            "id": r.id,
+            "title": r.title,
+            "link": r.link,
+            "source": r.source,
+            "published": r.published.isoformat(),
+            "summary": r.summary,
+            "tags": r.tags,
+        }
+        for r in rows
+    ]
+    return JSONResponse(jsonable_encoder(dtos))
+
+
+async def projection_handler(session, limit: int):
+    return await list_news(limit=limit, db=session)
+
+
+async def measure(sessions, handler, limit: int, n: int):
+    latencies, peaks = [], []
+    for i in range(n):
+        async with sessions() as s:
+            trace = i % 10 == 0  # tracemalloc slows everything down
+            if trace:
+                tracemalloc.start()
+            t = time.perf_counter()
+            response = await handler(s, limit)
+            elapsed = time.perf_counter() - t
+            if trace:
+                peaks.append(tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+            else:
+                latencies.append(elapsed)
+    return sorted(latencies), max(peaks), len(response.body)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--stories", type=int, default=5000)
+    ap.add_argument("--limit", type=int, default=200)
+    ap.add_argument("--requests", type=int, default=200)
+    args = ap.parse_args()
+
+    scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    setup = create_engine(f"sqlite:///{scratch.name}")
+    db.Base.metadata.create_all(setup)
+    with setup.begin() as conn:
+        conn.execute(insert(Story), make_rows(args.stories))
+    setup.dispose()
+
+    async def run():
+        engine = db.make_async_engine(f"sqlite:///{scratch.name}", read_only=True)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        print(
+            f"{'handler':>11} {'p50 ms':>7} {'p95 ms':>7} {'peak KiB':>9} "
+            f"{'body KiB':>9}"
+        )
+        for name, handler in (("orm", orm_handler), ("projection", projection_handler)):
+            await measure(sessions, handler, args.limit, 10)  # warm up
+            lat, peak, size = await measure(
+                sessions, handler, args.limit, args.requests
+            )
+            print(
+                f"{name:>11} {statistics.median(lat) * 1000:7.2f} "
+                f"{lat[int(len(lat) * 0.95)] * 1000:7.2f} "
+                f"{peak / 1024:9.0f} {size / 1024:9.1f}"
+            )
+        await engine.dispose()
+
+    try:
+        asyncio.run(run())
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(scratch.name + suffix):
+                os.unlink(scratch.name + suffix)
+
+
+if __name__ == "__main__":
+    main()
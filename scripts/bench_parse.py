@@ -0,0 +1,92 @@
+"""
+Parse-cycle benchmark: wall time of parsing N feeds vs. parse worker count.
+
+    python -m scripts.bench_parse --feeds 40 --items 100
+
+Each feed is a synthetic RSS document; all feeds of a cycle are parsed
+concurrently through ``run_parse`` exactly as the fetchers do it. A second
+"loop lag" column shows the worst delay a 10 ms ticker on the event loop saw
+while the cycle ran – the number that matters for in-flight fetches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from football_news.fetchers import parsing
+
+
+def make_feed(n: int, seed: int) -> bytes:
+    items = "".join(
+        f"<item><title>Story {seed}-{i} Arsenal Chelsea Liverpool</title>"
+        f"<link>https://example.com/{seed}/{i}</link>"
+        f"<pubDate>Sun, 06 Jul 2025 10:{i % 60:02d}:00 GMT</pubDate>"
+        f"<description>{'Lorem ipsum dolor sit amet. ' * 40}</description></item>"
+        for i in range(n)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>bench</title>'
+        f"{items}</channel></rss>"
+    ).encode()
+
+
+async def _cycle(feeds: list[bytes]) -> tuple[float, float]:
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            t = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lag = max(lag, time.perf_counter() - t - 0.01)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            parsing.run_parse(parsing.parse_feed, f, f"feed{i}")
+            for i, f in enumerate(feeds)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    return elapsed, lag
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--feeds", type=int, default=40)
+    ap.add_argument("--items", type=int, default=100)
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--executor", choices=["process", "thread"], default="process")
+    args = ap.parse_args()
+
+    feeds = [make_feed(args.items, i) for i in range(args.feeds)]
+    print(
+        f"{args.feeds} feeds x {args.items} items, {sum(map(len, feeds)) / 1e6:.1f} MB"
+    )
+    print(f"{'workers':>8} {'cycle s':>9} {'loop lag ms':>12}")
+
+    parsing.shutdown_executor()
+    parsing.PARSE_EXECUTOR = "inline"
+    elapsed, lag = asyncio.run(_cycle(feeds))
+    print(f"{'inline':>8} {elapsed:9.3f} {lag * 1000:12.1f}")
+
+    pool = ProcessPoolExecutor if args.executor == "process" else ThreadPoolExecutor
+    for workers in range(1, args.max_workers + 1):
+        parsing._executor = pool(workers)
+        parsing.PARSE_EXECUTOR = args.executor
+        asyncio.run(_cycle(feeds[:1]))  # warm the pool
+        elapsed, lag = asyncio.run(_cycle(feeds))
+        print(f"{workers:>8} {elapsed:9.3f} {lag * 1000:12.1f}")
+        parsing.shutdown_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+HTML extraction benchmark: BeautifulSoup + soupsieve vs. precompiled lxml XPath.
+
+    python -m scripts.bench_selectors                    # synthetic list page
+    python -m scripts.bench_selectors page.html --source reuters_soccer
+
+Pass recorded pages (e.g. saved with ``curl -o``) to benchmark against real
+markup; ``--source`` picks the html.yml entry whose selectors are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from football_news.config_loader import load_html_cfg
+from football_news.fetchers.selectors import engine_for
+
+SYNTHETIC_CFG = {
+    "name": "synthetic",
+    "url": "https://example.com/news",
+    "list_selector": "article.story",
+    "link_selector": "a::attr(href)",
+    "title_selector": "h3.story-title",
+    "date_selector": "time::attr(datetime)",
+}
+
+
+def synthetic_page(n: int = 200) -> bytes:
+    items = "".join(
+        f'<article class="story card"><div class="media"><img src="/i/{i}.jpg"></div>'
+        f'<a href="/news/{i}"><h3 class="story-title">Arsenal story {i}</h3></a>'
+        f'<time datetime="2025-07-06T10:{i % 60:02d}:00Z">6 Jul</time>'
+        f"<p>{'Teaser text. ' * 20}</p></article>"
+        for i in range(n)
+    )
+    nav = "<nav>" + "".join(f'<a href="/s/{i}">s{i}</a>' for i in range(300)) + "</nav>"
+    return f"<html><body>{nav}<main>{items}</main></body></html>".encode()
+
+
+def _strip_pseudo(css: str) -> tuple[str, str | None]:
+    m = re.search(r"::attr\((\w+)\)$", css)
+    return (css[: m.start()], m.group(1)) if m else (css, None)
+
+
+def bs4_extract(content: bytes, cfg: dict) -> list[tuple]:
+    """The pre-engine path: build a soup and interpret selectors every time."""
+    soup = BeautifulSoup(content, "lxml")
+    link_css, link_attr = _strip_pseudo(cfg["link_selector"])
+    date_css, date_attr = _strip_pseudo(cfg.get("date_selector") or "")
+    out = []
+    for item in soup.select(cfg["list_selector"]):
+        link = item.select_one(link_css)
+        title = item.select_one(cfg["title_selector"])
+        date = item.select_one(date_css) if date_css else None
+        out.append(
+            (
+                link.get(link_attr or "href") if link else None,
+                title.get_text(strip=True) if title else None,
+                (
+                    (date.get(date_attr or "datetime") or date.get_text(strip=True))
+                    if date
+                    else None
+                ),
+            )
+        )
+    return out
+
+
+def lxml_extract(content: bytes, cfg: dict) -> list[tuple]:
+    return [tuple(e) for e in engine_for(cfg).extract(content)]
+
+
+def bench(fn, content: bytes, cfg: dict, rounds: int) -> float:
+    fn(content, cfg)  # warm-up (and selector compilation for the engine)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(content, cfg)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pages", nargs="*", type=Path)
+    ap.add_argument("--source", help="html.yml source whose selectors to use")
+    ap.add_argument("--rounds", type=int, default=50)
+    args = ap.parse_args()
+
+    if args.pages:
+        cfg = next(c for c in load_html_cfg() if c["name"] == args.source)
+        pages = [(p.name, p.read_bytes()) for p in args.pages]
+    else:
+        cfg = SYNTHETIC_CFG
+        pages = [("synthetic", synthetic_page())]
+
+    print(f"{'page':<24} {'items':>6} {'bs4 ms':>9} {'lxml ms':>9} {'speed-up':>9}")
+    for name, content in pages:
+        items = lxml_extract(content, cfg)
+        assert items == bs4_extract(content, cfg), "extractors disagree"
+        old = bench(bs4_extract, content, cfg, args.rounds)
+        new = bench(lxml_extract, content, cfg, args.rounds)
+        print(
+            f"{name:<24} {len(items):>6} {old * 1000:9.2f} {new * 1000:9.2f} "
+            f"{old / new:8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
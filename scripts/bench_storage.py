@@ -0,0 +1,113 @@
+"""
+Mixed read/write benchmark for the SQLite storage profiles.
+
+    python -m scripts.bench_storage --seconds 5 --readers 8
+
+For each profile a scratch database is seeded, then one writer inserts
+batches through the ingest queue (as the fetchers do) while ``--readers``
+API-style clients run the ``/v1/news`` list query on the read engine.
+Reports write throughput, read throughput and read latency percentiles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from football_news.storage import db, models  # noqa: F401
+from football_news.storage.ingest import IngestQueue
+from football_news.storage.models import Story
+
+
+def make_rows(start: int, n: int) -> list[dict]:
+    now = dt.datetime.now(dt.timezone.utc)
+    return [
+        dict(
+            id=f"s{i}",
+            title=f"Arsenal story {i}",
+            link=f"https://example.com/{i}",
+            source="bench",
+            published=now - dt.timedelta(seconds=i),
+            raw="Lorem ipsum dolor sit amet. " * 20,
+        )
+        for i in range(start, start + n)
+    ]
+
+
+async def run_profile(
+    profile: str, path: str, args
+) -> tuple[float, float, list[float]]:
+    url = f"sqlite:///{path}"
+    writer = db.make_async_engine(url, profile)
+    reader = db.make_async_engine(url, profile, read_only=True, pool_size=args.readers)
+    queue = IngestQueue(flush_ms=0, session_factory=async_sessionmaker(writer))
+    reads = async_sessionmaker(reader)
+
+    await queue.submit(make_rows(0, args.seed))
+    stop = time.perf_counter() + args.seconds
+    written, latencies = 0, []
+
+    async def write():
+        nonlocal written
+        n = args.seed
+        while time.perf_counter() < stop:
+            written += await queue.submit(make_rows(n, args.batch))
+            n += args.batch
+
+    async def read():
+        qry = select(Story).order_by(Story.published.desc()).limit(50)
+        while time.perf_counter() < stop:
+            t = time.perf_counter()
+            async with reads() as s:
+                (await s.scalars(qry)).all()
+            latencies.append(time.perf_counter() - t)
+
+    await asyncio.gather(write(), *(read() for _ in range(args.readers)))
+    await queue.close()
+    await writer.dispose()
+    await reader.dispose()
+    return written / args.seconds, len(latencies) / args.seconds, latencies
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--profiles", nargs="+", default=list(db.PROFILES))
+    ap.add_argument("--seconds", type=float, default=5)
+    ap.add_argument("--readers", type=int, default=8)
+    ap.add_argument("--batch", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=20000)
+    args = ap.parse_args()
+
+    print(
+        f"{'profile':>8} {'writes/s':>9} {'reads/s':>8} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}"
+    )
+    for profile in args.profiles:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        try:
+            setup = create_engine(f"sqlite:///{scratch.name}")
+            db.Base.metadata.create_all(setup)
+            setup.dispose()
+            writes, reads, lat = asyncio.run(run_profile(profile, scratch.name, args))
+            lat.sort()
+            print(
+                f"{profile:>8} {writes:9.0f} {reads:8.0f} "
+                f"{statistics.median(lat) * 1000:7.1f} "
+                f"{lat[int(len(lat) * 0.95)] * 1000:7.1f} {lat[-1] * 1000:7.1f}"
+            )
+        finally:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(scratch.name + suffix):
+                    os.unlink(scratch.name + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 import pytest
 
 from football_news.storage.db import Base, engine
+from football_news.storage import models  # noqa: F401  (register all tables)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -15,13 +16,19 @@ def create_test_tables():
 @pytest.fixture(autouse=True)
 def clean_db(create_test_tables):  # Add dependency on create_test_tables
     """Clean database before each test."""
+    from football_news.api.cache import response_cache
+    from football_news.fetchers.health import health
     from football_news.storage.db import SessionLocal
-    from football_news.storage.models import Story
+    from football_news.storage.seen import seen_ids
 
     session = SessionLocal()
     try:
-        session.query(Story).delete()
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(table.delete())
         session.commit()
     finally:
         session.close()
+    seen_ids.reset()
+    health.reset()
+    response_cache.clear()
     yield
@@ -8,3 +8,143 @@ def test_list_endpoint():
     r = client.get("/v1/news?limit=1")
     assert r.status_code == 200
     assert isinstance(r.json(), list)
+
+
+def _seed():
+    import datetime as dt
+
+    from football_news.storage.db import SessionLocal
+    from football_news.storage.models import Story, StoryTag
+
+    stories = [
+        ("s1", "bbc", dt.datetime(2025, 7, 1, 12), ["arsenal"]),
+        ("s2", "guardian", dt.datetime(2025, 7, 2, 12), ["arsenal", "chelsea"]),
+        ("s3", "bbc", dt.datetime(2025, 7, 3, 12), ["chelsea"]),
+        ("s4", "bbc", dt.datetime(2025, 7, 4, 12), ["liverpool"]),
+    ]
+    s = SessionLocal()
+    try:
+        for sid, source, published, tags in stories:
+            s.add(
+                Story(
+                    id=sid,
+                    title=sid,
+                    link=f"https://example.com/{sid}",
+                    source=source,
+                    published=published,
+                    tags=tags,
+                )
+            )
+            s.flush()
+            s.add_all(
+                StoryTag(tag=t, story_id=sid, published=published, source=source)
+                for t in tags
+            )
+        s.commit()
+    finally:
+        s.close()
+
+
+def _ids(url: str) -> list[str]:
+    r = client.get(url)
+    assert r.status_code == 200, r.text
+    return [s["id"] for s in r.json()]
+
+
+def test_tag_filters_use_story_tags():
+    _seed()
+    assert _ids("/v1/top?club=arsenal") == ["s2", "s1"]
+    assert _ids("/v1/news?tag=arsenal&tag=chelsea") == ["s3", "s2", "s1"]
+    assert _ids("/v1/news?tag=arsenal&tag=chelsea&match=all") == ["s2"]
+    assert _ids("/v1/news?tag=chelsea&source=bbc") == ["s3"]
+    assert _ids(
+        "/v1/news?tag=arsenal&tag=chelsea&since=2025-07-02T00:00:00Z"
+        "&until=2025-07-03T00:00:00Z"
+    ) == ["s2"]
+    assert _ids("/v1/news?tag=chelsea&q=s2") == ["s2"]
+    assert _ids("/v1/news?source=bbc&limit=2") == ["s4", "s3"]
+
+
+def _pages(url: str) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        r = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        assert r.status_code == 200, r.text
+        pages.append([s["id"] for s in r.json()])
+        cursor = r.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
+def test_cursor_pagination():
+    _seed()
+    assert _pages("/v1/news?limit=3") == [["s4", "s3", "s2"], ["s1"]]
+    assert _pages("/v1/news?limit=2") == [["s4", "s3"], ["s2", "s1"], []]
+    assert _pages("/v1/news?source=bbc&limit=1") == [["s4"], ["s3"], ["s1"], []]
+    assert _pages("/v1/top?club=arsenal&limit=1") == [["s2"], ["s1"], []]
+    assert _pages("/v1/news?tag=arsenal&tag=chelsea&limit=2") == [
+        ["s3", "s2"],
+        ["s1"],
+    ]
+    assert client.get("/v1/news?cursor=nonsense").status_code == 400
+    assert client.get("/v1/news?q=s1&cursor=nonsense").status_code == 400
+
+
+def test_cursor_breaks_timestamp_ties_by_id():
+    import datetime as dt
+
+    from football_news.storage.db import SessionLocal
+    from football_news.storage.models import Story
+
+    same = dt.datetime(2025, 7, 1, 12)
+    s = SessionLocal()
+    s.add_all(
+        Story(id=f"t{i}", title="t", link="https://example.com", published=same)
+        for i in range(5)
+    )
+    s.commit()
+    s.close()
+    pages = _pages("/v1/news?limit=2")
+    assert pages == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+
+
+def test_naive_cursor_is_read_as_utc(monkeypatch):
+    import base64
+    import datetime as dt
+    import time
+
+    from football_news.storage.paging import decode_cursor
+
+    monkeypatch.setenv("TZ", "America/New_York")  # a host not running on UTC
+    time.tzset()
+    try:
+        raw = b'["2025-07-01T12:00:00","s1"]'  # no offset, as SQLite stores it
+        token = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+        cursor = decode_cursor(token)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    assert cursor.published == dt.datetime(2025, 7, 1, 12, tzinfo=dt.timezone.utc)
+
+
+def test_reads_select_only_dto_columns():
+    from sqlalchemy import event
+
+    from football_news.storage.db import read_engine
+
+    _seed()
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(read_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        assert _ids("/v1/news?limit=2") == ["s4", "s3"]
+        assert _ids("/v1/top?club=chelsea") == ["s3", "s2"]
+        published = client.get("/v1/news/s1").json()["published"]
+        assert published == "2025-07-01T12:00:00+00:00"
+    finally:
+        event.remove(read_engine.sync_engine, "before_cursor_execute", capture)
+    story_reads = [s for s in statements if "FROM stories" in s]
+    assert story_reads and not any("raw" in s for s in story_reads)
@@ -0,0 +1,85 @@
+import datetime as dt
+
+import pytest
+from fastapi.testclient import TestClient
+
+from football_news.api import cache
+from football_news.api.cache import ResponseCache, cache_key, response_cache
+from football_news.api.main import app
+from football_news.storage.db import SessionLocal
+from football_news.storage.ingest import IngestQueue
+from football_news.storage.models import Story
+
+client = TestClient(app)
+
+
+def _story(sid: str, title: str = "Arsenal win " * 60) -> dict:
+    return dict(
+        id=sid,
+        title=title,
+        link=f"https://example.com/{sid}",
+        source="bbc",
+        published=dt.datetime(2025, 7, 1, tzinfo=dt.timezone.utc),
+    )
+
+
+def _add_silently(sid: str):
+    # bypasses the writers, so the data version does not move
+    with SessionLocal() as s:
+        s.add(Story(**_story(sid)))
+        s.commit()
+
+
+def test_cache_key_normalizes_parameter_order():
+    assert cache_key(3, "/v1/news", b"tag=b&tag=a&limit=5") == cache_key(
+        3, "/v1/news", b"limit=5&tag=a&tag=b"
+    )
+    assert cache_key(3, "/v1/news", b"") != cache_key(4, "/v1/news", b"")
+
+
+@pytest.mark.asyncio
+async def test_lru_is_bounded_by_bytes():
+    c = ResponseCache(max_bytes=300, shared=False)
+    for i in range(4):
+        await c.put(f"k{i}", b"x" * 100, [])
+    assert list(c._entries) == ["k1", "k2", "k3"] and c._bytes == 300
+    assert await c.get("k1") is not None  # now most recently used
+    await c.put("k4", b"x" * 100, [])
+    assert list(c._entries) == ["k3", "k1", "k4"]
+
+
+def test_etag_304_and_precompressed_bodies():
+    _add_silently("a")
+    r = client.get("/v1/news?limit=5", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200 and "content-encoding" not in r.headers
+    etag = r.headers["etag"]
+
+    r2 = client.get("/v1/news?limit=5", headers={"If-None-Match": etag})
+    assert r2.status_code == 304 and r2.content == b""
+
+    for encoding in ("gzip", "br"):
+        r3 = client.get("/v1/news?limit=5", headers={"Accept-Encoding": encoding})
+        assert r3.headers["content-encoding"] == encoding
+        assert r3.headers["etag"] == etag[:-1] + f'-{encoding}"'
+        assert r3.json() == r.json()
+        assert response_cache.hits >= 2
+
+
+@pytest.mark.asyncio
+async def test_writers_invalidate_through_the_version(monkeypatch):
+    monkeypatch.setattr(cache, "VERSION_TTL", 0)
+    _add_silently("a")
+    first = client.get("/v1/news").json()
+    _add_silently("b")
+    assert client.get("/v1/news").json() == first  # served from cache
+
+    q = IngestQueue(flush_ms=0)
+    assert await q.submit([_story("c")]) == 1  # bumps the version
+    await q.close()
+    assert {s["id"] for s in client.get("/v1/news").json()} == {"a", "b", "c"}
+
+
+def test_errors_are_not_cached():
+    assert client.get("/v1/news/late").status_code == 404
+    _add_silently("late")
+    assert client.get("/v1/news/late").status_code == 200
@@ -0,0 +1,115 @@
+import datetime as dt
+
+import pyarrow.parquet as pq
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
+
+from football_news.api.main import app
+from football_news.storage import archive
+from football_news.storage.blobs import split_raw
+from football_news.storage.db import SessionLocal
+from football_news.storage.models import Story, StoryBlob, StoryTag
+from football_news.storage.paging import decode_cursor
+
+UTC = dt.timezone.utc
+
+
+def _seed():
+    stories = [
+        ("old1", dt.datetime(2025, 3, 10, tzinfo=UTC), ["arsenal"]),
+        ("old2", dt.datetime(2025, 3, 20, tzinfo=UTC), ["chelsea"]),
+        ("old3", dt.datetime(2025, 4, 2, tzinfo=UTC), ["arsenal", "chelsea"]),
+        ("new1", dt.datetime(2025, 7, 1, tzinfo=UTC), ["arsenal"]),
+    ]
+    rows, blobs = split_raw(
+        [
+            dict(
+                id=sid,
+                title=f"Story {sid}",
+                link=f"https://example.com/{sid}",
+                source="bbc" if sid != "old2" else "guardian",
+                published=published,
+                tags=tags,
+                raw=f"body of {sid}",
+            )
+            for sid, published, tags in stories
+        ]
+    )
+    with SessionLocal() as s:
+        s.execute(insert(StoryBlob), blobs)
+        s.execute(insert(Story), rows)
+        s.execute(
+            insert(StoryTag),
+            [
+                dict(tag=t, story_id=sid, published=published, source="bbc")
+                for sid, published, tags in stories
+                for t in tags
+            ],
+        )
+        s.commit()
+
+
+def test_archive_moves_old_months_and_prunes(tmp_path):
+    _seed()
+    before = dt.datetime(2025, 6, 1, tzinfo=UTC)
+    assert archive.archive(before, root=tmp_path) == {"2025-03": 2, "2025-04": 1}
+    assert archive.months(tmp_path) == ["2025-03", "2025-04"]
+
+    with SessionLocal() as s:
+        assert s.scalars(select(Story.id)).all() == ["new1"]
+        assert s.scalar(select(func.count()).select_from(StoryTag)) == 1
+        assert s.scalar(select(func.count()).select_from(StoryBlob)) == 1
+
+    march = pq.read_table(archive.month_path(tmp_path, "2025-03")).to_pylist()
+    assert [(r["id"], r["raw"], r["tags"]) for r in march] == [
+        ("old2", "body of old2", ["chelsea"]),
+        ("old1", "body of old1", ["arsenal"]),
+    ]
+
+    # a re-run (e.g. after a crash before pruning) merges instead of duplicating
+    with SessionLocal() as s:
+        s.add(
+            Story(
+                id="old1",
+                title="Story old1, edited",
+                link="https://example.com/old1",
+                published=dt.datetime(2025, 3, 10, tzinfo=UTC),
+            )
+        )
+        s.commit()
+    assert archive.archive(before, root=tmp_path, vacuum=False) == {"2025-03": 1}
+    march = pq.read_table(archive.month_path(tmp_path, "2025-03")).to_pylist()
+    assert [(r["id"], r["title"]) for r in march] == [
+        ("old2", "Story old2"),
+        ("old1", "Story old1, edited"),
+    ]
+
+
+def test_read_filters_and_pages(tmp_path, monkeypatch):
+    _seed()
+    archive.archive(dt.datetime(2025, 6, 1, tzinfo=UTC), root=tmp_path)
+
+    ids = lambda rows: [r["id"] for r in rows]  # noqa: E731
+    assert ids(archive.read(root=tmp_path)) == ["old3", "old2", "old1"]
+    assert ids(archive.read(tags=["arsenal"], root=tmp_path)) == ["old3", "old1"]
+    assert ids(
+        archive.read(tags=["arsenal", "chelsea"], match="all", root=tmp_path)
+    ) == ["old3"]
+    assert ids(archive.read(sources=["guardian"], root=tmp_path)) == ["old2"]
+    assert ids(
+        archive.read(
+            since=dt.datetime(2025, 3, 15),
+            until=dt.datetime(2025, 4, 30),
+            root=tmp_path,
+        )
+    ) == ["old3", "old2"]
+    assert "raw" not in archive.read(root=tmp_path)[0]
+
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", str(tmp_path))
+    client = TestClient(app)
+    r = client.get("/v1/archive?limit=2")
+    assert [s["id"] for s in r.json()] == ["old3", "old2"]
+    cursor = r.headers["X-Next-Cursor"]
+    assert decode_cursor(cursor).id == "old2"
+    r = client.get(f"/v1/archive?limit=2&cursor={cursor}")
+    assert [s["id"] for s in r.json()] == ["old1"]
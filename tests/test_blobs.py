@@ -0,0 +1,39 @@
+import datetime as dt
+
+import pytest
+
+from football_news.storage.db import AsyncSessionLocal, SessionLocal
+from football_news.storage.models import Story, StoryBlob
+from football_news.storage.stories import insert_stories
+
+
+def _row(i: int, raw: str | None) -> dict:
+    return dict(
+        id=f"id{i}",
+        title=f"title {i}",
+        link=f"https://example.com/{i}",
+        source="test",
+        published=dt.datetime(2025, 7, 6, tzinfo=dt.timezone.utc),
+        raw=raw,
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_bodies_share_one_compressed_blob():
+    body = "<p>Arsenal sign a striker.</p>" * 50
+    async with AsyncSessionLocal() as s:
+        await insert_stories(s, [_row(1, body), _row(2, body), _row(3, None)])
+        await s.commit()
+
+    s = SessionLocal()
+    try:
+        assert s.query(StoryBlob).count() == 1
+        blob = s.query(StoryBlob).one()
+        assert len(blob.data) < len(body)
+
+        story = s.get(Story, "id2")
+        assert "blob" not in story.__dict__  # not loaded until asked for
+        assert story.raw_text == body
+        assert s.get(Story, "id3").raw_text is None
+    finally:
+        s.close()
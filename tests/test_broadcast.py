@@ -0,0 +1,212 @@
+import asyncio
+import datetime as dt
+import json
+import time
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from fastapi.testclient import TestClient
+
+from football_news import broadcast
+from football_news.api import stream
+from football_news.api.main import app
+from football_news.broadcast import Hub, StreamFilter
+from football_news.storage.ingest import IngestQueue
+
+client = TestClient(app)
+WHEN = dt.datetime(2025, 7, 6, 10, 0, tzinfo=dt.timezone.utc)
+
+
+def _story(id: str, source: str = "bbc", tags=None) -> dict:
+    return dict(
+        id=id,
+        title=f"Story {id}",
+        link=f"https://example.com/{id}",
+        source=source,
+        published=WHEN,
+        raw="body",
+        tags=tags,
+    )
+
+
+@pytest.fixture
+def local_hub(monkeypatch):
+    """The shared hub, without the Redis relay."""
+    monkeypatch.setattr(broadcast.hub, "bridge", False)
+    return broadcast.hub
+
+
+def test_filter_matches_source_and_any_tag():
+    flt = StreamFilter.of(["arsenal", "chelsea"], ["bbc"])
+
+    assert flt.matches(_story("a", "bbc", ["arsenal"]))
+    assert not flt.matches(_story("b", "guardian", ["arsenal"]))
+    assert not flt.matches(_story("c", "bbc", None))  # not enriched yet
+    assert StreamFilter().matches(_story("d", "guardian"))
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_matching_subscribers():
+    hub = Hub(bridge=False)
+    everything = hub.subscribe()
+    bbc = hub.subscribe(StreamFilter.of(None, ["bbc"]))
+
+    await hub.publish("new", [_story("a", "bbc"), _story("b", "guardian")])
+
+    assert [(await everything.get())["story"]["id"] for _ in range(2)] == ["a", "b"]
+    event = await bbc.get()
+    assert event["event"] == "new" and event["story"]["id"] == "a"
+    assert "raw" not in event["story"]
+    assert event["story"]["published"] == WHEN.isoformat()
+    assert bbc.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_evicted_without_holding_up_others():
+    hub = Hub(buffer=2, bridge=False)
+    slow, fast = hub.subscribe(), hub.subscribe()
+
+    for i in range(3):
+        await hub.publish("new", [_story(f"s{i}")])
+        await fast.get()
+
+    assert await slow.get() is None
+    assert slow.evicted and hub.evictions == 1
+    assert hub.subscribers == 1
+
+    await hub.publish("new", [_story("later")])
+    assert (await fast.get())["story"]["id"] == "later"
+
+
+@pytest.mark.asyncio
+async def test_ingest_publishes_only_new_rows(local_hub):
+    sub = local_hub.subscribe()
+    q = IngestQueue(flush_ms=1)
+    try:
+        await q.submit([_story("a"), _story("b")])
+        await q.submit([_story("a")])  # already stored
+        await q.close()
+
+        got = [(await sub.get())["story"]["id"] for _ in range(2)]
+        assert sorted(got) == ["a", "b"] and sub.queue.empty()
+    finally:
+        sub.close()
+
+
+@pytest.mark.asyncio
+async def test_sse_frames_events_and_eviction():
+    hub = Hub(buffer=1, bridge=False)
+    events = stream.sse(StreamFilter.of(None, ["bbc"]), hub)
+
+    assert b"connected" in await events.__anext__()  # subscribed from here on
+    await hub.publish("enriched", [_story("a", tags=["arsenal"])])
+    frame = (await events.__anext__()).decode()
+    assert frame.startswith("id: a\nevent: enriched\ndata: ")
+    assert json.loads(frame.split("data: ", 1)[1])["tags"] == ["arsenal"]
+
+    await hub.publish("new", [_story("b"), _story("c")])  # overflows the buffer
+    assert (await events.__anext__()).startswith(b"event: evicted")
+    with pytest.raises(StopAsyncIteration):
+        await events.__anext__()
+    assert hub.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_sse_sends_heartbeats_when_idle(monkeypatch):
+    monkeypatch.setattr(stream, "HEARTBEAT", 0.01)
+    hub = Hub(bridge=False)
+    events = stream.sse(StreamFilter(), hub)
+
+    await events.__anext__()
+    assert await events.__anext__() == b": ping\n\n"
+    await events.aclose()
+    assert hub.subscribers == 0
+
+
+def test_websocket_stream_filters_by_source(local_hub):
+    with client.websocket_connect("/v1/stream/ws?source=bbc") as ws:
+        assert ws.receive_json() == {"event": "ready"}
+        local_hub.dispatch("new", [broadcast._dto(_story("g", "guardian"))])
+        local_hub.dispatch("new", [broadcast._dto(_story("b", "bbc"))])
+
+        event = ws.receive_json()
+        assert event["event"] == "new" and event["story"]["id"] == "b"
+
+    for _ in range(100):  # the app notices the disconnect on its own thread
+        if not local_hub.subscribers:
+            break
+        time.sleep(0.01)
+    assert local_hub.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_relay_delivers_across_hubs_after_idling(monkeypatch):
+    monkeypatch.setattr(broadcast, "POLL", 0.05)
+    server = fakeredis.FakeServer()
+    api = Hub(client=fakeredis.aioredis.FakeRedis(server=server))
+    worker = Hub(client=fakeredis.aioredis.FakeRedis(server=server))
+    sub = api.subscribe(StreamFilter.of(None, ["bbc"]))
+    try:
+        await asyncio.sleep(0.5)  # many empty polls, no reconnects in between
+        await worker.publish("enriched", [_story("a", tags=["arsenal"])])
+
+        event = await asyncio.wait_for(sub.get(), 2)
+        assert event["event"] == "enriched" and event["story"]["id"] == "a"
+    finally:
+        await api.close()
+        sub.close()
+
+
+@pytest.mark.asyncio
+async def test_malformed_relay_message_is_skipped(monkeypatch):
+    monkeypatch.setattr(broadcast, "POLL", 0.05)
+    server = fakeredis.FakeServer()
+    api = Hub(client=fakeredis.aioredis.FakeRedis(server=server))
+    worker = Hub(client=fakeredis.aioredis.FakeRedis(server=server))
+    raw = fakeredis.aioredis.FakeRedis(server=server)
+    sub = api.subscribe()
+    try:
+        await asyncio.sleep(0.2)
+        await raw.publish(broadcast.CHANNEL, b"not json")
+        await raw.publish(broadcast.CHANNEL, b'{"origin": "elsewhere"}')
+        await worker.publish("new", [_story("a")])
+
+        event = await asyncio.wait_for(sub.get(), 2)
+        assert event["story"]["id"] == "a"
+        assert not api._listener.done()
+    finally:
+        await api.close()
+        sub.close()
+
+
+@pytest.mark.asyncio
+async def test_dead_listener_is_restarted(monkeypatch):
+    monkeypatch.setattr(broadcast, "POLL", 0.05)
+    monkeypatch.setattr(broadcast, "RECONNECT_AFTER", 0.05)
+    server = fakeredis.FakeServer()
+    api = Hub(client=fakeredis.aioredis.FakeRedis(server=server))
+    worker = Hub(client=fakeredis.aioredis.FakeRedis(server=server))
+    relayed, calls = api._relayed, []
+
+    def flaky(data):
+        calls.append(data)
+        if len(calls) == 1:
+            raise RuntimeError("bug")  # not a decode error: kills the listener
+        relayed(data)
+
+    monkeypatch.setattr(api, "_relayed", flaky)
+    sub = api.subscribe()
+    try:
+        await asyncio.sleep(0.2)
+        first = api._listener
+        await worker.publish("new", [_story("a")])
+        await asyncio.sleep(0.3)
+        assert api._listener is not first and not api._listener.done()
+
+        await worker.publish("new", [_story("b")])
+        event = await asyncio.wait_for(sub.get(), 2)
+        assert event["story"]["id"] == "b"
+    finally:
+        await api.close()
+        sub.close()
@@ -0,0 +1,80 @@
+import datetime as dt
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+
+from football_news.storage import bulk, db
+from football_news.storage.models import HttpValidator, Story
+
+PG_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def _sql(stmt, dialect) -> str:
+    return " ".join(str(stmt.compile(dialect=dialect)).split())
+
+
+def test_statements_compile_for_both_dialects():
+    for name, dialect in (
+        ("sqlite", sqlite.dialect()),
+        ("postgresql", postgresql.dialect()),
+    ):
+        sql = _sql(bulk.insert_ignore_stmt(name, Story, Story.id), dialect)
+        assert "ON CONFLICT DO NOTHING RETURNING" in sql
+
+        sql = _sql(bulk.upsert_stmt(name, HttpValidator, ["url", "etag"]), dialect)
+        assert "ON CONFLICT (url) DO UPDATE SET etag = excluded.etag" in sql
+
+    with pytest.raises(NotImplementedError):
+        bulk.insert_ignore_stmt("mysql", Story)
+
+
+def _rows(n: int) -> list[dict]:
+    return [
+        dict(id=f"s{i}", title="t", link="https://example.com", source="x")
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_insert_ignore_and_upsert_sqlite():
+    async with db.AsyncSessionLocal() as s:
+        assert await bulk.insert_ignore(s, Story, _rows(3), returning=Story.id) == [
+            "s0",
+            "s1",
+            "s2",
+        ]
+        assert await bulk.insert_ignore(s, Story, _rows(4), returning=Story.id) == [
+            "s3"
+        ]
+        for etag in ("a", "b"):
+            await bulk.upsert(s, HttpValidator, [dict(url="u", etag=etag)])
+        await s.commit()
+        assert (await s.get(HttpValidator, "u")).etag == "b"
+
+
+@pytest.mark.skipif(not PG_URL, reason="TEST_POSTGRES_URL not set")
+@pytest.mark.asyncio
+async def test_copy_staging_postgres(monkeypatch):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    engine = db.make_async_engine(PG_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(db.Base.metadata.drop_all)
+        await conn.run_sync(db.Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(bulk, "COPY_ROWS", 2)
+    try:
+        async with sessions() as s:
+            new = await bulk.insert_ignore(s, Story, _rows(3), returning=Story.id)
+            assert sorted(new) == ["s0", "s1", "s2"]
+            new = await bulk.insert_ignore(s, Story, _rows(5), returning=Story.id)
+            assert sorted(new) == ["s3", "s4"]
+            await s.commit()
+            story = await s.get(Story, "s4")
+            assert story.published is not None  # Python default applied
+            assert story.published <= dt.datetime.now(dt.timezone.utc)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(db.Base.metadata.drop_all)
+        await engine.dispose()
@@ -0,0 +1,79 @@
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+
+from football_news.fetchers import cassette
+from football_news.fetchers.cassette import (
+    CassetteStore,
+    RecordingTransport,
+    ReplayTransport,
+)
+from football_news.fetchers.http_client import HttpClientManager
+
+URL = "https://content.example.com/search?section=football&api-key=SECRET"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_record_then_replay(tmp_path):
+    respx.get(URL).respond(200, text="<rss/>", headers={"ETag": '"v1"'})
+    store = CassetteStore(tmp_path)
+
+    async with httpx.AsyncClient(
+        transport=RecordingTransport(store, httpx.AsyncHTTPTransport())
+    ) as client:
+        assert (await client.get(URL)).text == "<rss/>"
+
+    (path,) = tmp_path.rglob("*.json.gz")
+    record = json.loads(gzip.decompress(path.read_bytes()))
+    assert "SECRET" not in record["url"]
+
+    respx.reset()
+    replay = ReplayTransport(store)
+    async with httpx.AsyncClient(transport=replay) as client:
+        # recorded with one key, replayed with another
+        r = await client.get(URL.replace("SECRET", "OTHER"))
+        missing = await client.get("https://content.example.com/other")
+    assert r.status_code == 200 and r.text == "<rss/>"
+    assert r.headers["etag"] == '"v1"' and r.headers["x-cassette"] == "hit"
+    assert missing.status_code == 504
+    assert (replay.hits, replay.misses) == (1, 1)
+    assert not respx.calls
+
+
+@pytest.mark.asyncio
+async def test_client_manager_uses_replay_mode(tmp_path, monkeypatch):
+    request = httpx.Request("GET", "https://example.com/feed")
+    CassetteStore(tmp_path).save(request, httpx.Response(200, text="cached"), 0.0)
+    monkeypatch.setattr(cassette, "CASSETTE_MODE", "replay")
+    monkeypatch.setattr(cassette, "CASSETTE_DIR", str(tmp_path))
+
+    manager = HttpClientManager()
+    try:
+        assert (await manager.get("https://example.com/feed")).text == "cached"
+    finally:
+        await manager.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_recording_a_conditional_get_keeps_the_body(tmp_path):
+    def conditional(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<rss/>", headers={"ETag": '"v1"'})
+
+    respx.get(URL).mock(side_effect=conditional)
+    store = CassetteStore(tmp_path)
+    async with httpx.AsyncClient(
+        transport=RecordingTransport(store, httpx.AsyncHTTPTransport())
+    ) as client:
+        await client.get(URL)
+        again = await client.get(URL, headers={"If-None-Match": '"v1"'})
+
+    assert again.status_code == 200
+    record = store.load("GET", httpx.URL(URL))
+    assert record["status"] == 200 and record["body"]
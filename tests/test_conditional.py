@@ -0,0 +1,55 @@
+import httpx
+import pytest
+import respx
+
+from football_news.config import Feed
+from football_news.fetchers.rss_fetcher import fetch_feed
+from football_news.storage.db import SessionLocal
+from football_news.storage.ingest import ingest
+from football_news.storage.models import HttpValidator
+
+FEED_URL = "https://example.com/rss.xml"
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>Arsenal win</title><link>https://example.com/a</link>
+<pubDate>Sun, 06 Jul 2025 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_etag_round_trip_skips_unchanged_feed():
+    route = respx.get(FEED_URL).mock(
+        side_effect=[
+            httpx.Response(200, content=RSS, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+    feed = Feed(name="example", url=FEED_URL)
+
+    assert await fetch_feed(feed) == 1
+    assert await fetch_feed(feed) == 0
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_identical_body_without_validators_is_skipped():
+    respx.get(FEED_URL).respond(200, content=RSS)
+    feed = Feed(name="example", url=FEED_URL)
+
+    assert await fetch_feed(feed) == 1
+    assert await fetch_feed(feed) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_validator_commits_with_the_rows():
+    respx.get(FEED_URL).respond(200, content=RSS, headers={"ETag": '"v1"'})
+    before = ingest.transactions
+
+    assert await fetch_feed(Feed(name="example", url=FEED_URL)) == 1
+
+    assert ingest.transactions == before + 1  # no write outside the writer
+    with SessionLocal() as s:
+        assert s.get(HttpValidator, FEED_URL).etag == '"v1"'
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from football_news.storage import db
+
+
+@pytest.mark.asyncio
+async def test_profile_pragmas_and_read_only_engine():
+    async with db.async_engine.connect() as conn:
+        mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        sync = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+    assert (mode, sync) == ("wal", 1)  # NORMAL
+
+    async with db.read_engine.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM stories"))).scalar() == 0
+        with pytest.raises(OperationalError, match="readonly"):
+            await conn.execute(text("DELETE FROM stories"))
+
+    busy, _, _ = await db.checkpoint("PASSIVE")
+    assert busy == 0
+
+
+def test_env_overrides_profile(monkeypatch):
+    monkeypatch.setenv("SQLITE_MMAP_SIZE", "0")
+    assert db.pragmas("wal")["mmap_size"] == "0"
+    assert db.pragmas("legacy")["journal_mode"] == "DELETE"
+    with pytest.raises(ValueError):
+        db.pragmas("nope")
@@ -0,0 +1,99 @@
+import csv
+import datetime as dt
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from football_news.api import export
+from football_news.api.main import app
+from football_news.storage import archive
+from football_news.storage.db import SessionLocal
+from football_news.storage.models import Story, StoryTag
+
+client = TestClient(app)
+START = dt.datetime(2025, 7, 1, tzinfo=dt.timezone.utc)
+
+
+def _seed(n: int):
+    rows = [
+        dict(
+            id=f"s{i:04d}",
+            title=f"Story, {i}",
+            link=f"https://example.com/{i}",
+            source="bbc" if i % 2 else "guardian",
+            published=START + dt.timedelta(minutes=i),
+            tags=["arsenal"] if i % 3 == 0 else [],
+        )
+        for i in range(n)
+    ]
+    with SessionLocal() as s:
+        s.execute(insert(Story), rows)
+        tags = [
+            dict(
+                tag="arsenal",
+                story_id=r["id"],
+                published=r["published"],
+                source=r["source"],
+            )
+            for r in rows
+            if r["tags"]
+        ]
+        s.execute(insert(StoryTag), tags)
+        s.commit()
+
+
+def test_ndjson_streams_everything_in_chunks(monkeypatch):
+    monkeypatch.setattr(export, "CHUNK", 7)
+    _seed(50)
+    r = client.get("/v1/export", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in r.headers
+    ids = [json.loads(line)["id"] for line in r.text.splitlines()]
+    assert ids == [f"s{i:04d}" for i in reversed(range(50))]
+
+    r = client.get("/v1/export?tag=arsenal&source=bbc")
+    assert [json.loads(x)["id"] for x in r.text.splitlines()] == [
+        f"s{i:04d}" for i in reversed(range(50)) if i % 6 == 3
+    ]
+
+
+def test_csv_with_gzip():
+    _seed(5)
+    r = client.get(
+        "/v1/export?format=csv&since=2025-07-01T00:02:00Z",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert r.headers["content-encoding"] == "gzip"  # httpx decoded it for us
+    rows = list(csv.reader(io.StringIO(r.text)))
+    assert rows[0] == ["id", "title", "link", "source", "published", "summary", "tags"]
+    assert [row[0] for row in rows[1:]] == ["s0004", "s0003", "s0002"]
+    assert rows[1][1] == "Story, 4"
+    assert rows[2][6] == "arsenal"
+
+
+def test_archived_rows_follow_the_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", str(tmp_path))
+    _seed(4)
+    archive.archive(START + dt.timedelta(minutes=2), vacuum=False)
+    lines = client.get("/v1/export?archived=true").text.splitlines()
+    assert [json.loads(x)["id"] for x in lines] == ["s0003", "s0002", "s0001", "s0000"]
+    assert len(client.get("/v1/export").text.splitlines()) == 2
+
+
+def test_published_has_one_format_across_tiers(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", str(tmp_path))
+    _seed(4)
+    archive.archive(START + dt.timedelta(minutes=2), vacuum=False)
+
+    lines = client.get("/v1/export?archived=true").text.splitlines()
+    stamps = [json.loads(x)["published"] for x in lines]
+    assert stamps[0] == "2025-07-01T00:03:00+00:00"  # database
+    assert stamps[-1] == "2025-07-01T00:00:00+00:00"  # archive
+    rows = list(
+        csv.reader(io.StringIO(client.get("/v1/export?archived=true&format=csv").text))
+    )
+    assert [r[4] for r in rows[1:]] == stamps
+    assert client.get("/v1/archive").json()[0]["published"] == stamps[2]
@@ -33,3 +33,29 @@ async def test_guardian(monkeypatch, caplog):
         print(f"Log: {record.levelname} - {record.message}")
 
     assert n == len(fixture_json["response"]["results"])
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_guardian_incremental_watermark(monkeypatch):
+    monkeypatch.setenv("GUARDIAN_KEY", "dummy")
+    cfg = {
+        "name": "guardian",
+        "endpoint": "https://content.guardianapis.com/search?section=football&api-key=${GUARDIAN_KEY}",
+        "quota_day": 500,
+        "quota_sec": 100,
+    }
+    route = respx.get(
+        url__regex=r"https://content\.guardianapis\.com/search.*"
+    ).respond(200, json=fixture_json)
+
+    first = await GuardianFetcher(cfg).fetch()
+    assert first == len(fixture_json["response"]["results"])
+    # page 2 repeats page 1's IDs, so paging stops there
+    assert route.call_count == 2
+    assert "from-date" not in route.calls[0].request.url.params
+
+    second = await GuardianFetcher(cfg).fetch()
+    assert second == 0
+    assert route.call_count == 3  # stopped on the first known ID
+    assert route.calls[2].request.url.params["from-date"] == "2025-07-06"
@@ -0,0 +1,128 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from football_news.fetchers.base import BaseFetcher
+from football_news.fetchers.health import (
+    BREAKER_FAILURES,
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    Throttled,
+    hedge,
+    retry_after,
+)
+from football_news.fetchers.rss_fetcher import RssFetcher
+from football_news.orchestrator import Orchestrator
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_probes_and_backs_off():
+    clock = Clock()
+    b = CircuitBreaker(failures=2, reset=10, max_reset=30, clock=clock)
+
+    b.record_failure()
+    assert b.state == CLOSED and b.allow()
+    b.record_failure()
+    assert b.state == OPEN and not b.allow()
+
+    clock.now = 10
+    assert b.allow() and b.state == HALF_OPEN
+    assert not b.allow()  # only one probe at a time
+    b.record_failure()
+    assert b.state == OPEN and b.retry_in == 20  # doubled
+
+    clock.now = 30
+    assert b.allow()
+    b.record_success()
+    assert b.state == CLOSED and b.failures == 0 and b.reset_timeout == 10
+
+
+def test_retry_after_opens_for_at_least_that_long():
+    clock = Clock()
+    b = CircuitBreaker(failures=5, reset=10, clock=clock)
+    b.record_failure(retry_after=120)
+    assert b.state == OPEN and b.retry_in == 120
+
+
+def test_retry_after_header_forms():
+    assert retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+    date = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after(date) == 0
+    assert retry_after(httpx.Response(429)) is None
+
+
+@pytest.mark.asyncio
+async def test_hedge_prefers_fast_mirror_and_cancels_primary():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        finally:
+            cancelled.set()
+
+    async def fast():
+        return "mirror"
+
+    assert await hedge([slow, fast], delay=0.01) == "mirror"
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_hedge_moves_on_after_failure():
+    async def broken():
+        raise httpx.ConnectError("down")
+
+    async def ok():
+        return "ok"
+
+    assert await hedge([broken, ok], delay=10) == "ok"
+    with pytest.raises(httpx.ConnectError):
+        await hedge([broken], delay=10)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_honours_retry_after():
+    route = respx.get("https://example.com/feed")
+    route.side_effect = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, text="ok"),
+    ]
+    fetcher = BaseFetcher({"name": "x", "url": "https://example.com/feed"})
+    assert (await fetcher._get("https://example.com/feed")).text == "ok"
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_gives_up_on_long_retry_after():
+    respx.get("https://example.com/feed").respond(429, headers={"Retry-After": "3600"})
+    fetcher = BaseFetcher({"name": "x", "url": "https://example.com/feed"})
+    with pytest.raises(Throttled):
+        await fetcher._get("https://example.com/feed")
+    assert fetcher.stats.retry_after == 3600
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_error_status_is_a_failure_and_opens_the_breaker():
+    route = respx.get("https://example.com/feed").respond(500, text="<html>oops")
+    fetcher = RssFetcher({"name": "dead", "url": "https://example.com/feed"})
+    orchestrator = Orchestrator([fetcher])
+
+    reports = [await orchestrator.run_source(fetcher) for _ in range(5)]
+
+    assert "500" in reports[0].error and reports[0].parsed == 0
+    assert reports[-1].circuit == OPEN
+    assert route.call_count == BREAKER_FAILURES  # then it stopped asking
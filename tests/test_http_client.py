@@ -0,0 +1,64 @@
+import gzip
+
+import pytest
+import respx
+
+from football_news.fetchers.http_client import HttpClientManager, ResponseTooLarge
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_is_reused_within_loop():
+    respx.get("https://example.com/feed").respond(200, text="<rss/>")
+    manager = HttpClientManager()
+    try:
+        first = manager.client()
+        r = await manager.get("https://example.com/feed")
+        assert r.text == "<rss/>"
+        assert manager.client() is first
+    finally:
+        await manager.aclose()
+    assert manager._client is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_oversized_body_is_rejected():
+    respx.get("https://example.com/big").respond(200, content=b"x" * 2048)
+    manager = HttpClientManager(max_bytes=1024)
+    try:
+        with pytest.raises(ResponseTooLarge):
+            await manager.get("https://example.com/big")
+    finally:
+        await manager.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_redirects_are_followed():
+    respx.get("https://example.com/old").respond(
+        301, headers={"Location": "https://example.com/new"}
+    )
+    respx.get("https://example.com/new").respond(200, text="<rss/>")
+    manager = HttpClientManager()
+    try:
+        r = await manager.get("https://example.com/old")
+    finally:
+        await manager.aclose()
+    assert r.status_code == 200 and r.text == "<rss/>"
+    assert str(r.url) == "https://example.com/new"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_compressed_body_is_returned_decoded():
+    body = gzip.compress(b"<rss/>")
+    respx.get("https://example.com/gz").respond(
+        200, content=body, headers={"Content-Encoding": "gzip"}
+    )
+    manager = HttpClientManager()
+    try:
+        r = await manager.get("https://example.com/gz")
+    finally:
+        await manager.aclose()
+    assert r.content == b"<rss/>"
@@ -0,0 +1,75 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from football_news.storage import ingest
+from football_news.storage.ingest import IngestQueue
+from football_news.storage.stories import story_id
+from football_news.storage.watermarks import get_watermark
+
+
+def _rows(prefix: str, n: int) -> list[dict]:
+    return [
+        dict(
+            id=story_id(f"https://example.com/{prefix}/{i}"),
+            title=f"{prefix} {i}",
+            link=f"https://example.com/{prefix}/{i}",
+            source=prefix,
+            published=dt.datetime(2025, 7, 6, 10, i, tzinfo=dt.timezone.utc),
+            raw=None,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_one_transaction():
+    q = IngestQueue(max_batch=1000, flush_ms=50)
+    a, b = _rows("a", 5), _rows("b", 3)
+
+    counts = await asyncio.gather(q.submit(a), q.submit(b), q.submit(a[:2]))
+
+    assert counts == [5, 3, 0]  # the repeat of a[:2] was not new
+    assert q.transactions == 1 and q.rows_written == 8
+    assert await q.submit(b + _rows("c", 1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_watermark_advances_with_the_rows():
+    q = IngestQueue(flush_ms=1)
+    rows = _rows("guardian", 4)
+    assert await q.submit(rows, watermark="guardian") == 4
+    wm = await get_watermark("guardian")
+    assert wm.last_id == rows[-1]["id"]
+
+
+@pytest.mark.asyncio
+async def test_bad_submission_does_not_sink_the_batch():
+    q = IngestQueue(flush_ms=50)
+    bad = _rows("bad", 1)
+    bad[0]["title"] = None  # NOT NULL
+
+    good, failed = await asyncio.gather(
+        q.submit(_rows("good", 2)), q.submit(bad), return_exceptions=True
+    )
+    assert good == 2
+    assert isinstance(failed, Exception)
+    await q.close()
+    assert q._writer is None
+
+
+@pytest.mark.asyncio
+async def test_failing_publish_does_not_rewrite_the_batch(monkeypatch):
+    async def broken(kind, stories):
+        raise RuntimeError("relay down")
+
+    monkeypatch.setattr(ingest.hub, "publish", broken)
+    q = IngestQueue(flush_ms=50)
+
+    counts = await asyncio.gather(q.submit(_rows("p", 2)), q.submit(_rows("q", 3)))
+
+    assert counts == [2, 3]
+    assert q.transactions == 1 and q.rows_written == 5
+    await q.close()
+    assert not q._publishing
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from football_news.fetchers.base import BaseFetcher
+from football_news.orchestrator import Orchestrator
+
+
+class FakeFetcher(BaseFetcher):
+    kind = "fake"
+    active: dict = {}
+    peak: dict = {}
+
+    async def fetch(self) -> int:
+        for key in ("all", self.host):
+            FakeFetcher.active[key] = FakeFetcher.active.get(key, 0) + 1
+            FakeFetcher.peak[key] = max(
+                FakeFetcher.peak.get(key, 0), FakeFetcher.active[key]
+            )
+        await asyncio.sleep(0.01)
+        for key in ("all", self.host):
+            FakeFetcher.active[key] -= 1
+        if self.cfg.get("fail"):
+            raise RuntimeError("boom")
+        self.stats.parsed = self.stats.inserted = 3
+        return 3
+
+
+@pytest.mark.asyncio
+async def test_limits_and_report():
+    FakeFetcher.active, FakeFetcher.peak = {}, {}
+    fetchers = [
+        FakeFetcher({"name": f"a{i}", "url": "https://a.example/rss"}) for i in range(6)
+    ] + [
+        FakeFetcher({"name": f"b{i}", "url": f"https://b{i}.example/rss"})
+        for i in range(6)
+    ]
+    fetchers.append(
+        FakeFetcher({"name": "bad", "url": "https://c.example/", "fail": True})
+    )
+
+    reports = await Orchestrator(fetchers, max_concurrency=4, max_per_host=2).run_once()
+
+    assert FakeFetcher.peak["all"] <= 4
+    assert FakeFetcher.peak["a.example"] <= 2
+    by_name = {r.source: r for r in reports}
+    assert len(by_name) == 13
+    assert by_name["a0"].inserted == 3 and by_name["a0"].error is None
+    assert by_name["bad"].error == "boom"
+    assert by_name["bad"].latency > 0
+
+
+class SlowFetcher(BaseFetcher):
+    kind = "fake"
+
+    async def fetch(self) -> int:
+        await asyncio.sleep(self.cfg.get("delay", 0))
+        self.stats.inserted = 1
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_slow_sources():
+    fetchers = [
+        SlowFetcher({"name": "fast", "url": "https://a.example/"}),
+        SlowFetcher({"name": "slow", "url": "https://b.example/", "delay": 5}),
+    ]
+    reports = await Orchestrator(fetchers, deadline=0.1).run_once()
+    by_name = {r.source: r for r in reports}
+    assert by_name["fast"].inserted == 1 and by_name["fast"].error is None
+    assert by_name["slow"].error == "deadline exceeded"
+    assert by_name["slow"].latency < 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_source():
+    bad = FakeFetcher({"name": "flaky", "url": "https://c.example/", "fail": True})
+    orch = Orchestrator([bad])
+    states = [(await orch.run_source(bad)).circuit for _ in range(3)]
+    assert states == ["closed", "closed", "open"]
+
+    report = await orch.run_source(bad)
+    assert report.circuit == "open"
+    assert report.error.startswith("circuit open")
+    assert report.latency == 0
@@ -0,0 +1,31 @@
+import pytest
+
+from football_news.fetchers import parsing
+from football_news.storage.stories import story_id
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>Arsenal win</title><link>https://example.com/a</link>
+<description>Match report</description>
+<pubDate>Sun, 06 Jul 2025 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_parse_feed_in_pool_returns_compact_rows():
+    try:
+        rows = await parsing.run_parse(parsing.parse_feed, RSS, "example")
+    finally:
+        parsing.shutdown_executor()
+
+    assert rows == [
+        dict(
+            id=story_id("https://example.com/a"),
+            title="Arsenal win",
+            link="https://example.com/a",
+            source="example",
+            published=rows[0]["published"],
+            raw="Match report",
+        )
+    ]
+    assert rows[0]["published"].isoformat() == "2025-07-06T10:00:00+00:00"
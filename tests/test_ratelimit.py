@@ -0,0 +1,117 @@
+import time
+
+import fakeredis.aioredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from football_news.middlewares.ratelimit import LocalGCRA, QuotaExceeded, RateLimiter
+
+
+@pytest.fixture
+def fake_redis():
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_gcra_returns_exact_wait_and_rejections_are_free(fake_redis):
+    rl = RateLimiter(client=fake_redis)
+
+    assert await rl._take("src", quota_sec=2, quota_day=100) == (1, 0)
+    assert await rl._take("src", quota_sec=2, quota_day=100) == (1, 0)
+    granted, wait = await rl._take("src", quota_sec=2, quota_day=100)
+    assert granted == 0 and 0 < wait <= 0.5
+
+    for _ in range(5):  # rejected attempts do not eat the day quota
+        await rl._take("src", quota_sec=2, quota_day=100)
+    day_key = [k for k in await fake_redis.keys("rl:src:day:*")][0]
+    assert await fake_redis.get(day_key) == "2"
+
+
+@pytest.mark.asyncio
+async def test_acquire_sleeps_exactly_until_next_slot(fake_redis):
+    rl = RateLimiter(client=fake_redis)
+    await rl.acquire("src", quota_sec=5, quota_day=100)
+    start = time.monotonic()
+    for _ in range(5):
+        await rl.acquire("src", quota_sec=5, quota_day=100)
+    assert 0.1 < time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_day_quota_raises_instead_of_waiting_hours(fake_redis):
+    rl = RateLimiter(client=fake_redis)
+    await rl.acquire("src", quota_sec=10, quota_day=1)
+    with pytest.raises(QuotaExceeded):
+        await rl.acquire("src", quota_sec=10, quota_day=1)
+
+
+class DownRedis:
+    def register_script(self, script):
+        async def call(**kwargs):
+            raise RedisConnectionError("down")
+
+        return call
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_in_process_limits():
+    rl = RateLimiter(client=DownRedis())
+    assert (await rl._take("src", quota_sec=1, quota_day=100))[0] == 1
+    granted, wait = await rl._take("src", quota_sec=1, quota_day=100)
+    assert granted == 0 and 0 < wait <= 1
+
+
+@pytest.mark.asyncio
+async def test_lease_spends_locally_and_returns_unused_tokens(fake_redis):
+    a, b = RateLimiter(client=fake_redis), RateLimiter(client=fake_redis)
+
+    await a.acquire("src", quota_sec=5, quota_day=100, lease_size=5)
+    assert a.leases["src"].tokens == 4
+    for _ in range(3):  # served from the lease, no Redis round trip
+        await a.acquire("src", quota_sec=5, quota_day=100, lease_size=5)
+    day_key = (await fake_redis.keys("rl:src:day:*"))[0]
+    assert await fake_redis.get(day_key) == "5"
+
+    # the other replica sees the whole burst as taken
+    assert (await b._take("src", quota_sec=5, quota_day=100))[0] == 0
+
+    assert await a.release() == 1
+    assert await fake_redis.get(day_key) == "4"
+    assert (await b._take("src", quota_sec=5, quota_day=100))[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_lease_never_exceeds_day_quota(fake_redis):
+    rl = RateLimiter(client=fake_redis)
+    await rl.acquire("src", quota_sec=10, quota_day=3, lease_size=10)
+    assert rl.leases["src"].tokens == 2
+    await rl.acquire("src", quota_sec=10, quota_day=3, lease_size=10)
+    await rl.acquire("src", quota_sec=10, quota_day=3, lease_size=10)
+    with pytest.raises(QuotaExceeded):
+        await rl.acquire("src", quota_sec=10, quota_day=3, lease_size=10)
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_gives_its_tokens_back(fake_redis):
+    rl = RateLimiter(client=fake_redis)
+    for _ in range(3):  # one request per cycle, minutes apart
+        await rl.acquire("src", quota_sec=2, quota_day=100, lease_size=2)
+        rl.leases["src"].expires = 0
+        await fake_redis.delete("rl:src:tat")  # the burst has refilled
+    day_key = (await fake_redis.keys("rl:src:day:*"))[0]
+    assert await fake_redis.get(day_key) == "4"  # 3 spent + the current lease
+
+    assert await rl.release() == 1
+    assert await fake_redis.get(day_key) == "3"
+
+
+@pytest.mark.asyncio
+async def test_quota_below_one_per_second_still_grants(fake_redis):
+    rl = RateLimiter(client=fake_redis)
+    assert await rl._take("src", quota_sec=0.5, quota_day=100) == (1, 0)
+    granted, wait = await rl._take("src", quota_sec=0.5, quota_day=100)
+    assert granted == 0 and 1.9 < wait <= 2
+
+    local = LocalGCRA(clock=lambda: 1000.0)
+    assert local.take("src", 0.5, 100) == (1, 0.0)
+    assert local.take("src", 0.5, 100) == (0, 2.0)
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from football_news.scheduler import MAX_FACTOR, MIN_FACTOR, AdaptiveScheduler, Job
+
+
+async def _noop():
+    return 0
+
+
+def test_interval_adapts_within_bounds():
+    job = Job("feed", ttl=60, run=_noop)
+    sched = AdaptiveScheduler([job], jitter=0)
+
+    for _ in range(20):
+        sched.reschedule(job, new_stories=3)
+    assert job.interval == pytest.approx(60 * MIN_FACTOR)
+
+    for _ in range(20):
+        sched.reschedule(job, new_stories=0)
+    assert job.interval == pytest.approx(60 * MAX_FACTOR)
+
+
+@pytest.mark.asyncio
+async def test_source_never_overlaps_itself():
+    active = 0
+    peak = 0
+    runs = 0
+
+    async def slow_fetch():
+        nonlocal active, peak, runs
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)  # longer than the TTL
+        active -= 1
+        runs += 1
+        return 1
+
+    sched = AdaptiveScheduler([Job("slow", ttl=0.01, run=slow_fetch)], start_spread=0)
+    loop_task = asyncio.create_task(sched.run_forever())
+    await asyncio.sleep(0.3)
+    await sched.stop()
+    await loop_task
+
+    assert runs >= 2
+    assert peak == 1
@@ -0,0 +1,94 @@
+import datetime as dt
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from football_news.api.main import app
+from football_news.storage.db import AsyncSessionLocal, SessionLocal
+from football_news.storage.models import Story
+from football_news.storage.search import fts_query, search
+
+client = TestClient(app)
+
+
+def _add(*stories):
+    s = SessionLocal()
+    try:
+        for sid, title, summary, age_days in stories:
+            s.add(
+                Story(
+                    id=sid,
+                    title=title,
+                    link=f"https://example.com/{sid}",
+                    source="bbc",
+                    published=dt.datetime.now(dt.timezone.utc)
+                    - dt.timedelta(days=age_days),
+                    summary=summary,
+                )
+            )
+        s.commit()
+    finally:
+        s.close()
+
+
+def test_fts_query_quotes_words():
+    assert fts_query('Saka "injury" OR-update') == '"Saka" "injury" "OR" "update"'
+    assert fts_query("arsen*") == '"arsen"*'
+    assert fts_query("  ?! ") == ""
+
+
+def test_search_ranks_relevance_and_recency():
+    _add(
+        ("a", "Saka injury update", "Saka out for weeks with an injury", 1),
+        ("b", "Arsenal news", "Saka trains again after injury", 1),
+        ("c", "Saka injury update", "Saka out for weeks with an injury", 60),
+        ("d", "Chelsea sign striker", "No injuries reported", 0),
+    )
+    r = client.get("/v1/news?q=saka injury")
+    assert r.status_code == 200, r.text
+    body = r.json()
+    # title hits outrank summary hits, and fresh outranks old
+    assert [s["id"] for s in body] == ["a", "b", "c"]
+    assert "<mark>Saka</mark>" in body[0]["snippet"]
+    assert [s["id"] for s in client.get("/v1/news?q=injur*").json()][0] == "a"
+
+
+@pytest.mark.asyncio
+async def test_index_follows_summary_updates():
+    _add(("a", "Transfer round-up", None, 0))
+    async with AsyncSessionLocal() as s:
+        assert await search(s, "Rice") == []
+        await s.execute(
+            update(Story).where(Story.id == "a").values(summary="Rice joins Arsenal")
+        )
+        await s.commit()
+        hits = await search(s, "rice")
+    assert [(story.id, snippet) for story, snippet in hits] == [
+        ("a", "<mark>Rice</mark> joins Arsenal")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_filters_apply_before_the_candidate_cap():
+    _add(("bbc", "Arsenal win", "Arsenal beat Spurs", 5))
+    s = SessionLocal()
+    now = dt.datetime.now(dt.timezone.utc)
+    s.add_all(
+        Story(
+            id=f"sky{i}",
+            title="Arsenal latest",
+            link=f"https://example.com/sky{i}",
+            source="sky",
+            published=now - dt.timedelta(hours=i),
+        )
+        for i in range(20)
+    )
+    s.commit()
+    s.close()
+
+    async with AsyncSessionLocal() as session:
+        hits = await search(
+            session, "arsenal", filters=[Story.source == "bbc"], candidates=10
+        )
+    assert [story.id for story, _ in hits] == ["bbc"]
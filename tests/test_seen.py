@@ -0,0 +1,97 @@
+import datetime as dt
+
+import pytest
+import respx
+
+from football_news.config import Feed
+from football_news.fetchers.rss_fetcher import fetch_feed
+from football_news.storage.db import AsyncSessionLocal
+from football_news.storage.seen import BloomFilter, SeenIndex, seen_ids
+from football_news.storage.stories import insert_stories, story_id
+
+
+def test_bloom_false_positive_rate_is_bounded():
+    bloom = BloomFilter(capacity=5000, fp_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"known-{i}")
+    assert all(f"known-{i}" in bloom for i in range(5000))
+    false_hits = sum(f"other-{i}" in bloom for i in range(5000))
+    assert false_hits / 5000 < 0.03
+
+
+@pytest.mark.asyncio
+async def test_index_warms_from_db_and_tracks_hit_rate():
+    link = "https://example.com/already-stored"
+    async with AsyncSessionLocal() as s:
+        await insert_stories(
+            s,
+            [
+                dict(
+                    id=story_id(link),
+                    title="stored",
+                    link=link,
+                    source="test",
+                    published=dt.datetime(2025, 7, 6, tzinfo=dt.timezone.utc),
+                )
+            ],
+        )
+        await s.commit()
+
+    index = SeenIndex(capacity=100, fp_rate=0.001)
+    await index.ensure_warm()
+    assert index.seen(story_id(link))
+    assert not index.seen(story_id("https://example.com/new"))
+    assert index.hit_rate == 0.5
+
+
+def test_generations_rotate_when_full():
+    index = SeenIndex(capacity=10, fp_rate=0.001)
+    index._warm = True
+    index.add(f"a{i}" for i in range(10))
+    index.add(f"b{i}" for i in range(10))
+    assert index.seen("a0") and index.seen("b9")
+    index.add(["c0"])  # rotates: the "a" generation is dropped
+    assert not index.seen("a0")
+
+
+@pytest.mark.asyncio
+async def test_filter_hits_are_confirmed_against_the_db():
+    link = "https://example.com/stored"
+    async with AsyncSessionLocal() as s:
+        await insert_stories(
+            s,
+            [
+                dict(
+                    id=story_id(link),
+                    title="stored",
+                    link=link,
+                    source="test",
+                    published=dt.datetime(2025, 7, 6, tzinfo=dt.timezone.utc),
+                )
+            ],
+        )
+        await s.commit()
+    index = SeenIndex(capacity=100, fp_rate=0.001)
+    index._warm = True
+    index.add([story_id(link), "lost-in-a-collision"])  # stands in for a false hit
+
+    assert await index.known([story_id(link), "lost-in-a-collision", "new"]) == {
+        story_id(link)
+    }
+    assert index.false_positives == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_false_positive_does_not_drop_a_new_story():
+    url = "https://example.com/rss.xml"
+    respx.get(url).respond(
+        200,
+        content=b"""<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><title>Arsenal win</title><link>https://example.com/a</link></item>
+</channel></rss>""",
+    )
+    await seen_ids.ensure_warm()
+    seen_ids.add([story_id("https://example.com/a")])
+
+    assert await fetch_feed(Feed(name="example", url=url)) == 1
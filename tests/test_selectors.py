@@ -0,0 +1,42 @@
+from football_news.fetchers.parsing import parse_html_list
+from football_news.fetchers.selectors import compile_source, engine_for
+
+PAGE = b"""<html><body>
+<article class="story"><a href="/news/1"><h3 class="story-title"> First </h3></a>
+  <time datetime="2025-07-06T10:00:00Z">6 Jul</time></article>
+<article class="story"><a href="https://other.example/2"><h3 class="story-title">Second</h3></a>
+  <span class="time-date">03 Jul 2025</span></article>
+<article class="story"><h3 class="story-title">No link</h3></article>
+</body></html>"""
+
+CFG = {
+    "name": "site",
+    "url": "https://example.com/news/",
+    "list_selector": "article.story",
+    "link_selector": "a::attr(href)",
+    "title_selector": "h3.story-title::text",
+    "date_selector": "time::attr(datetime)",
+}
+
+
+def test_engine_supports_attr_and_text_pseudo_selectors():
+    entries = list(engine_for(CFG).extract(PAGE))
+    assert entries[0] == ("/news/1", "First", "2025-07-06T10:00:00Z")
+    assert entries[1].link == "https://other.example/2"
+    assert entries[1].date is None
+    assert entries[2].link is None
+
+
+def test_engine_is_compiled_once_per_source():
+    assert engine_for(CFG) is engine_for(dict(CFG))
+    assert compile_source.cache_info().hits >= 1
+
+
+def test_parse_html_list_date_fallbacks():
+    cfg = dict(CFG, date_selector="span.time-date")
+    rows = parse_html_list(PAGE, cfg)
+    assert [r["link"] for r in rows] == [
+        "https://example.com/news/1",
+        "https://other.example/2",
+    ]
+    assert rows[1]["published"].date().isoformat() == "2025-07-03"